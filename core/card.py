@@ -1,6 +1,12 @@
 """ 덱의 카드를 표현하는 객체를 구현한 스크립트. """
+from typing import Optional, TYPE_CHECKING
+
 from core.effect import Effect, EffectHolder
-from core.obj_data_formats import CardData, CardSaveData
+from core.obj_data_formats import CardData, CardDrawData, CardSaveData
+from core.state_hash import StateHasher, card_key
+
+if TYPE_CHECKING:
+    from core.purchasable_index import PurchasableIndex
 
 
 class Card(EffectHolder):
@@ -18,6 +24,8 @@ class Card(EffectHolder):
         self.__modified_cost = data.cost
         self.__instant_cost_modifier = 0
         self.__is_front_face = False
+        self.__hasher: Optional[StateHasher] = None
+        self.__purchasable: Optional["PurchasableIndex"] = None
         super().__init__([Effect(self, effect_data) for effect_data in data.effects])
 
     def __repr__(self) -> str:
@@ -35,7 +43,12 @@ class Card(EffectHolder):
 
     @current_index.setter
     def current_index(self, value: int):
-        self.__current_index = value
+        if value != self.__current_index:
+            key = self.hash_key()
+            self.__current_index = value
+            self._rehash(key)
+            if self.__purchasable is not None:
+                self.__purchasable.touch(self)
     
     @property
     def previous_index(self):
@@ -44,7 +57,7 @@ class Card(EffectHolder):
     
     @previous_index.setter
     def previous_index(self, value: int):
-        self.__current_index = value
+        self.__previous_index = value
 
     @property
     def modified_cost(self):
@@ -53,7 +66,13 @@ class Card(EffectHolder):
 
     @modified_cost.setter
     def modified_cost(self, cost: int):
-        self.__modified_cost = cost
+        if cost != self.__modified_cost:
+            key = self.hash_key()
+            previous: int = self.__modified_cost
+            self.__modified_cost = cost
+            self._rehash(key)
+            if self.__purchasable is not None:
+                self.__purchasable.update(self, previous, self.__is_front_face)
 
     @property
     def instant_cost_modifier(self):
@@ -62,7 +81,10 @@ class Card(EffectHolder):
     
     @instant_cost_modifier.setter
     def instant_cost_modifier(self, value: int):
-        self.__instant_cost_modifier = value
+        if value != self.__instant_cost_modifier:
+            key = self.hash_key()
+            self.__instant_cost_modifier = value
+            self._rehash(key)
 
     @property
     def is_front_face(self):
@@ -71,7 +93,39 @@ class Card(EffectHolder):
     
     @is_front_face.setter
     def is_front_face(self, front: bool):
-        self.__is_front_face = front
+        if front != self.__is_front_face:
+            key = self.hash_key()
+            self.__is_front_face = front
+            self._rehash(key)
+            if self.__purchasable is not None:
+                self.__purchasable.update(self, self.__modified_cost, not front)
+
+    def hash_key(self) -> int:
+        """ 현재 위치와 상태에 대한 이 카드의 지문 키. """
+        return card_key(self.__current_index, self.__card_data.id, self.__is_front_face, self.__modified_cost, self.__instant_cost_modifier)
+
+    def attach(self, hasher: Optional[StateHasher], purchasable: Optional["PurchasableIndex"] = None) -> "Card":
+        """ 덱에 들어갈 때 호출. 이후 상태가 바뀔 때마다 지문과 구매 가능 색인을 갱신함. chaining을 위해 자기 자신 반환. """
+        self.__hasher = hasher
+        self.__purchasable = purchasable
+        if hasher is not None:
+            hasher.add(self.hash_key())
+        if purchasable is not None:
+            purchasable.add(self)
+        return self
+
+    def detach(self) -> None:
+        """ 덱에서 빠질 때 호출. 지문과 구매 가능 색인에서 이 카드를 제거함. """
+        if self.__hasher is not None:
+            self.__hasher.remove(self.hash_key())
+            self.__hasher = None
+        if self.__purchasable is not None:
+            self.__purchasable.remove(self)
+            self.__purchasable = None
+
+    def _rehash(self, previous_key: int) -> None:
+        if self.__hasher is not None:
+            self.__hasher.replace(previous_key, self.hash_key())
 
     @staticmethod
     def from_save_data(card_data: CardData, data: CardSaveData, index: int = -1) -> "Card":
@@ -82,6 +136,9 @@ class Card(EffectHolder):
 
     def to_save_data(self) -> CardSaveData:
         return CardSaveData(self.card_data.id, self.is_front_face, self.instant_cost_modifier)
+
+    def to_draw_data(self) -> CardDrawData:
+        return CardDrawData(self.id, self.card_data, self.modified_cost, self.is_front_face)
     
     def set_index(self, index: int, init: bool = False):
         """
@@ -90,7 +147,7 @@ class Card(EffectHolder):
         :param init: 참인 경우, '초기화'로 간주하고 현재/이전 위치 모두를 이 값으로 변경함. 거짓인 경우, '이동'으로 간주하고 현재 값만 이 값을 할당, 이전 값은 현재 값의 이전 값이 됨.
         """
         if init:
-            self.__previous_index = self.__current_index = index
+            self.previous_index = self.current_index = index
         else:
-            self.__previous_index = self.__current_index
-            self.__current_index = index
\ No newline at end of file
+            self.previous_index = self.current_index
+            self.current_index = index
\ No newline at end of file
@@ -1,13 +1,15 @@
 """
 게임 내 덱을 관리하는 스크립트.
 """
-from random import shuffle
+from random import Random
 from typing import Any, Dict, List, Callable, Optional, Set, Tuple, TYPE_CHECKING
 
 from core.card import Card
 from core.enums import DrawEventType
 from core.utils import Comparable
-from core.obj_data_formats import CardData, CardDrawData, CardSaveData, DrawEvent
+from core.obj_data_formats import CardData, CardSaveData, DrawEvent
+from core.state_hash import StateHasher
+from core.purchasable_index import PurchasableIndex
 
 if TYPE_CHECKING:
     from core.event_manager import EventManager
@@ -18,9 +20,20 @@ class Deck:
     이 게임에서는 플레이어가 활동하는 전장의 역할도 한다.
     덱에 있는 카드를 관리하고, 효과 스크립트가 조건에 맞게 카드를 조작할 수 있는 메소드를 제공한다.
     """
-    def __init__(self, event_manager: "EventManager", cards: List[Tuple[CardData, CardSaveData]], player_index: int = 0) -> None:
+    def __init__(
+            self, 
+            event_manager: "EventManager", 
+            cards: List[Tuple[CardData, CardSaveData]], 
+            player_index: int = 0, 
+            rng: Optional[Random] = None,
+            hasher: Optional[StateHasher] = None
+            ) -> None:
         self.__event_manager: "EventManager" = event_manager
-        self.__cards = [Card.from_save_data(data, save, index).register_event(event_manager) for index, (data, save) in enumerate(cards)]
+        self.__rng: Random = rng if rng is not None else Random()
+        self.__hasher: Optional[StateHasher] = hasher
+        self.__purchasable: PurchasableIndex = PurchasableIndex()
+        self.__cards = [Card.from_save_data(data, save, index).register_event(event_manager).attach(hasher, self.__purchasable) 
+                        for index, (data, save) in enumerate(cards)]
         self.__player_index: int = player_index
         self.__cost_setters: List[Tuple["DeckQuery", Callable[[Card], int]]] = []
         self.__cost_modifiers: List[Tuple["DeckQuery", Callable[[Card], int]]] = []
@@ -35,6 +48,11 @@ class Deck:
         """
         return self.__player_index
 
+    @property
+    def purchasable(self) -> PurchasableIndex:
+        """앞면인 카드를 비용 순으로 정리한 색인."""
+        return self.__purchasable
+
     def update_index(self, init: bool = False) -> None:
         """
         카드에 저장된 인덱스 데이터 갱신. 
@@ -77,6 +95,12 @@ class Deck:
         """조건에 맞는 카드를 순서를 유지해 반환."""
         return list(filter(query, self.__cards)) if query is not None else self.__cards.copy()
     
+    def get_card_at(self, index: int) -> Optional[Card]:
+        """주어진 위치에 있는 카드를 반환한다. 범위를 벗어나면 None 반환."""
+        if not 0 <= index < len(self.__cards):
+            return None
+        return self.__cards[index]
+
     def get_card_by_id(self, id: int) -> Optional[Card]:
         """주어진 id에 해당하는 카드를 찾아 반환한다."""
         cards: List[Card] = [card for card in self.__cards if card.id == id]
@@ -122,14 +146,15 @@ class Deck:
     def shuffle_cards(self, query: "DeckQuery") -> None:
         """조건에 맞는 카드를 서로 섞음."""
         target_ids: Set[int] = query.get_target_from(self.__cards)
-        if len(target_ids) == 0:
+        # 카드가 한 장 이하라면 섞어도 달라지지 않음. (아래 반복문이 끝나지 않는 것 방지)
+        if len(target_ids) < 2:
             return
         mask: List[bool] = [card.id in target_ids for card in self.__cards]
         target: List[Card] = [card for ind, card in enumerate(self.__cards) if mask[ind]]
         shuffled_target: List[Card] = target.copy()
 
         while target == shuffled_target: # 같은 배열로 섞이는 것 방지
-            shuffle(shuffled_target)
+            self.__rng.shuffle(shuffled_target)
         
         result: List[Card] = [
             (shuffled_target.pop(0) if mask[ind] else card) 
@@ -201,20 +226,13 @@ class Deck:
 
         for i, c in enumerate(self.__cards):
             if c.id in target_ids:
-                instance: Card = Card(card(c), i + index_offset).register_event(self.__event_manager)
+                data: CardData = card(c)
                 for _ in range(amount(c)):
+                    # 장마다 별도의 카드 객체를 만들어야 위치, 비용, 앞/뒷면이 따로 관리됨.
+                    instance: Card = Card(data, i + index_offset).register_event(self.__event_manager).attach(self.__hasher, self.__purchasable)
                     cards_copy.insert(i + index_offset, instance)
                     self.__event_manager.on_card_created(instance)
-                    self.__event_manager.push_draw_event((CardDrawData(
-                        c.id,
-                        c.card_data.name,
-                        c.card_data.type,
-                        c.card_data.cost,
-                        c.modified_cost,
-                        c.is_front_face,
-                        c.card_data.sprite_name,
-                        c.card_data.description
-                    ), i + index_offset))
+                    self.__event_manager.push_draw_event((instance.to_draw_data(), i + index_offset))
                     index_offset += 1
                     if i < self.__player_index:
                         self.__player_index += 1
@@ -245,6 +263,7 @@ class Deck:
         for card in self.__cards:
             if card.id in target_ids:
                 card.unregister_event(self.__event_manager)
+                card.detach()
         self.__cards = result
         self.update_index(init=False)
 
@@ -0,0 +1,91 @@
+"""
+DrawEvent를 지켜보며 카드/아이템/능력치가 마지막으로 바뀐 버전을 기록하는 스크립트.
+GameManager.get_delta_since가 이 기록으로 주어진 버전 이후에 바뀐 부분만 골라 냄.
+사라진 카드/아이템의 기록은 최근 REMOVED_HISTORY_SIZE개만 보관하며, 그보다 오래된 버전의 변경은 전체 상태로 대신함.
+"""
+from typing import Dict, Final, List, Tuple
+
+from core.enums import DrawEventType
+from core.obj_data_formats import CardDrawData, DrawEvent, ItemDrawData
+
+
+REMOVED_HISTORY_SIZE: Final[int] = 256
+"""사라진 카드와 아이템의 기록을 각각 보관할 최대 수."""
+
+# 플레이어 능력치/턴/플레이어 위치에 영향을 주는 이벤트.
+_STATS_EVENTS: Tuple[DrawEventType, ...] = (
+    DrawEventType.PlayerStatChanged,
+    DrawEventType.TurnBegin,
+    DrawEventType.TurnEnd,
+    DrawEventType.CardPurchased,
+    DrawEventType.ItemUsed,
+)
+
+
+class DrawStateTracker:
+    """DrawEvent 하나마다 버전을 1씩 올리고, 각 대상이 마지막으로 바뀐 버전을 기록."""
+    def __init__(self) -> None:
+        self.version: int = 0
+        self.card_versions: Dict[int, int] = {}
+        """카드 id -> 카드의 그리기 정보(비용, 앞/뒷면)가 마지막으로 바뀐 버전."""
+        self.removed_cards: Dict[int, int] = {}
+        """덱에서 사라진 카드 id -> 사라진 버전. 사라진 순서로 저장됨."""
+        self.item_versions: Dict[int, int] = {}
+        """아이템 id -> 생성된 버전."""
+        self.removed_items: Dict[int, int] = {}
+        """인벤토리에서 사라진 아이템 id -> 사라진 버전. 사라진 순서로 저장됨."""
+        self.pruned_version: int = 0
+        """버려진 삭제 기록 중 가장 최근의 버전. 이보다 오래된 버전 이후의 삭제는 알 수 없음."""
+        self.order_version: int = 0
+        """덱의 카드 순서가 마지막으로 바뀐 버전."""
+        self.stats_version: int = 0
+        """플레이어 능력치나 턴이 마지막으로 바뀐 버전."""
+
+    def record(self, draw_event: DrawEvent | Tuple[CardDrawData, int] | ItemDrawData) -> None:
+        """EventManager.push_draw_event에서 호출."""
+        self.version += 1
+        version: int = self.version
+        if isinstance(draw_event, tuple):
+            self.card_versions[draw_event[0].id] = version
+            self.order_version = self.stats_version = version
+            return
+        if isinstance(draw_event, ItemDrawData):
+            self.item_versions[draw_event.id] = version
+            return
+        match draw_event.event_type:
+            case DrawEventType.CardShown | DrawEventType.CardCostChanged:
+                self.card_versions[draw_event.target_id] = version
+            case DrawEventType.CardMoved:
+                self.order_version = self.stats_version = version
+            case DrawEventType.CardDestroyed:
+                self.card_versions.pop(draw_event.target_id, None)
+                self._record_removed(self.removed_cards, draw_event.target_id, version)
+                self.order_version = self.stats_version = version
+            case DrawEventType.ItemDestroyed:
+                self.item_versions.pop(draw_event.target_id, None)
+                self._record_removed(self.removed_items, draw_event.target_id, version)
+            case _:
+                pass
+        if draw_event.event_type in _STATS_EVENTS:
+            self.stats_version = version
+
+    def _record_removed(self, removed: Dict[int, int], id: int, version: int) -> None:
+        removed[id] = version
+        if len(removed) > REMOVED_HISTORY_SIZE:
+            oldest: int = next(iter(removed))
+            self.pruned_version = max(self.pruned_version, removed.pop(oldest))
+
+    def has_history_since(self, version: int) -> bool:
+        """주어진 버전 이후의 삭제 기록이 모두 남아 있는지 여부."""
+        return version >= self.pruned_version
+
+    @staticmethod
+    def removed_since(removed: Dict[int, int], version: int) -> List[int]:
+        """removed_cards/removed_items 중 주어진 버전 이후에 사라진 id를 사라진 순서로 반환. 최근 기록부터 거꾸로 찾음."""
+        ids: List[int] = []
+        for id, removed_version in reversed(removed.items()):
+            if removed_version <= version:
+                break
+            ids.append(id)
+        ids.reverse()
+        return ids
@@ -0,0 +1,183 @@
+"""
+DrawEvent를 구독하는 소비자(GUI, 기록기, 통계 수집기 등)에게 이벤트를 밀어 넣어 전달하는 스크립트.
+구독자마다 크기가 제한된 버퍼를 가지며, 버퍼가 넘치면 가장 오래된 이벤트를 버리고 overflowed를 표시함.
+이 경우 소비자는 버퍼를 비우고 GameManager.get_game_draw_state로 상태를 다시 받아야 함.
+이벤트는 행동을 처리하는 스레드(대개 소비자와 같은 스레드)에서 동기적으로 추가되므로, 버퍼가 찼을 때 생산자를 멈추는
+역압(backpressure)은 교착을 일으킴. 따라서 의도적으로 이벤트를 버리고 소비자가 상태를 다시 받는 방식을 사용함.
+구독마다 DrawEventCoalescing을 지정해 같은 종류의 이벤트를 버퍼에 넣을 때 미리 합칠 수 있음.
+"""
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, Dict, Final, Iterator, Optional, Tuple, TYPE_CHECKING
+
+from core.enums import DrawEventCoalescing, DrawEventType
+from core.obj_data_formats import CardDrawData, DrawEvent, DrawEventBatch, ItemDrawData
+
+if TYPE_CHECKING:
+    from core.event_manager import EventManager
+
+
+DRAW_EVENT_BUFFER_SIZE: Final[int] = 1024
+"""구독자 버퍼의 기본 크기."""
+
+# 합칠 수 있는 이벤트 종류. 대상마다 처음의 previous와 마지막 current만 남겨도 의미가 유지됨.
+_COALESCED_TYPES: Final[Tuple[DrawEventType, ...]] = (
+    DrawEventType.CardShown,
+    DrawEventType.CardMoved,
+    DrawEventType.CardDestroyed,
+    DrawEventType.CardCostChanged,
+    DrawEventType.PlayerStatChanged,
+)
+# Compact에서 파괴된 카드의 항목을 버릴 이벤트 종류.
+_CARD_TYPES: Final[Tuple[DrawEventType, ...]] = (
+    DrawEventType.CardShown,
+    DrawEventType.CardMoved,
+    DrawEventType.CardCostChanged,
+)
+
+
+class DrawEventSubscription:
+    """
+    DrawEvent 구독 하나.
+    callback을 주면 이벤트가 발생하는 즉시 호출하고 버퍼에 쌓지 않음.
+    그렇지 않으면 버퍼에 쌓아 두며, 반복(for event in subscription)이나 async for(stream())로 꺼낼 수 있음.
+    coalescing은 버퍼를 사용하는 구독에만 적용됨. (callback에는 이벤트가 하나씩 전달됨.)
+    직접 생성하기보다 EventManager.subscribe_draw_events()를 호출하는 것을 권장.
+    """
+    def __init__(
+            self,
+            event_manager: "EventManager",
+            callback: Optional[Callable[[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData], None]] = None,
+            maxlen: Optional[int] = DRAW_EVENT_BUFFER_SIZE,
+            coalescing: DrawEventCoalescing = DrawEventCoalescing.Off
+        ) -> None:
+        self.__event_manager: Optional["EventManager"] = event_manager
+        self.__callback = callback
+        self.__buffer: Deque[DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData] = deque(maxlen=maxlen)
+        self.__overflowed: bool = False
+        self.__coalescing: DrawEventCoalescing = coalescing
+        self.__compact_batches: Dict[DrawEventType, DrawEventBatch] = {}
+        """Compact에서 종류별로 아직 버퍼에 남아 있는 DrawEventBatch."""
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__waiter: Optional[asyncio.Event] = None
+
+    @property
+    def overflowed(self) -> bool:
+        """버퍼가 넘쳐 이벤트를 잃었는지 여부. 참이라면 clear() 후 상태를 다시 받아야 함."""
+        return self.__overflowed
+
+    @property
+    def closed(self) -> bool:
+        return self.__event_manager is None
+
+    def __len__(self) -> int:
+        return len(self.__buffer)
+
+    def push(self, draw_event: DrawEvent | Tuple[CardDrawData, int] | ItemDrawData) -> None:
+        """EventManager.push_draw_event에서 호출."""
+        if self.__callback is not None:
+            self.__callback(draw_event)
+            return
+        if self.__coalescing != DrawEventCoalescing.Off and isinstance(draw_event, DrawEvent) \
+                and draw_event.event_type in _COALESCED_TYPES:
+            if self._coalesce(draw_event):
+                self._notify()
+                return
+            batch: DrawEventBatch = DrawEventBatch(draw_event.event_type, {draw_event.target_id: draw_event})
+            if self.__coalescing == DrawEventCoalescing.Compact:
+                self.__compact_batches[draw_event.event_type] = batch
+            self._append(batch)
+            return
+        self._append(draw_event)
+
+    def _append(self, draw_event: DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData) -> None:
+        if len(self.__buffer) == self.__buffer.maxlen:
+            self.__overflowed = True
+            # 버려진 묶음에 이어 합치지 않도록 함.
+            self.__compact_batches.clear()
+            if isinstance(draw_event, DrawEventBatch) and self.__coalescing == DrawEventCoalescing.Compact:
+                self.__compact_batches[draw_event.event_type] = draw_event
+        elif not isinstance(draw_event, DrawEventBatch):
+            # 합치지 않는 항목(카드 생성 등) 뒤의 이벤트를 그 앞의 묶음에 합치면 순서가 뒤바뀌므로 새 묶음을 시작함.
+            self.__compact_batches.clear()
+        self.__buffer.append(draw_event)
+        self._notify()
+
+    def _coalesce(self, draw_event: DrawEvent) -> bool:
+        """버퍼에 남은 같은 종류의 묶음에 이벤트를 합침. 합칠 묶음이 없다면 False 반환."""
+        batch: Optional[DrawEventBatch]
+        if self.__coalescing == DrawEventCoalescing.Batch:
+            tail = self.__buffer[-1] if len(self.__buffer) > 0 else None
+            batch = tail if isinstance(tail, DrawEventBatch) and tail.event_type == draw_event.event_type else None
+            if batch is not None:
+                batch.merge(draw_event)
+            return batch is not None
+        if draw_event.event_type == DrawEventType.CardDestroyed:
+            for event_type in _CARD_TYPES:
+                if (card_batch := self.__compact_batches.get(event_type)) is not None:
+                    card_batch.events.pop(draw_event.target_id, None)
+        batch = self.__compact_batches.get(draw_event.event_type)
+        if batch is None:
+            return False
+        merged: DrawEvent = batch.merge(draw_event)
+        if merged.previous == merged.current and draw_event.event_type != DrawEventType.CardDestroyed:
+            del batch.events[merged.target_id]
+        return True
+
+    def _notify(self) -> None:
+        if self.__waiter is not None and self.__loop is not None:
+            self.__loop.call_soon_threadsafe(self.__waiter.set)
+
+    def peek(self) -> Optional[DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData]:
+        """다음 이벤트를 꺼내지 않고 반환. 없다면 None."""
+        return self.__buffer[0] if len(self.__buffer) > 0 else None
+
+    def pop(self) -> DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData:
+        """다음 이벤트를 꺼내 반환. 없다면 IndexError 발생."""
+        return self._take()
+
+    def _take(self) -> DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData:
+        draw_event = self.__buffer.popleft()
+        if isinstance(draw_event, DrawEventBatch) and self.__compact_batches.get(draw_event.event_type) is draw_event:
+            del self.__compact_batches[draw_event.event_type]
+        return draw_event
+
+    def __iter__(self) -> Iterator[DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData]:
+        """버퍼가 빌 때까지 이벤트를 꺼내는 생성자. 반복 도중 추가된 이벤트도 꺼냄."""
+        while len(self.__buffer) > 0:
+            yield self._take()
+
+    async def stream(self) -> AsyncIterator[DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData]:
+        """이벤트가 들어올 때마다 꺼내는 비동기 생성자. 구독을 해제하면 종료됨."""
+        self.__loop = asyncio.get_running_loop()
+        self.__waiter = asyncio.Event()
+        try:
+            while True:
+                for draw_event in self:
+                    yield draw_event
+                if self.closed:
+                    return
+                self.__waiter.clear()
+                await self.__waiter.wait()
+        finally:
+            self.__loop = self.__waiter = None
+
+    def clear(self) -> None:
+        """버퍼를 비우고 overflowed 표시를 해제."""
+        self.__buffer.clear()
+        self.__compact_batches.clear()
+        self.__overflowed = False
+
+    def close(self) -> None:
+        """구독을 해제. 남은 이벤트는 계속 꺼낼 수 있음."""
+        if self.__event_manager is None:
+            return
+        self.__event_manager.unsubscribe_draw_events(self)
+        self.__event_manager = None
+        self._notify()
+
+    def __enter__(self) -> "DrawEventSubscription":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
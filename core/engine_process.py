@@ -0,0 +1,383 @@
+"""
+GameManager를 별도 프로세스에서 실행하는 스크립트.
+카드 효과 실행과 자동 저장이 화면 갱신 스레드를 막지 않도록, 화면 쪽의 EngineClient는 행동을 파이프로 보내고
+결과 DrawEvent를 나중에 돌려받음(poll).
+능력치, 덱과 인벤토리의 순서, 구매 가능 여부 등 화면이 자주 읽는 상태는 엔진이 행동마다 고정된 형식의
+공유 메모리(StateBuffer)에 기록하므로 왕복 없이 바로 읽을 수 있음.
+
+EngineClient는 게임 화면이 사용하는 GameManager의 메소드를 같은 이름으로 제공함.
+단, buy_card/use_item은 보내기만 하고 바로 반환하므로, 결과는 poll()이 참을 반환한 뒤 구독에서 꺼내야 함.
+"""
+import time
+import struct
+import traceback
+import multiprocessing
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Deque, Dict, Final, List, Optional, Tuple
+
+from core.draw_subscription import DRAW_EVENT_BUFFER_SIZE, DrawEventSubscription
+from core.enums import DrawEventCoalescing, GameResult
+from core.game_manager import GameManager, GameState
+from core.obj_data_formats import CardDrawData, DrawEvent, GameDrawDelta, GameDrawState, ItemDrawData
+
+
+MAX_CARDS: Final[int] = 512
+"""StateBuffer에 기록할 수 있는 덱의 최대 카드 수."""
+MAX_ITEMS: Final[int] = 128
+"""StateBuffer에 기록할 수 있는 인벤토리의 최대 아이템 수."""
+LATENCY_SAMPLES: Final[int] = 64
+"""EngineClient가 평균을 내는 최근 행동 지연 시간의 개수."""
+START_TIMEOUT: Final[float] = 30.0
+"""엔진 프로세스가 게임을 불러올 때까지 기다리는 최대 시간(초)."""
+READ_TIMEOUT: Final[float] = 1.0
+"""StateBuffer를 읽을 때 기록이 끝나기를 기다리는 최대 시간(초). 엔진이 기록 도중 종료된 경우에 대비함."""
+
+# 공유 메모리의 형식(리틀 엔디언, 고정 크기).
+# 머리: 기록 횟수(seqlock), 버전, 능력치 7개(GameState.SAVE_KEYS 순서), 게임 종료 여부, 결과,
+#       구매 가능 비트마스크의 버전, 카드 수, 아이템 수.
+_HEADER: Final[struct.Struct] = struct.Struct("<QQ7i2B2xIII")
+_MASK_OFFSET: Final[int] = _HEADER.size
+_MASK_SIZE: Final[int] = MAX_CARDS // 8
+# 카드: id(부호 없는 128비트 정수), 현재 비용, 앞면 여부.
+_ID_SIZE: Final[int] = 16
+_CARD: Final[struct.Struct] = struct.Struct("<16siB3x")
+_CARDS_OFFSET: Final[int] = _MASK_OFFSET + _MASK_SIZE
+# 아이템: id.
+_ITEM: Final[struct.Struct] = struct.Struct("<16s")
+_ITEMS_OFFSET: Final[int] = _CARDS_OFFSET + _CARD.size * MAX_CARDS
+STATE_BUFFER_SIZE: Final[int] = _ITEMS_OFFSET + _ITEM.size * MAX_ITEMS
+_SEQ: Final[struct.Struct] = struct.Struct("<Q")
+
+_DrawEventType = DrawEvent | Tuple[CardDrawData, int] | ItemDrawData
+
+
+class EngineError(RuntimeError):
+    """엔진 프로세스에서 발생한 예외. 원래 예외의 traceback을 메시지로 가짐."""
+
+
+@dataclass
+class StateSnapshot:
+    """StateBuffer에서 읽은 게임 상태."""
+    version: int
+    stats: Tuple[int, ...]
+    """GameState.SAVE_KEYS 순서의 능력치."""
+    game_end: bool
+    result: GameResult
+    mask_version: int
+    mask: int
+    card_ids: List[int]
+    card_costs: List[int]
+    card_front: List[bool]
+    item_ids: List[int]
+
+
+class StateBuffer:
+    """게임 상태를 고정된 형식으로 담는 공유 메모리.
+    엔진만 기록하며, 기록 도중에는 기록 횟수가 홀수이므로 읽는 쪽은 짝수이면서 읽기 전후로 같을 때까지 다시 읽음.
+    READ_TIMEOUT 동안 기록이 끝나지 않으면 엔진이 기록 도중 종료된 것으로 보고 EngineError 발생."""
+    def __init__(self, name: Optional[str] = None) -> None:
+        """name이 없으면 새 공유 메모리를 만들고, 있으면 그 이름의 공유 메모리에 연결함."""
+        self.owner: bool = name is None
+        # 엔진 프로세스는 EngineClient가 시작하므로 같은 resource_tracker를 공유하며, 지우는 것은 만든 쪽만 함.
+        self.__memory: SharedMemory = SharedMemory(name, create=self.owner, size=STATE_BUFFER_SIZE if self.owner else 0)
+        buf: Optional[memoryview] = self.__memory.buf
+        assert buf is not None
+        self.__buf: memoryview = buf
+        self.__seq: int = 0
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    def write(self, game: GameManager, mask_version: int, mask: int) -> None:
+        """게임 상태를 기록. 엔진 프로세스에서만 호출."""
+        cards = game.deck.get_cards()
+        items = game.inventory.get_items()
+        if len(cards) > MAX_CARDS or len(items) > MAX_ITEMS:
+            raise ValueError(f"StateBuffer 용량 초과: 카드 {len(cards)}/{MAX_CARDS}, 아이템 {len(items)}/{MAX_ITEMS}")
+        stats: Dict[str, int] = game.get_stats()
+        buffer: memoryview = self.__buf
+        self.__seq += 1
+        _SEQ.pack_into(buffer, 0, self.__seq)
+        _HEADER.pack_into(
+            buffer, 0, self.__seq, game.event_manager.draw_state_tracker.version,
+            *(stats[key] for key in GameState.SAVE_KEYS),
+            game.game_end, game.result.value, mask_version, len(cards), len(items)
+        )
+        buffer[_MASK_OFFSET:_CARDS_OFFSET] = mask.to_bytes(_MASK_SIZE, "little")
+        for index, card in enumerate(cards):
+            _CARD.pack_into(buffer, _CARDS_OFFSET + _CARD.size * index, card.id.to_bytes(_ID_SIZE, "little"), card.modified_cost, card.is_front_face)
+        for index, item in enumerate(items):
+            _ITEM.pack_into(buffer, _ITEMS_OFFSET + _ITEM.size * index, item.id.to_bytes(_ID_SIZE, "little"))
+        self.__seq += 1
+        _SEQ.pack_into(buffer, 0, self.__seq)
+
+    def read(self) -> StateSnapshot:
+        """기록이 끝난 상태 하나를 읽음."""
+        buffer: memoryview = self.__buf
+        deadline: Optional[float] = None
+        while True:
+            header = _HEADER.unpack_from(buffer, 0)
+            seq: int = header[0]
+            if seq % 2 == 1:
+                deadline = self._wait(deadline)
+                continue
+            card_count, item_count = header[-2], header[-1]
+            mask: int = int.from_bytes(buffer[_MASK_OFFSET:_CARDS_OFFSET], "little")
+            cards = list(_CARD.iter_unpack(buffer[_CARDS_OFFSET:_CARDS_OFFSET + _CARD.size * card_count]))
+            items = list(_ITEM.iter_unpack(buffer[_ITEMS_OFFSET:_ITEMS_OFFSET + _ITEM.size * item_count]))
+            if _SEQ.unpack_from(buffer, 0)[0] != seq:
+                deadline = self._wait(deadline)
+                continue
+            return StateSnapshot(
+                header[1], header[2:9], bool(header[9]), GameResult(header[10]), header[11], mask,
+                [int.from_bytes(card[0], "little") for card in cards], [card[1] for card in cards],
+                [bool(card[2]) for card in cards], [int.from_bytes(item[0], "little") for item in items]
+            )
+
+    @staticmethod
+    def _wait(deadline: Optional[float]) -> float:
+        """다시 읽기 전에 기록 중인 쪽에 차례를 넘김. 처음 호출이라면 기한을 정하고, 기한이 지났다면 EngineError 발생."""
+        now: float = time.perf_counter()
+        if deadline is None:
+            deadline = now + READ_TIMEOUT
+        elif now > deadline:
+            raise EngineError("엔진 프로세스가 상태를 기록하는 도중 응답하지 않습니다.")
+        time.sleep(0)
+        return deadline
+
+    def close(self) -> None:
+        """연결을 닫음. 만든 쪽이라면 공유 메모리도 지움."""
+        self.__memory.close()
+        if self.owner:
+            self.__memory.unlink()
+
+
+def run_engine(conn: Connection, buffer_name: str, path: str, seed: Optional[int], autosave: bool) -> None:
+    """엔진 프로세스의 진입점. 게임을 불러온 뒤 파이프로 받은 요청을 순서대로 처리함.
+    요청:
+        ("buy_card" | "use_item", id): 행동 실행. ("done", 성공 여부, DrawEvent 목록, 행동 전 버전, 그 이후의 변화, 엔진 처리 시간)으로 응답.
+        ("call", 메소드 이름, 인수): GameManager의 메소드 호출. ("result", 반환값)으로 응답.
+        ("close",): 종료."""
+    buffer: StateBuffer = StateBuffer(buffer_name)
+    try:
+        try:
+            game: GameManager = GameManager.create_from_file(path, seed, autosave)
+            subscription: DrawEventSubscription = game.subscribe_draw_events(maxlen=None, take_pending=True)
+            buffer.write(game, *game.purchasable_mask())
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+            return
+        conn.send(("ready", list(subscription)))
+        while True:
+            try:
+                request: tuple = conn.recv()
+            except EOFError:
+                return
+            if request[0] == "close":
+                return
+            try:
+                match request[0]:
+                    case "buy_card" | "use_item":
+                        start: float = time.perf_counter()
+                        version: int = game.event_manager.draw_state_tracker.version
+                        done: bool = game.buy_card(request[1]) if request[0] == "buy_card" else game.use_item(request[1])
+                        buffer.write(game, *game.purchasable_mask())
+                        conn.send((
+                            "done", done, list(subscription), version,
+                            game.get_delta_since(version), time.perf_counter() - start
+                        ))
+                    case "call":
+                        conn.send(("result", getattr(game, request[1])(*request[2])))
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+    finally:
+        buffer.close()
+        conn.close()
+
+
+class EngineClient:
+    """별도 프로세스에서 실행되는 GameManager의 화면 쪽 대리자.
+    한 번에 하나의 행동만 보낼 수 있으며, 결과가 돌아오기 전의 행동은 무시됨."""
+    def __init__(self, path: str, seed: Optional[int] = None, autosave: bool = True) -> None:
+        """엔진 프로세스를 시작하고 게임을 불러올 때까지 기다림. 실패하면 EngineError 발생."""
+        context = multiprocessing.get_context("spawn")
+        self.__buffer: StateBuffer = StateBuffer()
+        self.__conn, child_conn = context.Pipe()
+        self.__process = context.Process(
+            target=run_engine, args=(child_conn, self.__buffer.name, path, seed, autosave),
+            name="GameEngine", daemon=True
+        )
+        self.__process.start()
+        child_conn.close()
+        self.__subscriptions: List[DrawEventSubscription] = []
+        self.__sent: Optional[float] = None
+        """진행 중인 행동을 보낸 시각. 없다면 None."""
+        self.__handled: bool = False
+        """_call이 행동의 결과를 대신 받아 처리했는지 여부. 다음 poll()이 True를 반환하도록 함."""
+        self.__delta: Optional[Tuple[int, GameDrawDelta]] = None
+        """마지막 행동의 (행동 전 버전, 그 이후의 변화). get_delta_since가 왕복 없이 사용함."""
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        """최근 행동마다 보낸 뒤 결과를 받을 때까지 걸린 시간(초)."""
+        self.engine_times: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        """최근 행동마다 엔진이 실제로 처리한 시간(초)."""
+
+        if not self.__conn.poll(START_TIMEOUT):
+            self.close()
+            raise EngineError("엔진 프로세스가 응답하지 않습니다.")
+        reply: tuple = self._recv()
+        if reply[0] == "error":
+            self.close()
+            raise EngineError(reply[1])
+        self.__pending_events: List[_DrawEventType] = reply[1]
+        """시작할 때 발생한 DrawEvent. take_pending=True로 처음 구독하는 쪽이 넘겨받음."""
+
+    @property
+    def waiting(self) -> bool:
+        """보낸 행동의 결과를 기다리는 중인지 여부."""
+        return self.__sent is not None
+
+    @property
+    def state(self) -> StateSnapshot:
+        """공유 메모리에 기록된 현재 상태."""
+        return self.__buffer.read()
+
+    @property
+    def game_end(self) -> bool:
+        return self.__buffer.read().game_end
+
+    @property
+    def result(self) -> GameResult:
+        return self.__buffer.read().result
+
+    @property
+    def latency(self) -> float:
+        """최근 행동의 평균 지연 시간(초). 행동을 보낸 뒤 결과를 받아 구독에 넣을 때까지."""
+        return sum(self.latencies) / len(self.latencies) if len(self.latencies) > 0 else 0.0
+
+    def latency_summary(self) -> str:
+        engine_time: float = sum(self.engine_times) / len(self.engine_times) if len(self.engine_times) > 0 else 0.0
+        return f"action {self.latency * 1000:.2f} ms (engine {engine_time * 1000:.2f} ms)"
+
+    def purchasable_mask(self) -> Tuple[int, int]:
+        """GameManager.purchasable_mask와 같음. (버전, 비트마스크)"""
+        snapshot: StateSnapshot = self.__buffer.read()
+        return snapshot.mask_version, snapshot.mask
+
+    def purchasable_ids(self) -> List[int]:
+        """GameManager.purchasable_ids와 같으나 덱 순서로 정렬됨."""
+        snapshot: StateSnapshot = self.__buffer.read()
+        return [id for index, id in enumerate(snapshot.card_ids) if snapshot.mask >> index & 1]
+
+    def buy_card(self, id: int) -> bool:
+        """카드 구매 요청을 보냄. 결과를 기다리는 중이라면 무시하고 False 반환."""
+        return self._send("buy_card", id)
+
+    def use_item(self, id: int) -> bool:
+        """아이템 사용 요청을 보냄. 결과를 기다리는 중이라면 무시하고 False 반환."""
+        return self._send("use_item", id)
+
+    def _send(self, kind: str, id: int) -> bool:
+        if self.__sent is not None:
+            return False
+        self.__sent = time.perf_counter()
+        self.__conn.send((kind, id))
+        return True
+
+    def poll(self) -> bool:
+        """보낸 행동의 결과가 도착했다면 DrawEvent를 구독에 넣고 True 반환. 화면 갱신마다 호출.
+        그 사이 다른 호출(_call)이 결과를 먼저 받아 처리했더라도 한 번은 True를 반환함."""
+        if self.__handled:
+            self.__handled = False
+            return True
+        if self.__sent is None or not self.__conn.poll():
+            return False
+        self._handle(self._recv())
+        return True
+
+    def _recv(self) -> tuple:
+        """엔진의 응답 하나를 받음. 엔진 프로세스가 종료되었다면 정리한 뒤 EngineError 발생."""
+        try:
+            return self.__conn.recv()
+        except (EOFError, OSError) as e:
+            self.close()
+            raise EngineError("엔진 프로세스가 종료되었습니다.") from e
+
+    def _handle(self, reply: tuple) -> None:
+        sent, self.__sent = self.__sent, None
+        if reply[0] == "error":
+            raise EngineError(reply[1])
+        _, _, events, version, delta, engine_time = reply
+        for draw_event in events:
+            for subscription in self.__subscriptions:
+                subscription.push(draw_event)
+        self.__delta = (version, delta)
+        if sent is not None:
+            self.latencies.append(time.perf_counter() - sent)
+            self.engine_times.append(engine_time)
+
+    def _call(self, name: str, *args: Any) -> Any:
+        """엔진의 GameManager 메소드를 호출하고 결과를 기다림.
+        요청은 순서대로 처리되므로, 진행 중인 행동이 있다면 그 결과를 먼저 받아 처리함."""
+        self.__conn.send(("call", name, args))
+        action_reply: Optional[tuple] = self._recv() if self.__sent is not None else None
+        reply: tuple = self._recv()
+        if action_reply is not None:
+            self._handle(action_reply)
+            self.__handled = True
+        if reply[0] == "error":
+            raise EngineError(reply[1])
+        return reply[1]
+
+    def get_game_draw_state(self) -> GameDrawState:
+        return self._call("get_game_draw_state")
+
+    def get_delta_since(self, version: int) -> GameDrawDelta:
+        """GameManager.get_delta_since와 같음. 마지막 행동 직전 버전이나 현재 버전이라면 왕복하지 않음."""
+        if self.__delta is not None and self.__delta[0] == version:
+            return self.__delta[1]
+        current: int = self.__buffer.read().version
+        if version >= current:
+            return GameDrawDelta(current, None, None, [], [], [], [])
+        return self._call("get_delta_since", version)
+
+    def to_save_tree(self) -> dict:
+        return self._call("to_save_tree")
+
+    def subscribe_draw_events(
+            self,
+            callback: Optional[Callable[[_DrawEventType], None]] = None,
+            maxlen: Optional[int] = DRAW_EVENT_BUFFER_SIZE,
+            take_pending: bool = False,
+            coalescing: DrawEventCoalescing = DrawEventCoalescing.Off
+        ) -> DrawEventSubscription:
+        """GameManager.subscribe_draw_events와 같음. 이벤트는 poll()에서 전달됨."""
+        subscription = DrawEventSubscription(self, callback, maxlen, coalescing)  # type: ignore[arg-type]
+        if take_pending:
+            for draw_event in self.__pending_events:
+                subscription.push(draw_event)
+            self.__pending_events = []
+        self.__subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe_draw_events(self, subscription: DrawEventSubscription) -> None:
+        if subscription in self.__subscriptions:
+            self.__subscriptions.remove(subscription)
+
+    def close(self) -> None:
+        """엔진 프로세스를 종료하고 공유 메모리를 지움. 이미 닫혔다면 아무것도 하지 않음."""
+        if self.__conn.closed:
+            return
+        if self.__process.is_alive():
+            try:
+                self.__conn.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.__process.join(timeout=1.0)
+            if self.__process.is_alive():
+                self.__process.terminate()
+        self.__conn.close()
+        self.__buffer.close()
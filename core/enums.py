@@ -120,4 +120,41 @@ class DrawEventType(Enum):
     """플레이어 상태가 변화함.
     target: 해당 상태의 PlayerType(int).
     previous: 해당 상태의 이전 값.
-    current: 해당 상태의 현재 값."""
\ No newline at end of file
+    current: 해당 상태의 현재 값."""
+
+
+class DrawEventCoalescing(Enum):
+    """구독자에게 DrawEvent를 전달할 때 같은 종류의 이벤트를 합치는 방식."""
+    Off = auto()
+    """합치지 않고 하나씩 전달."""
+    Batch = auto()
+    """연속으로 발생한 같은 종류의 이벤트(카드 공개/이동/파괴/비용 변화, 능력치 변화)를 DrawEventBatch 하나로 합침.
+    대상마다 처음의 previous와 마지막 current만 남음."""
+    Compact = auto()
+    """연속 여부와 관계없이 아직 꺼내지 않은 같은 종류의 이벤트를 모두 합치고, 변화량이 없는 항목과 파괴된 카드의 항목을 버림.
+    카드 생성, 아이템 변화 등 합치지 않는 항목이 그 사이에 있다면 순서를 지키기 위해 그 뒤부터 새로 합침.
+    최종 상태만 필요한 소비자용. 이동 이벤트의 previous는 의미가 없을 수 있으므로 current만 사용해야 함."""
+
+class ActionType(Enum):
+    """플레이어가 게임에 가할 수 있는 행동의 종류. 재현(replay)이나 자동 진행에 사용."""
+    BuyCard = auto()
+    """덱의 카드를 구매함.
+    index: 덱에서 카드의 위치."""
+    UseItem = auto()
+    """인벤토리의 아이템을 사용함.
+    index: 인벤토리에서 아이템의 위치."""
+    EndTurn = auto()
+    """현재 턴을 종료함.
+    index: 사용하지 않음."""
+
+
+class GameResult(Enum):
+    """게임의 진행 결과."""
+    InProgress = auto()
+    """게임이 아직 끝나지 않음."""
+    Won = auto()
+    """플레이어가 승리함."""
+    LostByHealth = auto()
+    """체력 고갈로 패배함."""
+    LostByNoAction = auto()
+    """구매할 카드도 사용할 아이템도 없어 패배함."""
@@ -1,10 +1,13 @@
 """게임 진행 중 생기는 이벤트를 호출하고 관리하는 스크립트."""
+from functools import lru_cache
 from types import CodeType
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Tuple
 
 from core.card import Card
+from core.draw_state import DrawStateTracker
+from core.draw_subscription import DRAW_EVENT_BUFFER_SIZE, DrawEventSubscription
 from core.item import Item
-from core.enums import EffectTarget, EventType, PlayerStat
+from core.enums import DrawEventCoalescing, EffectTarget, EventType, PlayerStat
 from core.event_handlers import (
     EventHandlerBase,
     EventHandler0,
@@ -20,6 +23,26 @@ if TYPE_CHECKING:
     from core.game_manager import GameManager
 
 
+@lru_cache(maxsize=None)
+def _compile_script(code: str) -> Optional[CodeType]:
+    """효과 스크립트를 compile하고 조건을 만족하는지 검사.
+    같은 스크립트는 모든 게임에서 공유하므로 한 번만 compile함. (code 객체는 변경 불가능하므로 공유해도 안전함.)
+    빈문자열인 경우: None 반환
+    오류가 생긴 경우: 해당 오류 그대로 발생
+    금지어(예: __class__)를 포함하는 경우: NameError 발생
+    """
+    if code.strip() == "":
+        return None
+    result = compile(code, "<string>", "eval")
+    disallowed_table = ("__class__",)
+    for disallowed in disallowed_table:
+        if disallowed in result.co_names:
+            raise NameError(
+                f"스크립트 파싱 중 오류: `{code}`\n`{disallowed}`의 사용은 허용되지 않습니다."
+            )
+    return result
+
+
 class EventManager:
     """게임 내 이벤트를 호출하는 관리자."""
 
@@ -61,6 +84,9 @@ class EventManager:
 
         self.__event_queue: List[Callable[[], None]] = []
         self.__draw_event_queue: List[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData] = []
+        self.__draw_state_tracker: DrawStateTracker = DrawStateTracker()
+        self.__draw_event_subscriptions: List[DrawEventSubscription] = []
+        self.__draw_event_polling: bool = True
 
     def _compile_and_check(self, code: str) -> Optional[CodeType]:
         """해당 문자열을 compile하고 조건을 만족하는지 검사.
@@ -69,16 +95,7 @@ class EventManager:
         오류가 생긴 경우: 해당 오류 그대로 발생
         금지어(예: __class__)를 포함하는 경우: NameError 발생
         """
-        if code.strip() == "":
-            return None
-        result = compile(code, "<string>", "eval")
-        disallowed_table = ("__class__",)
-        for disallowed in disallowed_table:
-            if disallowed in result.co_names:
-                raise NameError(
-                    f"스크립트 파싱 중 오류: `{code}`\n`{disallowed}`의 사용은 허용되지 않습니다."
-                )
-        return result
+        return _compile_script(code)
 
     def register_effect(self, effect_obj: "Effect"):
         """주어진 효과 객체를 이벤트 목록에 등록.
@@ -253,8 +270,43 @@ class EventManager:
         self.__listeners_table[type].clear()
 
     def push_draw_event(self, draw_state: DrawEvent | Tuple[CardDrawData, int] | ItemDrawData):
-        """DrawEvent를 큐에 추가."""
-        self.__draw_event_queue.append(draw_state)
+        """DrawEvent를 큐에 추가하고 구독자에게 전달."""
+        if self.__draw_event_polling:
+            self.__draw_event_queue.append(draw_state)
+        self.__draw_state_tracker.record(draw_state)
+        for subscription in self.__draw_event_subscriptions:
+            subscription.push(draw_state)
+
+    def subscribe_draw_events(
+            self,
+            callback: Optional[Callable[[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData], None]] = None,
+            maxlen: Optional[int] = DRAW_EVENT_BUFFER_SIZE,
+            take_pending: bool = False,
+            coalescing: DrawEventCoalescing = DrawEventCoalescing.Off
+        ) -> DrawEventSubscription:
+        """DrawEvent 구독을 추가.
+        :param callback: 주어진 경우 이벤트마다 즉시 호출하고 버퍼에 쌓지 않음.
+        :param maxlen: 버퍼의 최대 크기. None이면 제한하지 않음.
+        :param take_pending: 참인 경우 get_draw_event 큐에 남은 이벤트를 넘겨받고, 이후로는 큐에 이벤트를 쌓지 않음.
+        (get_draw_event를 대신해 이 구독으로 이벤트를 받는 주 소비자가 사용.)
+        :param coalescing: 버퍼에 넣을 때 같은 종류의 이벤트를 DrawEventBatch로 합치는 방식."""
+        subscription: DrawEventSubscription = DrawEventSubscription(self, callback, maxlen, coalescing)
+        if take_pending:
+            for draw_state in self.get_draw_event():
+                subscription.push(draw_state)
+            self.__draw_event_polling = False
+        self.__draw_event_subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe_draw_events(self, subscription: DrawEventSubscription) -> None:
+        """DrawEvent 구독을 해제. 직접 호출하기보다 DrawEventSubscription.close()를 권장."""
+        if subscription in self.__draw_event_subscriptions:
+            self.__draw_event_subscriptions.remove(subscription)
+
+    @property
+    def draw_state_tracker(self) -> DrawStateTracker:
+        """지금까지 추가된 DrawEvent로 각 대상이 마지막으로 바뀐 버전을 기록하는 객체."""
+        return self.__draw_state_tracker
 
     def get_draw_event(self) -> List[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData]:
         """DrawEvent 큐의 모든 이벤트를 제거하고 반환."""
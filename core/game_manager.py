@@ -5,21 +5,25 @@
 import os
 import json
 import uuid
+import random
 from datetime import datetime
-from typing import Any, Dict, Final, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Final, Iterable, List, Optional, Tuple
+from array import array
 from functools import partial
 
 import core.card_data_manager as cdm
 from core.card import Card
-from core.enums import CardType, DrawEventType, PlayerStat
+from core.enums import ActionType, CardType, DrawEventCoalescing, DrawEventType, GameResult, PlayerStat
 from core.item import Item
 from core.deck_manager import Deck
 from core.inventory_manager import Inventory
 from core.event_manager import EventManager
+from core.draw_state import DrawStateTracker
+from core.draw_subscription import DRAW_EVENT_BUFFER_SIZE, DrawEventSubscription
+from core.state_hash import FEATURE_PLAYER, MASK64, StateHasher, card_key, feature_key, item_key
 from core.obj_data_formats import (
-    CardData, CardDrawData, CardSaveData, DrawEvent, 
-    GameDrawState, ItemData, ItemDrawData, ItemSaveData
+    Action, ActionBatchResult, CardData, CardDrawData, CardSaveData, DrawEvent, 
+    GameDrawDelta, GameDrawState, ItemData, ItemDrawData, ItemSaveData
 )
 
 
@@ -28,18 +32,109 @@ LEVEL_PATH: Final[str] = "data/levels"
 SAVEFILE_PATH: Final[str] = "data/saves"
 
 
-@dataclass
 class GameState:
     """
     GameManager에서 내부적으로 사용하는 현재 게임 상태.
+    모든 값을 하나의 정수 배열에 담으며, 플레이어 능력치는 PlayerStat.value - 1번째 칸에 위치함.
     """
-    player_money: int = 5
-    player_health: int = 5
-    player_attack: int = 0
-    player_action: int = 3
-    player_index: int = 0
-    player_remaining_action: int = 3
-    current_turn: int = 1
+    __slots__ = ("values",)
+
+    _PLAYER_INDEX: Final[int] = len(PlayerStat)
+    _REMAINING_ACTION: Final[int] = len(PlayerStat) + 1
+    _CURRENT_TURN: Final[int] = len(PlayerStat) + 2
+    SAVE_KEYS: Final[Tuple[str, ...]] = (
+        "player_money", "player_health", "player_attack", "player_action",
+        "player_index", "player_remaining_action", "current_turn"
+    )
+    """to_dict로 저장되는 항목의 이름. values의 순서와 같음."""
+
+    def __init__(
+            self,
+            player_money: int = 5,
+            player_health: int = 5,
+            player_attack: int = 0,
+            player_action: int = 3,
+            player_index: int = 0,
+            player_remaining_action: int = 3,
+            current_turn: int = 1
+            ) -> None:
+        self.values: array = array("q", (
+            player_money, player_health, player_attack, player_action,
+            player_index, player_remaining_action, current_turn
+        ))
+
+    def __repr__(self) -> str:
+        return f"GameState({', '.join(f'{key}={value}' for key, value in zip(self.SAVE_KEYS, self.values))})"
+
+    def __eq__(self, __value: object) -> bool:
+        return isinstance(__value, GameState) and self.values == __value.values
+
+    def get_stat(self, stat: PlayerStat) -> int:
+        return self.values[stat.value - 1]
+
+    def set_stat(self, stat: PlayerStat, value: int) -> None:
+        self.values[stat.value - 1] = value
+
+    def to_dict(self) -> Dict[str, int]:
+        """저장 파일에 기록할 dict로 변환."""
+        return dict(zip(self.SAVE_KEYS, self.values))
+
+    # 기존 코드와의 호환을 위한 속성.
+    @property
+    def player_money(self) -> int:
+        return self.values[PlayerStat.Money.value - 1]
+
+    @player_money.setter
+    def player_money(self, value: int) -> None:
+        self.values[PlayerStat.Money.value - 1] = value
+
+    @property
+    def player_health(self) -> int:
+        return self.values[PlayerStat.Health.value - 1]
+
+    @player_health.setter
+    def player_health(self, value: int) -> None:
+        self.values[PlayerStat.Health.value - 1] = value
+
+    @property
+    def player_attack(self) -> int:
+        return self.values[PlayerStat.Attack.value - 1]
+
+    @player_attack.setter
+    def player_attack(self, value: int) -> None:
+        self.values[PlayerStat.Attack.value - 1] = value
+
+    @property
+    def player_action(self) -> int:
+        return self.values[PlayerStat.Action.value - 1]
+
+    @player_action.setter
+    def player_action(self, value: int) -> None:
+        self.values[PlayerStat.Action.value - 1] = value
+
+    @property
+    def player_index(self) -> int:
+        return self.values[self._PLAYER_INDEX]
+
+    @player_index.setter
+    def player_index(self, value: int) -> None:
+        self.values[self._PLAYER_INDEX] = value
+
+    @property
+    def player_remaining_action(self) -> int:
+        return self.values[self._REMAINING_ACTION]
+
+    @player_remaining_action.setter
+    def player_remaining_action(self, value: int) -> None:
+        self.values[self._REMAINING_ACTION] = value
+
+    @property
+    def current_turn(self) -> int:
+        return self.values[self._CURRENT_TURN]
+
+    @current_turn.setter
+    def current_turn(self, value: int) -> None:
+        self.values[self._CURRENT_TURN] = value
 
 
 class GameManager:
@@ -47,9 +142,33 @@ class GameManager:
     게임의 전체적인 진행을 담당.
     """
 
-    def __init__(self, game_id: str, game_state: GameState, level_name: str, card_saves: List[CardSaveData], item_saves: List[ItemSaveData]) -> None:
-        """GameManager의 초기화 메소드. 외부에서 직접 호출하는 것은 권장하지 않음."""
+    debug_state_hash: bool = False
+    """참인 경우 state_hash를 호출할 때마다 처음부터 다시 계산한 값과 비교함. 디버그용."""
+    per_step_stat_updates: bool = False
+    """참인 경우 modify_player_stat의 repeat만큼 능력치를 한 번씩 바꾸며 매번 이벤트를 발생시킴.
+    거짓인 경우 변화량을 합쳐 한 번에 적용하고 이벤트도 한 번만 발생시킴. 최종 값은 같음."""
+
+    def __init__(
+            self, 
+            game_id: str, 
+            game_state: GameState, 
+            level_name: str, 
+            card_saves: List[CardSaveData], 
+            item_saves: List[ItemSaveData],
+            seed: int = 0,
+            rng_state: Optional[tuple] = None,
+            autosave: bool = True
+            ) -> None:
+        """GameManager의 초기화 메소드. 외부에서 직접 호출하는 것은 권장하지 않음.
+        :param seed: 이 게임이 사용하는 난수 생성기의 시드.
+        :param rng_state: 저장된 난수 생성기 상태. 주어진 경우 seed 대신 이 상태에서 이어서 진행함.
+        :param autosave: 거짓인 경우 매 행동 후의 자동 저장을 수행하지 않음. 재현, 시뮬레이션 등에 사용."""
         self.__game_id: str = game_id
+        self.__seed: int = seed
+        self.__rng: random.Random = random.Random(seed)
+        if rng_state is not None:
+            self.__rng.setstate(rng_state)
+        self.autosave: bool = autosave
 
         self.__game_state: GameState = game_state
         self.__level_name: str = level_name
@@ -82,10 +201,15 @@ class GameManager:
         #         continue
         #     items.append(data)
 
-        self.__deck: Deck = Deck(self.__event_manager, cards, game_state.player_index)
-        self.__inventory: Inventory = Inventory(self.__event_manager, items)
+        # 카드/아이템 부분의 지문. 덱과 인벤토리가 변경될 때마다 갱신함.
+        self.__hasher: StateHasher = StateHasher()
+        self.__deck: Deck = Deck(self.__event_manager, cards, game_state.player_index, self.__rng, self.__hasher)
+        self.__inventory: Inventory = Inventory(self.__event_manager, items, self.__hasher)
 
         self.__game_end: bool = False
+        self.__result: GameResult = GameResult.InProgress
+        # purchasable_mask의 캐시. ((색인 버전, 소지금, 체력+공격력, 게임 종료 여부), 버전, 비트마스크)
+        self.__purchasable_cache: Tuple[tuple, int, int] = ((), 0, 0)
 
         self.start_game()
 
@@ -94,6 +218,11 @@ class GameManager:
         """현재 게임 레벨의 이름."""
         return self.__level_name
     
+    @property
+    def seed(self) -> int:
+        """이 게임의 난수 생성기 시드."""
+        return self.__seed
+
     @property
     def deck(self) -> Deck:
         """현재 게임의 덱."""
@@ -113,16 +242,43 @@ class GameManager:
     def game_end(self) -> bool:
         return self.__game_end
 
+    @property
+    def result(self) -> GameResult:
+        """게임의 승패 결과. 게임이 끝나지 않았다면 GameResult.InProgress."""
+        return self.__result
+
+    @property
+    def current_turn(self) -> int:
+        """현재 턴."""
+        return self.__game_state.current_turn
+
+    @property
+    def remaining_action(self) -> int:
+        """이번 턴에 남은 행동 횟수."""
+        return self.__game_state.player_remaining_action
+
     @staticmethod
-    def create_from_file(path: str) -> "GameManager":
+    def create_from_file(path: str, seed: Optional[int] = None, autosave: bool = True) -> "GameManager":
         """level json 파일로부터 새 게임 생성.
         :param path: 파일이 위치한 현재 작업 경로 기준 상대 경로 또는 절대 경로.
+        :param seed: 난수 생성기 시드. 주어지지 않으면 파일에 기록된 값을, 그마저 없으면 임의의 값을 사용.
+        :param autosave: 매 행동 후 자동 저장 여부.
         :return: 해당 파일로 설정한 GameManager 객체.
         """
         cdm.initialize()
         with open(path, encoding="utf-8") as f:
             tree: dict = json.load(f)
+        return GameManager.create_from_tree(tree, seed, autosave)
 
+    @staticmethod
+    def create_from_tree(tree: dict, seed: Optional[int] = None, autosave: bool = True) -> "GameManager":
+        """json으로부터 읽어 들인 level 또는 저장 파일 내용으로 새 게임 생성.
+        create_from_file과 달리 카드 데이터를 다시 불러오지 않으므로, 미리 card_data_manager.initialize()를 호출해야 함.
+        :param tree: level 또는 저장 파일의 내용.
+        :param seed: 난수 생성기 시드. 주어진 경우 저장된 난수 생성기 상태를 무시함.
+        :param autosave: 매 행동 후 자동 저장 여부.
+        :return: 해당 내용으로 설정한 GameManager 객체.
+        """
         state: GameState = GameState()
         if "current_turn" in tree: state.current_turn = tree["current_turn"]
         if "player_money" in tree: state.player_money = tree["player_money"]
@@ -137,7 +293,15 @@ class GameManager:
         item_saves = [ItemSaveData(**save_obj) for save_obj in tree["inventory"]]
 
         game_id: str = tree["game_id"] if "game_id" in tree else uuid.uuid4().hex[:16]
-        return GameManager(game_id, state, tree["level_name"], card_saves, item_saves)
+
+        rng_state: Optional[tuple] = None
+        if seed is None:
+            if "rng_state" in tree:
+                version, internal_state, gauss_next = tree["rng_state"]
+                rng_state = (version, tuple(internal_state), gauss_next)
+            seed = tree["seed"] if "seed" in tree else random.randrange(2**32)
+
+        return GameManager(game_id, state, tree["level_name"], card_saves, item_saves, seed, rng_state, autosave)
 
     def start_game(self):
         """초기화 메소드 직후에 호출되어 게임 시작 시의 로직을 수행."""
@@ -154,19 +318,30 @@ class GameManager:
             ))
             self.__event_manager.invoke_events(recursive=True)
 
-    def save(self, path: str, filename: str = "") -> None:
-        """현재 게임 상태를 주어진 경로의 폴더에 저장."""
+        # 저장 파일에는 계산된 비용이 기록되지 않으므로, 첫 행동 전에도 올바른 비용을 갖도록 미리 계산.
+        self.__event_manager.on_calculate_card_cost(True)
+        self.__deck.apply_cost_modifier()
+
+    def to_save_tree(self) -> dict:
+        """현재 게임 상태를 저장 파일 양식의 dict로 변환. create_from_tree로 같은 상태의 게임을 다시 만들 수 있음."""
         # TODO: 저장 파일 포맷 완성
         self.__game_state.player_index = self.__deck.player_index
-        tree: dict = {
+        version, internal_state, gauss_next = self.__rng.getstate()
+        return {
             "game_id": self.__game_id,
             "level_name": self.__level_name,
             "datetime": datetime.now().strftime('%Y_%m_%d_%H_%M_%S'),
+            "seed": self.__seed,
+            "rng_state": [version, list(internal_state), gauss_next],
             "deck": [card.to_save_data().__dict__ for card in self.__deck.get_cards()],
             "inventory": [item.to_save_data().__dict__ for item in self.__inventory.get_items()],
-            **self.__game_state.__dict__ # 나중에 고치시오
+            **self.__game_state.to_dict()
         }
 
+    def save(self, path: str, filename: str = "") -> None:
+        """현재 게임 상태를 주어진 경로의 폴더에 저장."""
+        tree: dict = self.to_save_tree()
+
         if filename == "":
             filename = f"{self.__level_name}_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
 
@@ -176,7 +351,9 @@ class GameManager:
             json.dump(tree, f)
 
     def get_game_draw_state(self) -> GameDrawState:
-        """현재 게임 상태를 반환. 주로 초기화에 사용."""
+        """현재 게임 상태를 반환. 주로 초기화에 사용.
+        반환값의 version을 get_delta_since에 전달하면 이후로 바뀐 부분만 받을 수 있음."""
+        self.__game_state.player_index = self.__deck.player_index
         return GameDrawState(
             self.__game_state.player_money,
             self.__game_state.player_health,
@@ -185,28 +362,93 @@ class GameManager:
             self.__game_state.player_index,
             self.__game_state.player_remaining_action,
             self.__game_state.current_turn,
-            [CardDrawData(
-                card.id,
-                card.card_data.name,
-                card.card_data.type,
-                card.card_data.cost,
-                card.modified_cost,
-                card.is_front_face,
-                card.card_data.sprite_name,
-                card.card_data.description
-            ) for card in self.__deck.get_cards()],
-            [ItemDrawData(
-                item.id,
-                item.item_data.name,
-                item.item_data.sprite_name,
-                item.item_data.description
-            ) for item in self.__inventory.get_items()]
+            [card.to_draw_data() for card in self.__deck.get_cards()],
+            [item.to_draw_data() for item in self.__inventory.get_items()],
+            self.__event_manager.draw_state_tracker.version
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """플레이어 능력치와 턴 등. GameDrawState의 속성 이름을 키로 사용하며 카드/아이템 정보는 만들지 않음."""
+        self.__game_state.player_index = self.__deck.player_index
+        return self.__game_state.to_dict()
+
+    def get_delta_since(self, version: int) -> GameDrawDelta:
+        """주어진 버전 이후로 바뀐 카드, 아이템, 능력치만 반환. GameDrawState.apply_delta로 반영할 수 있음.
+        바뀐 것이 없다면 O(1)이며, 그렇지 않아도 바뀌지 않은 카드의 그리기 정보는 만들지 않음.
+        삭제 기록이 남아 있지 않을 만큼 오래된 버전이라면 전체 상태를 담아 full을 표시함."""
+        tracker: DrawStateTracker = self.__event_manager.draw_state_tracker
+        if version >= tracker.version:
+            return GameDrawDelta(tracker.version, None, None, [], [], [], [])
+        if not tracker.has_history_since(version):
+            state: GameDrawState = self.get_game_draw_state()
+            return GameDrawDelta(
+                tracker.version, self.__game_state.to_dict(), [card.id for card in state.deck],
+                state.deck, [], state.inventory, [], full=True
+            )
+        stats: Optional[Dict[str, int]] = None
+        if tracker.stats_version > version:
+            self.__game_state.player_index = self.__deck.player_index
+            stats = self.__game_state.to_dict()
+        cards: List[Card] = self.__deck.get_cards()
+        card_versions: Dict[int, int] = tracker.card_versions
+        items: List[Item] = self.__inventory.get_items()
+        item_versions: Dict[int, int] = tracker.item_versions
+        return GameDrawDelta(
+            tracker.version,
+            stats,
+            [card.id for card in cards] if tracker.order_version > version else None,
+            [card.to_draw_data() for card in cards if card_versions.get(card.id, 0) > version],
+            tracker.removed_since(tracker.removed_cards, version),
+            [item.to_draw_data() for item in items if item_versions.get(item.id, 0) > version],
+            tracker.removed_since(tracker.removed_items, version)
         )
 
     def get_draw_events(self) -> List[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData]:
-        """이전 호출 이후로 생긴 게임 상태의 변화 등 이벤트의 목록을 반환."""
+        """이전 호출 이후로 생긴 게임 상태의 변화 등 이벤트의 목록을 반환.
+        subscribe_draw_events(take_pending=True)로 구독한 이후로는 항상 빈 목록을 반환함."""
         return self.__event_manager.get_draw_event()
 
+    def subscribe_draw_events(
+            self,
+            callback: Optional[Callable[[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData], None]] = None,
+            maxlen: Optional[int] = DRAW_EVENT_BUFFER_SIZE,
+            take_pending: bool = False,
+            coalescing: DrawEventCoalescing = DrawEventCoalescing.Off
+        ) -> DrawEventSubscription:
+        """DrawEvent를 구독. 여러 소비자가 같은 게임의 이벤트를 각자의 버퍼로 받을 수 있음.
+        자세한 내용은 EventManager.subscribe_draw_events 참고."""
+        return self.__event_manager.subscribe_draw_events(callback, maxlen, take_pending, coalescing)
+
+    def state_hash(self) -> int:
+        """현재 게임 상태의 64비트 지문을 반환.
+        카드/아이템의 id처럼 실행마다 달라지는 값은 제외하므로, 같은 시드와 같은 행동으로 진행한 게임은 같은 값을 가짐.
+        카드/아이템 부분은 변경될 때마다 점진적으로 갱신되므로 O(1)에 계산됨."""
+        value: int = (self.__hasher.value + self._player_key()) & MASK64
+        if self.debug_state_hash:
+            assert value == self._compute_state_hash(), "점진적으로 갱신한 지문이 실제 상태와 다릅니다."
+        return value
+
+    def _player_key(self) -> int:
+        """플레이어 능력치와 진행 상태의 지문 키. 항목 수가 고정되어 있으므로 매번 계산함."""
+        # GameState의 플레이어 위치는 저장할 때만 갱신되므로 덱의 값을 사용.
+        values: array = self.__game_state.values
+        return feature_key(
+            FEATURE_PLAYER,
+            *values[:GameState._PLAYER_INDEX],
+            *values[GameState._PLAYER_INDEX + 1:],
+            self.__deck.player_index,
+            self.__game_end
+        )
+
+    def _compute_state_hash(self) -> int:
+        """state_hash와 같은 값을 현재 상태로부터 처음부터 계산. O(카드 수 + 아이템 수)."""
+        value: int = self._player_key()
+        for index, card in enumerate(self.__deck.get_cards()):
+            value += card_key(index, card.card_data.id, card.is_front_face, card.modified_cost, card.instant_cost_modifier)
+        for item in self.__inventory.get_items():
+            value += item_key(item.item_data.id)
+        return value & MASK64
+
     def get_readable_static_table(self) -> Dict[str, Any]:
         """효과 스크립팅에서 사용 가능한 정적 변수/함수 목록 반환(읽기 전용)."""
         return {
@@ -214,12 +456,7 @@ class GameManager:
             "PLAYER_HEALTH": PlayerStat.Health,
             "PLAYER_ATTACK": PlayerStat.Attack,
             "PLAYER_ACTION": PlayerStat.Action,
-            "get_player_stat": lambda x: {
-                    PlayerStat.Money: self.__game_state.player_money,
-                    PlayerStat.Health: self.__game_state.player_health,
-                    PlayerStat.Attack: self.__game_state.player_attack,
-                    PlayerStat.Action: self.__game_state.player_action
-                }.get(x),
+            "get_player_stat": self.__game_state.get_stat,
             "CardType": CardType,
             "get_card_data": cdm.get_card_data,
             "get_item_data": cdm.get_item_data,
@@ -252,28 +489,14 @@ class GameManager:
         }
     
     def modify_player_stat(self, value_type: PlayerStat, amount: int, trigger_event:bool =False, repeat:int =1) -> None:
-        """해당 플레이어 능력치를 amount만큼 변화."""
-        if self.__game_end: return
-        for _ in range(repeat):
-            previous = 0
-            current = 0
-            match (value_type):
-                case PlayerStat.Money:
-                    previous = self.__game_state.player_money
-                    self.__game_state.player_money = max(previous+amount, 0)
-                    current = self.__game_state.player_money
-                case PlayerStat.Health:
-                    previous = self.__game_state.player_health
-                    self.__game_state.player_health = max(previous+amount, 0)
-                    current = self.__game_state.player_health
-                case PlayerStat.Attack:
-                    previous = self.__game_state.player_attack
-                    self.__game_state.player_attack= max(previous+amount, 0)
-                    current = self.__game_state.player_attack
-                case PlayerStat.Action:
-                    previous = self.__game_state.player_action
-                    self.__game_state.player_action= max(previous+amount, 0)
-                    current = self.__game_state.player_action
+        """해당 플레이어 능력치를 amount만큼 변화. repeat번 반복한 것과 같은 값이 됨.
+        per_step_stat_updates가 거짓이면 한 번에 적용함. (능력치는 0 미만이 되지 않으므로 결과는 같음.)"""
+        if self.__game_end or repeat <= 0: return
+        steps: List[int] = [amount] * repeat if self.per_step_stat_updates else [amount * repeat]
+        for delta in steps:
+            previous: int = self.__game_state.get_stat(value_type)
+            current: int = max(previous + delta, 0)
+            self.__game_state.set_stat(value_type, current)
             if trigger_event:
                 self.__event_manager.on_player_stat_changed(value_type, previous, current)
             self.__event_manager.push_draw_event(DrawEvent(
@@ -294,11 +517,10 @@ class GameManager:
         if self.__game_end:
             # 체력이 고갈되지 않았으며 게임이 끝났다면 승리한 것.
             return
-        lose = True
-        for card in self.__deck.get_cards():
-            if self.can_buy_card(card):
-                lose = False
-                break
+        lose = not self.__deck.purchasable.any_purchasable(
+            self.__game_state.player_money,
+            self.__game_state.player_health + self.__game_state.player_attack
+        )
         # if lose:
             # for item in self.__inventory.get_items():
             #     if self.can_use_item(item):
@@ -309,6 +531,10 @@ class GameManager:
         if lose:
             self.lose_game(due_to_health=False)
             return
+        if self.autosave:
+            self._autosave()
+
+    def _autosave(self) -> None:
         self.save(SAVEFILE_PATH, f"autosave_{self.__game_id}.json")
 
     def add_item(self, item_data: ItemData, amount: int = 1, repeat: int =1):
@@ -327,6 +553,39 @@ class GameManager:
         else:
             return self.__game_state.player_money >= card.modified_cost
 
+    def purchasable_ids(self) -> List[int]:
+        """현재 구매할 수 있는(can_buy_card가 참인) 카드의 id 목록. 비용 순으로 정렬됨. 남은 행동 횟수는 고려하지 않음."""
+        if self.__game_end:
+            return []
+        return self.__deck.purchasable.purchasable_ids(
+            self.__game_state.player_money,
+            self.__game_state.player_health + self.__game_state.player_attack
+        )
+
+    def purchasable_mask(self) -> Tuple[int, int]:
+        """구매할 수 있는 카드의 덱 위치를 비트로 나타낸 값과 그 버전을 반환.
+        i번째 비트가 1이면 덱의 i번째 카드를 구매할 수 있음. 버전은 비트마스크가 바뀔 때만 증가하므로,
+        화면 등에서는 버전이 같으면 다시 계산하지 않아도 됨.
+        :return: (버전, 비트마스크)"""
+        key: tuple = (
+            self.__deck.purchasable.version,
+            self.__game_state.player_money,
+            self.__game_state.player_health + self.__game_state.player_attack,
+            self.__game_end
+        )
+        cached_key, version, mask = self.__purchasable_cache
+        if key != cached_key:
+            ids: set = set(self.purchasable_ids())
+            new_mask: int = 0
+            for index, card in enumerate(self.__deck.get_cards()):
+                if card.id in ids:
+                    new_mask |= 1 << index
+            if new_mask != mask:
+                version += 1
+            self.__purchasable_cache = (key, version, new_mask)
+            mask = new_mask
+        return version, mask
+
     def buy_card(self, id: int) -> bool:
         """(가능하다면) 주어진 id의 카드를 구매함."""
         if self.__game_end or self.__game_state.player_remaining_action <= 0: return False
@@ -437,6 +696,60 @@ class GameManager:
 
         return True
 
+    def apply_action(self, action: Action) -> bool:
+        """주어진 행동을 실행. 재현이나 자동 진행처럼 id 대신 위치로 대상을 지정할 때 사용.
+        :return: 행동이 실제로 실행되었는지 여부."""
+        match (action.action_type):
+            case ActionType.BuyCard:
+                card: Optional[Card] = self.__deck.get_card_at(action.index)
+                return card is not None and self.buy_card(card.id)
+            case ActionType.UseItem:
+                item: Optional[Item] = self.__inventory.get_item_at(action.index)
+                return item is not None and self.use_item(item.id)
+            case ActionType.EndTurn:
+                if self.__game_end: return False
+                self.end_turn()
+                self.after_action()
+                return True
+        return False
+
+    def apply_actions(self, actions: Iterable[Action]) -> ActionBatchResult:
+        """주어진 행동들을 순서대로 실행. 각 행동의 합법성 검사, 비용 재계산, 패배 검사와 효과 이벤트는
+        apply_action을 하나씩 호출한 것과 같으나, 자동 저장은 묶음이 끝난 후 한 번만 수행함.
+        실행할 수 없는 행동은 건너뛰며, 게임이 끝난 후의 행동은 모두 거부됨.
+        :return: 행동별 실행 여부와 묶음 동안 발생한 DrawEvent.
+        DrawEvent는 묶음 동안만 유지하는 구독으로 모으므로, 다른 구독자와 get_draw_events에도 평소대로 전달됨."""
+        autosave: bool = self.autosave
+        self.autosave = False
+        draw_events: List[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData] = []
+        with self.subscribe_draw_events(callback=draw_events.append):
+            try:
+                results: List[bool] = [self.apply_action(action) for action in actions]
+            finally:
+                self.autosave = autosave
+            # after_action과 같이 게임이 끝났다면 저장하지 않음.
+            if autosave and any(results) and not self.__game_end:
+                self._autosave()
+        return ActionBatchResult(results, draw_events)
+
+    def get_legal_actions(self, allow_end_turn: bool = True) -> List[Action]:
+        """현재 실행할 수 있는 행동의 목록을 반환.
+        :param allow_end_turn: 거짓인 경우 턴 종료를 포함하지 않음. (게임 화면에서는 직접 턴을 넘길 수 없음.)"""
+        if self.__game_end:
+            return []
+        actions: List[Action] = []
+        if self.__game_state.player_remaining_action > 0:
+            _, mask = self.purchasable_mask()
+            actions += [Action(ActionType.BuyCard, index) 
+                        for index in range(mask.bit_length()) 
+                        if mask >> index & 1]
+            actions += [Action(ActionType.UseItem, index) 
+                        for index, item in enumerate(self.__inventory.get_items()) 
+                        if self.can_use_item(item.id)]
+        if allow_end_turn:
+            actions.append(Action(ActionType.EndTurn))
+        return actions
+
     # def can_end_turn(self) -> bool:
     #     """현재 턴을 넘길 수 있는 상태인지 검사."""
     
@@ -482,6 +795,7 @@ class GameManager:
             0, 0, 0
         ))
         self.__game_end = True
+        self.__result = GameResult.Won
 
     def lose_game(self, due_to_health: bool) -> None:
         """게임을 패배한 것으로 처리.
@@ -491,4 +805,5 @@ class GameManager:
             (0 if due_to_health else 1), 0, 0
         ))
         self.__game_end = True
+        self.__result = GameResult.LostByHealth if due_to_health else GameResult.LostByNoAction
     
\ No newline at end of file
@@ -5,7 +5,8 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKIN
 
 from core.item import Item
 from core.enums import DrawEventType
-from core.obj_data_formats import DrawEvent, ItemData, ItemDrawData, ItemSaveData
+from core.obj_data_formats import DrawEvent, ItemData, ItemSaveData
+from core.state_hash import StateHasher, item_key
 from core.utils import Comparable
 
 if TYPE_CHECKING:
@@ -17,14 +18,24 @@ class Inventory:
     게임 속 플레이어가 보유하고 있는 아이템이 나열된 인벤토리.
     아이템을 관리하고, 효과 스크립트가 아이템에 접근할 수 있는 기능 제공.
     """
-    def __init__(self, event_manager: "EventManager", items: List[Tuple[ItemData, ItemSaveData]]) -> None:
+    def __init__(self, event_manager: "EventManager", items: List[Tuple[ItemData, ItemSaveData]], hasher: Optional[StateHasher] = None) -> None:
         self.__event_manager: "EventManager" = event_manager
+        self.__hasher: Optional[StateHasher] = hasher
         self.__items: List[Item] = [Item.from_save_data(data, save).register_event(event_manager) for data, save in items]
+        if hasher is not None:
+            for item in self.__items:
+                hasher.add(item_key(item.item_data.id))
 
     def get_items(self, query: Optional[Callable[[Item], bool]] = None) -> List[Item]:
         """조건에 맞는 아이템의 목록을 반환."""
         return list(filter(query, self.__items)) if query is not None else self.__items.copy()
 
+    def get_item_at(self, index: int) -> Optional[Item]:
+        """주어진 위치에 있는 아이템을 반환한다. 범위를 벗어나면 None 반환."""
+        if not 0 <= index < len(self.__items):
+            return None
+        return self.__items[index]
+
     def get_item_by_id(self, id: int) -> Optional[Item]:
         """주어진 id에 해당하는 아이템을 찾아 반환한다."""
         items: List[Item] = [item for item in self.__items if item.id == id]
@@ -36,13 +47,10 @@ class Inventory:
         """목록의 맨 끝에 아이템 추가."""
         item: Item = Item(item_data).register_event(self.__event_manager)
         self.__items.append(item)
+        if self.__hasher is not None:
+            self.__hasher.add(item_key(item_data.id))
         self.__event_manager.on_item_created(item)
-        self.__event_manager.push_draw_event(ItemDrawData(
-            item.id,
-            item.item_data.name,
-            item.item_data.sprite_name,
-            item.item_data.description
-        ))
+        self.__event_manager.push_draw_event(item.to_draw_data())
 
     def get_readable_static_table(self) -> Dict[str, Any]:
         """효과 스크립팅에서 사용 가능한 정적 변수/함수 목록 반환(읽기 전용)."""
@@ -67,6 +75,8 @@ class Inventory:
         for item in self.__items:
             if item.id in target_ids:
                 result.remove(item)
+                if self.__hasher is not None:
+                    self.__hasher.remove(item_key(item.item_data.id))
                 self.__event_manager.on_item_destroyed(item)
                 self.__event_manager.push_draw_event(DrawEvent(
                     DrawEventType.ItemDestroyed,
@@ -1,6 +1,6 @@
 from typing import Callable
 from core.effect import Effect, EffectHolder
-from core.obj_data_formats import ItemData, ItemSaveData
+from core.obj_data_formats import ItemData, ItemDrawData, ItemSaveData
 
 
 class Item(EffectHolder):
@@ -20,4 +20,7 @@ class Item(EffectHolder):
         return Item(item_data)
 
     def to_save_data(self) -> ItemSaveData:
-        return ItemSaveData(self.item_data.id)
\ No newline at end of file
+        return ItemSaveData(self.item_data.id)
+
+    def to_draw_data(self) -> ItemDrawData:
+        return ItemDrawData(self.id, self.item_data)
\ No newline at end of file
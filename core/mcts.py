@@ -0,0 +1,165 @@
+"""
+몬테카를로 트리 탐색(MCTS)으로 현재 상태에서 가장 유망한 행동을 추천하는 스크립트.
+주어진 시간 동안만 탐색하며, 다른 스레드에서 취소할 수 있음.
+GameManager의 저장 내용(to_save_tree)에서 출발하므로 원래 게임에는 영향을 주지 않음.
+플레이어가 모르는 정보로 추천하지 않도록, 진행마다 뒷면 카드끼리 자리를 섞고 저장된 난수 상태 대신 새 시드를 사용함.
+"""
+import math
+import time
+import random
+import threading
+from dataclasses import dataclass
+from typing import Final, List, Optional
+
+from core.enums import GameResult
+from core.game_manager import GameManager
+from core.obj_data_formats import Action
+
+
+DEFAULT_EXPLORATION: Final[float] = 1.4
+DEFAULT_ROLLOUT_TURNS: Final[int] = 20
+
+
+class _Node:
+    """탐색 트리의 노드. 부모 상태에서 action을 실행한 상태를 나타냄."""
+    __slots__ = ("action", "parent", "children", "untried", "visits", "reward")
+
+    def __init__(self, action: Optional[Action], parent: Optional["_Node"]) -> None:
+        self.action: Optional[Action] = action
+        self.parent: Optional[_Node] = parent
+        self.children: List[_Node] = []
+        self.untried: Optional[List[Action]] = None
+        """아직 펼치지 않은 행동. 처음 방문하기 전에는 None."""
+        self.visits: int = 0
+        self.reward: float = 0.0
+
+    def best_child(self, exploration: float) -> "_Node":
+        """UCT 값이 가장 큰 자식 노드."""
+        log_visits: float = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda child: child.reward / child.visits + exploration * math.sqrt(log_visits / child.visits)
+        )
+
+
+@dataclass
+class MCTSResult:
+    """탐색 결과."""
+    action: Optional[Action]
+    """추천 행동. 가능한 행동이 없으면 None."""
+    win_rate: float
+    """추천 행동의 평균 보상(승리 시 1에 가까움)."""
+    playouts: int
+    elapsed: float
+    cancelled: bool = False
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class MonteCarloSearch:
+    """저장 내용으로 주어진 한 상태에서 시작하는 MCTS."""
+    def __init__(
+            self,
+            tree: dict,
+            exploration: float = DEFAULT_EXPLORATION,
+            rollout_turns: int = DEFAULT_ROLLOUT_TURNS,
+            seed: Optional[int] = None
+            ) -> None:
+        """MonteCarloSearch의 초기화 메소드. 카드 데이터는 미리 불러와 있어야 함(cdm.initialize()).
+        :param tree: 탐색을 시작할 게임 상태. GameManager.to_save_tree()의 결과.
+        :param exploration: UCT의 탐험 계수.
+        :param rollout_turns: 무작위 진행을 몇 턴 후까지 할지. 그때까지 승리하지 못하면 보상 0.
+        :param seed: 무작위 진행과 뒷면 카드 배치에 사용할 시드."""
+        self.tree: dict = {key: value for key, value in tree.items() if key != "rng_state"}
+        """탐색을 시작할 게임 상태. 플레이어가 알 수 없는 난수 상태는 버림."""
+        self.__hidden: List[int] = [index for index, card in enumerate(tree["deck"]) if not card["is_front_face"]]
+        """뒷면 카드의 위치."""
+        self.exploration: float = exploration
+        self.rollout_turns: int = rollout_turns
+        self.__rng = random.Random(seed)
+        self.__root = _Node(None, None)
+        self.__start_turn: int = tree.get("current_turn", 1)
+
+    def _restore(self) -> GameManager:
+        """플레이어가 아는 정보만으로 가능한 게임 하나를 만듦. 뒷면 카드는 서로 자리를 섞고, 난수는 진행마다 새로 정함."""
+        tree: dict = self.tree
+        if len(self.__hidden) > 1:
+            deck: List[dict] = list(tree["deck"])
+            hidden: List[dict] = [deck[index] for index in self.__hidden]
+            self.__rng.shuffle(hidden)
+            for index, card in zip(self.__hidden, hidden):
+                deck[index] = card
+            tree = dict(tree, deck=deck)
+        return GameManager.create_from_tree(tree, seed=self.__rng.randrange(2**32), autosave=False)
+
+    def _legal_actions(self, game: GameManager) -> List[Action]:
+        # 게임 화면과 같이 직접 턴을 넘기지는 않지만, 할 수 있는 행동이 없으면 턴 종료를 허용.
+        actions: List[Action] = game.get_legal_actions(allow_end_turn=False)
+        return actions if len(actions) > 0 else game.get_legal_actions(allow_end_turn=True)
+
+    def _reward(self, game: GameManager) -> float:
+        if game.result != GameResult.Won:
+            return 0.0
+        # 빨리 이길수록 높은 보상.
+        return 1.0 - 0.5 * min(game.current_turn - self.__start_turn, self.rollout_turns) / self.rollout_turns
+
+    def playout(self) -> None:
+        """선택, 확장, 무작위 진행, 역전파를 한 번 수행."""
+        game: GameManager = self._restore()
+        node: _Node = self.__root
+
+        # 선택. 경로는 트리만 보고 정해지므로 모아서 한 번에 실행.
+        path: List[Action] = []
+        while node.untried is not None and len(node.untried) == 0 and len(node.children) > 0:
+            node = node.best_child(self.exploration)
+            # 루트가 아닌 노드는 항상 행동을 가짐.
+            assert node.action is not None
+            path.append(node.action)
+        game.apply_actions(path)
+        # 확장
+        if node.untried is None:
+            node.untried = self._legal_actions(game)
+            self.__rng.shuffle(node.untried)
+        if len(node.untried) > 0 and not game.game_end:
+            action: Action = node.untried.pop()
+            child = _Node(action, node)
+            node.children.append(child)
+            node = child
+            game.apply_action(action)
+        # 무작위 진행
+        turn_limit: int = self.__start_turn + self.rollout_turns
+        while not game.game_end and game.current_turn <= turn_limit:
+            actions: List[Action] = self._legal_actions(game)
+            if len(actions) == 0:
+                break
+            game.apply_action(self.__rng.choice(actions))
+        # 역전파
+        reward: float = self._reward(game)
+        backtrack: Optional[_Node] = node
+        while backtrack is not None:
+            backtrack.visits += 1
+            backtrack.reward += reward
+            backtrack = backtrack.parent
+
+    def run(self, time_budget: float, cancel: Optional[threading.Event] = None) -> MCTSResult:
+        """time_budget초 동안(또는 cancel이 설정될 때까지) 탐색하고 결과를 반환."""
+        started: float = time.perf_counter()
+        deadline: float = started + time_budget
+        playouts: int = 0
+        while time.perf_counter() < deadline:
+            if cancel is not None and cancel.is_set():
+                break
+            self.playout()
+            playouts += 1
+            # 가능한 행동이 하나뿐이거나 없으면 더 볼 필요가 없음.
+            if self.__root.untried is not None and len(self.__root.untried) + len(self.__root.children) <= 1:
+                break
+
+        elapsed: float = time.perf_counter() - started
+        cancelled: bool = cancel is not None and cancel.is_set()
+        if len(self.__root.children) == 0:
+            return MCTSResult(None, 0.0, playouts, elapsed, cancelled)
+        best: _Node = max(self.__root.children, key=lambda child: child.visits)
+        return MCTSResult(best.action, best.reward / best.visits, playouts, elapsed, cancelled)
@@ -3,9 +3,9 @@
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from core.enums import CardType, DrawEventType, EffectTarget, EventType
+from core.enums import ActionType, CardType, DrawEventType, EffectTarget, EventType
 
 
 @dataclass(frozen=True)
@@ -65,24 +65,51 @@ class ItemSaveData:
 
 @dataclass
 class CardDrawData:
-    """외부 모듈이 카드를 그리기 위한 정보."""
+    """외부 모듈이 카드를 그리기 위한 정보.
+    이름, 설명 등 바뀌지 않는 정보는 문자열을 복사하지 않고 공유하는 CardData에서 읽어 옴."""
     id: int
-    name: str
-    type: CardType
-    base_cost: int
+    card_data: CardData
     current_cost: int
     is_front_face: bool
-    sprite_name: str
-    description: str
+
+    @property
+    def name(self) -> str:
+        return self.card_data.name
+
+    @property
+    def type(self) -> CardType:
+        return self.card_data.type
+
+    @property
+    def base_cost(self) -> int:
+        return self.card_data.cost
+
+    @property
+    def sprite_name(self) -> str:
+        return self.card_data.sprite_name
+
+    @property
+    def description(self) -> str:
+        return self.card_data.description
 
 
 @dataclass
 class ItemDrawData:
-    """외부 모듈이 아이템을 그리기 위한 정보."""
+    """외부 모듈이 아이템을 그리기 위한 정보. 바뀌지 않는 정보는 공유하는 ItemData에서 읽어 옴."""
     id: int
-    name: str
-    sprite_name: str
-    description: str
+    item_data: ItemData
+
+    @property
+    def name(self) -> str:
+        return self.item_data.name
+
+    @property
+    def sprite_name(self) -> str:
+        return self.item_data.sprite_name
+
+    @property
+    def description(self) -> str:
+        return self.item_data.description
 
 
 @dataclass
@@ -99,6 +126,52 @@ class GameDrawState:
     current_turn: int
     deck: List[CardDrawData]
     inventory: List[ItemDrawData]
+    version: int = 0
+    """이 상태를 만든 시점의 버전. GameManager.get_delta_since에 전달해 이후의 변경만 받을 수 있음."""
+
+    def apply_delta(self, delta: "GameDrawDelta") -> None:
+        """get_delta_since로 받은 변경 사항을 이 상태에 반영."""
+        if delta.stats is not None:
+            for key, value in delta.stats.items():
+                setattr(self, key, value)
+        cards: Dict[int, CardDrawData] = {card.id: card for card in self.deck}
+        for card in delta.cards:
+            cards[card.id] = card
+        for id in delta.removed_cards:
+            cards.pop(id, None)
+        order: List[int] = delta.deck_order if delta.deck_order is not None else [card.id for card in self.deck]
+        self.deck = [cards[id] for id in order if id in cards]
+        if delta.full:
+            self.inventory = list(delta.items)
+        else:
+            removed_items = set(delta.removed_items)
+            self.inventory = [item for item in self.inventory if item.id not in removed_items] + delta.items
+        self.version = delta.version
+
+
+@dataclass
+class GameDrawDelta:
+    """어떤 버전 이후로 바뀐 게임 상태. GameManager.get_delta_since의 반환값."""
+    version: int
+    """현재 버전. 다음 get_delta_since 호출에 사용."""
+    stats: Optional[Dict[str, int]]
+    """플레이어 능력치와 턴 등. GameDrawState의 속성 이름을 키로 사용. 바뀌지 않았다면 None."""
+    deck_order: Optional[List[int]]
+    """덱의 카드 id 순서. 순서가 바뀌지 않았다면 None."""
+    cards: List[CardDrawData]
+    """바뀌었거나 새로 생긴 카드의 현재 정보."""
+    removed_cards: List[int]
+    items: List[ItemDrawData]
+    """새로 생긴 아이템. 인벤토리 끝에 추가됨."""
+    removed_items: List[int]
+    full: bool = False
+    """참이면 요청한 버전 이후의 삭제 기록이 남아 있지 않아 전체 상태를 담음.
+    removed_cards/removed_items는 비어 있으므로, deck_order와 items에 없는 카드와 아이템을 지워야 함."""
+
+    @property
+    def is_empty(self) -> bool:
+        return self.stats is None and self.deck_order is None and len(self.cards) + len(self.removed_cards) \
+            + len(self.items) + len(self.removed_items) == 0
 
 
 @dataclass
@@ -108,4 +181,48 @@ class DrawEvent:
     event_type: DrawEventType
     target_id: int
     previous: int
-    current: int
\ No newline at end of file
+    current: int
+
+@dataclass
+class DrawEventBatch:
+    """같은 종류의 DrawEvent 여러 개를 합친 것. 합치기를 사용하는 구독에서만 전달됨.
+    반복하면 대상마다 합쳐진 DrawEvent(처음의 previous, 마지막 current)를 처음 발생한 순서대로 꺼냄."""
+    event_type: DrawEventType
+    events: Dict[int, DrawEvent]
+    """대상 id(능력치의 경우 PlayerStat 값) -> 합쳐진 DrawEvent."""
+
+    def merge(self, event: DrawEvent) -> DrawEvent:
+        """이벤트를 합치고 합쳐진 결과를 반환. 다른 구독자와 공유하므로 주어진 이벤트는 수정하지 않음."""
+        previous: Optional[DrawEvent] = self.events.get(event.target_id)
+        if previous is not None:
+            event = DrawEvent(event.event_type, event.target_id, previous.previous, event.current)
+        self.events[event.target_id] = event
+        return event
+
+    def __iter__(self) -> Iterator[DrawEvent]:
+        return iter(self.events.values())
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+@dataclass(frozen=True)
+class Action:
+    """플레이어의 행동 하나를 표현하는 자료구조.
+    카드/아이템은 id가 아닌 위치로 지정하므로, 같은 시드의 게임에서 그대로 다시 실행할 수 있음."""
+    action_type: ActionType
+    index: int = -1
+
+
+@dataclass
+class ActionBatchResult:
+    """GameManager.apply_actions의 실행 결과."""
+    results: List[bool]
+    """각 행동이 실제로 실행되었는지 여부. 주어진 행동과 같은 순서."""
+    draw_events: List[DrawEvent | Tuple[CardDrawData, int] | ItemDrawData]
+    """묶음 동안 발생한 DrawEvent. get_draw_events의 반환값과 같은 형식."""
+
+    @property
+    def executed(self) -> int:
+        """실제로 실행된 행동의 수."""
+        return sum(self.results)
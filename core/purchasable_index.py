@@ -0,0 +1,61 @@
+"""
+덱에서 앞면인 카드를 비용 순으로 정렬해 두어, 현재 능력치로 구매할 수 있는 카드를 빠르게 찾는 색인.
+적 카드는 체력+공격력과, 나머지 카드는 소지금과 비용을 비교하므로 두 목록으로 나누어 관리함.
+카드의 비용/앞뒷면/위치가 바뀔 때마다 Card가 직접 갱신함.
+"""
+from bisect import bisect_right, insort
+from typing import List, Tuple, TYPE_CHECKING
+
+from core.enums import CardType
+
+if TYPE_CHECKING:
+    from core.card import Card
+
+
+class PurchasableIndex:
+    """앞면인 카드의 (비용, id) 정렬 목록."""
+    def __init__(self) -> None:
+        self.__enemies: List[Tuple[int, int]] = []
+        self.__others: List[Tuple[int, int]] = []
+        self.version: int = 0
+        """앞면인 카드의 구성, 비용, 위치 중 하나라도 바뀔 때마다 증가."""
+
+    def _entries(self, card: "Card") -> List[Tuple[int, int]]:
+        return self.__enemies if card.card_data.type == CardType.Enemy else self.__others
+
+    def add(self, card: "Card") -> None:
+        """덱에 들어온 카드를 등록."""
+        if card.is_front_face:
+            insort(self._entries(card), (card.modified_cost, card.id))
+        self.version += 1
+
+    def remove(self, card: "Card") -> None:
+        """덱에서 빠지는 카드를 제거."""
+        if card.is_front_face:
+            self._entries(card).remove((card.modified_cost, card.id))
+        self.version += 1
+
+    def update(self, card: "Card", previous_cost: int, previous_front_face: bool) -> None:
+        """카드의 비용이나 앞/뒷면이 바뀐 후 호출."""
+        entries = self._entries(card)
+        if previous_front_face:
+            entries.remove((previous_cost, card.id))
+        if card.is_front_face:
+            insort(entries, (card.modified_cost, card.id))
+        self.version += 1
+
+    def touch(self, card: "Card") -> None:
+        """카드의 위치가 바뀐 후 호출. 앞면인 카드만 구매 가능 위치에 영향을 줌."""
+        if card.is_front_face:
+            self.version += 1
+
+    def any_purchasable(self, money: int, strength: int) -> bool:
+        """소지금이 money, 체력+공격력이 strength일 때 구매할 수 있는 카드가 있는지 여부. O(1)."""
+        return (len(self.__enemies) > 0 and self.__enemies[0][0] <= strength) \
+            or (len(self.__others) > 0 and self.__others[0][0] <= money)
+
+    def purchasable_ids(self, money: int, strength: int) -> List[int]:
+        """소지금이 money, 체력+공격력이 strength일 때 구매할 수 있는 카드의 id 목록. 비용 순으로 정렬됨."""
+        enemies = self.__enemies[:bisect_right(self.__enemies, (strength, float("inf")))]
+        others = self.__others[:bisect_right(self.__others, (money, float("inf")))]
+        return [id for _, id in enemies] + [id for _, id in others]
@@ -0,0 +1,167 @@
+"""
+기록된 게임을 (레벨, 시드, 행동 목록)으로부터 화면 없이 다시 실행하고 검증하는 스크립트.
+매 행동마다 게임 상태의 지문을 비교하므로 회귀 검사와 성능 측정에 함께 사용할 수 있음.
+
+사용 예: python -m core.replay data/replays/<파일>.json --repeat 10
+"""
+import sys
+import json
+import time
+import argparse
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import core.card_data_manager as cdm
+from core.enums import ActionType
+from core.game_manager import GameManager
+from core.obj_data_formats import Action
+
+
+REPLAY_PATH: str = "data/replays"
+"""재현 파일을 저장하는 기본 경로."""
+
+
+@dataclass
+class ReplayData:
+    """재현에 필요한 정보.
+    hashes[0]은 시작 상태의, hashes[i+1]은 i번째 행동 직후 상태의 지문."""
+    level_path: str
+    seed: int
+    actions: List[Action] = field(default_factory=list)
+    hashes: List[int] = field(default_factory=list)
+
+    def to_tree(self) -> dict:
+        """json으로 저장할 수 있는 dict로 변환."""
+        return {
+            "level_path": self.level_path,
+            "seed": self.seed,
+            "actions": [[action.action_type.name, action.index] for action in self.actions],
+            "hashes": self.hashes
+        }
+
+    @staticmethod
+    def from_tree(tree: dict) -> "ReplayData":
+        """to_tree로 만든 dict로부터 ReplayData 생성."""
+        return ReplayData(
+            tree["level_path"],
+            tree["seed"],
+            [Action(ActionType[name], index) for name, index in tree["actions"]],
+            tree["hashes"] if "hashes" in tree else []
+        )
+
+    def save(self, path: str) -> None:
+        """주어진 경로의 파일에 저장."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_tree(), f)
+
+    @staticmethod
+    def load(path: str) -> "ReplayData":
+        """주어진 경로의 파일에서 불러옴."""
+        with open(path, encoding="utf-8") as f:
+            return ReplayData.from_tree(json.load(f))
+
+
+@dataclass
+class ReplayResult:
+    """재현 실행 결과."""
+    executed_actions: int
+    elapsed: float
+    mismatch_step: Optional[int] = None
+    """지문이 처음으로 어긋난 단계. 0은 시작 상태, i+1은 i번째 행동 직후. 일치하면 None."""
+    rejected_step: Optional[int] = None
+    """게임이 거부한(실행되지 않은) 첫 행동의 번호. 모두 실행되었다면 None."""
+
+    @property
+    def verified(self) -> bool:
+        """기록과 완전히 일치하게 재현되었는지 여부."""
+        return self.mismatch_step is None and self.rejected_step is None
+
+    @property
+    def actions_per_second(self) -> float:
+        return self.executed_actions / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def load_game(level_path: str, seed: int) -> GameManager:
+    """자동 저장을 끈 채로 레벨을 불러옴. 카드 데이터는 미리 불러와 있어야 함."""
+    with open(level_path, encoding="utf-8") as f:
+        tree: dict = json.load(f)
+    return GameManager.create_from_tree(tree, seed, autosave=False)
+
+
+def record(level_path: str, seed: int, actions: List[Action]) -> ReplayData:
+    """주어진 행동을 실행하면서 각 단계의 지문을 기록한 ReplayData 생성.
+    게임이 거부한 행동은 기록하지 않음."""
+    cdm.initialize()
+    game: GameManager = load_game(level_path, seed)
+    data = ReplayData(level_path, seed, [], [game.state_hash()])
+    for action in actions:
+        if not game.apply_action(action):
+            continue
+        data.actions.append(action)
+        data.hashes.append(game.state_hash())
+        # 재현에는 필요 없는 DrawEvent가 쌓이지 않도록 비움.
+        game.get_draw_events()
+    return data
+
+
+def run_replay(data: ReplayData, verify: bool = True) -> ReplayResult:
+    """기록된 행동을 최대한 빠르게 다시 실행.
+    verify가 참이고 기록된 지문이 있다면 매 단계 비교하며, 처음 어긋난 지점에서 멈춤.
+    카드 데이터는 미리 불러와 있어야 함(cdm.initialize())."""
+    verify = verify and len(data.hashes) == len(data.actions) + 1
+    started: float = time.perf_counter()
+    game: GameManager = load_game(data.level_path, data.seed)
+    if verify and game.state_hash() != data.hashes[0]:
+        return ReplayResult(0, time.perf_counter() - started, mismatch_step=0)
+
+    if not verify:
+        # 단계별로 비교할 것이 없으므로 한 번에 실행.
+        results: List[bool] = game.apply_actions(data.actions).results
+        elapsed: float = time.perf_counter() - started
+        if not all(results):
+            rejected: int = results.index(False)
+            return ReplayResult(rejected, elapsed, rejected_step=rejected)
+        return ReplayResult(len(data.actions), elapsed)
+
+    for step, action in enumerate(data.actions):
+        if not game.apply_action(action):
+            return ReplayResult(step, time.perf_counter() - started, rejected_step=step)
+        game.get_draw_events()
+        if verify and game.state_hash() != data.hashes[step + 1]:
+            return ReplayResult(step + 1, time.perf_counter() - started, mismatch_step=step + 1)
+
+    return ReplayResult(len(data.actions), time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="기록된 게임을 다시 실행하고 검증합니다.")
+    parser.add_argument("path", help="재현 파일 경로")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 실행 횟수(성능 측정용)")
+    parser.add_argument("--no-verify", action="store_true", help="지문 비교를 생략")
+    parser.add_argument("--debug-hash", action="store_true", help="점진적으로 갱신한 지문을 매번 처음부터 다시 계산해 검사")
+    args = parser.parse_args()
+    GameManager.debug_state_hash = args.debug_hash
+
+    cdm.initialize()
+    data: ReplayData = ReplayData.load(args.path)
+    total_actions: int = 0
+    total_elapsed: float = 0.0
+    for _ in range(args.repeat):
+        result: ReplayResult = run_replay(data, verify=not args.no_verify)
+        total_actions += result.executed_actions
+        total_elapsed += result.elapsed
+        if not result.verified:
+            if result.mismatch_step is not None:
+                print(f"불일치: {result.mismatch_step}번째 단계의 상태가 기록과 다릅니다.")
+            else:
+                print(f"불일치: {result.rejected_step}번째 행동이 거부되었습니다.")
+            sys.exit(1)
+
+    print(
+        f"검증 완료: 행동 {len(data.actions)}개 x {args.repeat}회, "
+        f"{total_elapsed:.3f}초 ({total_actions / total_elapsed if total_elapsed > 0 else float('inf'):.1f} actions/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+화면이나 CLI 없이 GameManager를 직접 진행하며 레벨을 대량으로 시뮬레이션하는 스크립트.
+정책(Policy)을 바꿔 끼워 가며 승률, 승리까지 걸린 턴, 패배 원인, 카드별 구매 빈도 등을 집계함.
+레벨 밸런스 조정과 엔진 성능 측정(games/s)에 사용.
+
+사용 예: python -m core.simulation data/levels/tutorial_0.json --games 2000 --policy greedy
+"""
+import os
+import json
+import time
+import random
+import argparse
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Final, List, Optional, Sequence
+
+import core.card_data_manager as cdm
+from core.card import Card
+from core.enums import ActionType, GameResult
+from core.game_manager import GameManager
+from core.obj_data_formats import Action
+
+
+DEFAULT_MAX_TURNS: Final[int] = 100
+"""한 게임의 최대 턴 수. 이를 넘기면 시간 초과로 처리함."""
+
+
+class Policy(ABC):
+    """현재 게임 상태를 보고 다음 행동을 고르는 정책의 기본 클래스.
+    여러 프로세스에 전달되므로 pickle 가능한 속성만 가져야 함."""
+    allow_end_turn: bool = False
+    """정책이 직접 턴을 넘길 수 있는지 여부. 게임 화면과 같이 기본값은 거짓."""
+
+    def reset(self, rng: random.Random) -> None:
+        """새 게임을 시작할 때 호출됨."""
+        pass
+
+    @abstractmethod
+    def choose(self, game: GameManager, actions: List[Action], rng: random.Random) -> Action:
+        """가능한 행동 목록(비어 있지 않음) 중 하나를 골라 반환."""
+
+
+class RandomPolicy(Policy):
+    """가능한 행동 중 하나를 무작위로 고름."""
+    def choose(self, game: GameManager, actions: List[Action], rng: random.Random) -> Action:
+        return rng.choice(actions)
+
+
+class GreedyCostPolicy(Policy):
+    """구매할 수 있는 카드 중 비용이 가장 높은(prefer_expensive가 거짓이면 가장 낮은) 카드를 고름.
+    구매할 카드가 없으면 아이템 중 하나를 무작위로, 그마저 없으면 턴 종료를 선택함."""
+    def __init__(self, prefer_expensive: bool = True) -> None:
+        self.prefer_expensive: bool = prefer_expensive
+
+    def choose(self, game: GameManager, actions: List[Action], rng: random.Random) -> Action:
+        buys: List[Action] = [action for action in actions if action.action_type == ActionType.BuyCard]
+        if len(buys) > 0:
+            def cost(action: Action) -> int:
+                card: Optional[Card] = game.deck.get_card_at(action.index)
+                return 0 if card is None else card.modified_cost
+            return max(buys, key=cost) if self.prefer_expensive else min(buys, key=cost)
+        uses: List[Action] = [action for action in actions if action.action_type == ActionType.UseItem]
+        return rng.choice(uses) if len(uses) > 0 else actions[-1]
+
+
+class ScriptedPolicy(Policy):
+    """미리 정해진 행동을 순서대로 실행. 실행할 수 없는 행동은 건너뛰며, 목록이 끝나면 fallback 정책을 따름."""
+    allow_end_turn = True
+
+    def __init__(self, script: Sequence[Action], fallback: Optional[Policy] = None) -> None:
+        self.script: List[Action] = list(script)
+        self.fallback: Policy = fallback if fallback is not None else GreedyCostPolicy()
+        self._cursor: int = 0
+
+    def reset(self, rng: random.Random) -> None:
+        self._cursor = 0
+        self.fallback.reset(rng)
+
+    def choose(self, game: GameManager, actions: List[Action], rng: random.Random) -> Action:
+        while self._cursor < len(self.script):
+            action: Action = self.script[self._cursor]
+            self._cursor += 1
+            if action in actions:
+                return action
+        if not self.fallback.allow_end_turn:
+            actions = [action for action in actions if action.action_type != ActionType.EndTurn] or actions
+        return self.fallback.choose(game, actions, rng)
+
+
+POLICIES: Final[Dict[str, type]] = {
+    "random": RandomPolicy,
+    "greedy": GreedyCostPolicy,
+}
+"""명령줄에서 이름으로 선택할 수 있는 정책 목록."""
+
+
+@dataclass
+class GameRecord:
+    """게임 한 판의 결과."""
+    result: GameResult
+    turns: int
+    actions: int
+    purchases: Dict[int, int]
+    """구매한 카드의 데이터 id별 횟수."""
+
+
+@dataclass
+class SimulationStats:
+    """여러 게임의 결과를 집계한 통계."""
+    games: int = 0
+    wins: int = 0
+    losses_by_health: int = 0
+    losses_by_no_action: int = 0
+    timeouts: int = 0
+    actions: int = 0
+    turns_to_win: Counter = field(default_factory=Counter)
+    """승리한 게임의 턴 수별 횟수."""
+    purchases: Counter = field(default_factory=Counter)
+    """카드 데이터 id별 총 구매 횟수."""
+    elapsed: float = 0.0
+
+    def add(self, record: GameRecord) -> None:
+        """게임 한 판의 결과를 반영."""
+        self.games += 1
+        self.actions += record.actions
+        self.purchases.update(record.purchases)
+        match (record.result):
+            case GameResult.Won:
+                self.wins += 1
+                self.turns_to_win[record.turns] += 1
+            case GameResult.LostByHealth:
+                self.losses_by_health += 1
+            case GameResult.LostByNoAction:
+                self.losses_by_no_action += 1
+            case _:
+                self.timeouts += 1
+
+    def merge(self, other: "SimulationStats") -> None:
+        """다른 통계를 이 통계에 합침. elapsed는 합치지 않음."""
+        self.games += other.games
+        self.wins += other.wins
+        self.losses_by_health += other.losses_by_health
+        self.losses_by_no_action += other.losses_by_no_action
+        self.timeouts += other.timeouts
+        self.actions += other.actions
+        self.turns_to_win.update(other.turns_to_win)
+        self.purchases.update(other.purchases)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games > 0 else 0.0
+
+    @property
+    def mean_turns_to_win(self) -> float:
+        return sum(turn * count for turn, count in self.turns_to_win.items()) / self.wins if self.wins > 0 else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def purchase_frequency(self) -> Dict[int, float]:
+        """카드 데이터 id별 게임당 평균 구매 횟수."""
+        return {data_id: count / self.games for data_id, count in self.purchases.items()} if self.games > 0 else {}
+
+
+def simulate_game(tree: dict, policy: Policy, seed: int, max_turns: int = DEFAULT_MAX_TURNS) -> GameRecord:
+    """레벨 내용(tree)으로 게임 한 판을 끝까지 진행. 카드 데이터는 미리 불러와 있어야 함."""
+    rng = random.Random(seed)
+    policy.reset(rng)
+    game: GameManager = GameManager.create_from_tree(tree, seed, autosave=False)
+    purchases: Counter = Counter()
+    action_count: int = 0
+
+    while not game.game_end and game.current_turn <= max_turns:
+        actions: List[Action] = game.get_legal_actions(policy.allow_end_turn)
+        if len(actions) == 0:
+            # 정책이 턴을 넘길 수 없는데 가능한 행동이 없는 경우.
+            actions = game.get_legal_actions(allow_end_turn=True)
+        action: Action = policy.choose(game, actions, rng)
+        card: Optional[Card] = game.deck.get_card_at(action.index) if action.action_type == ActionType.BuyCard else None
+        if game.apply_action(action):
+            action_count += 1
+            if card is not None:
+                purchases[card.card_data.id] += 1
+        # 시뮬레이션에서는 그리지 않으므로 DrawEvent를 버림.
+        game.get_draw_events()
+
+    return GameRecord(game.result, game.current_turn, action_count, dict(purchases))
+
+
+_worker_levels: Dict[str, dict] = {}
+"""작업 프로세스별로 불러 둔 레벨 내용."""
+
+
+def _init_worker() -> None:
+    """작업 프로세스마다 한 번만 카드 데이터를 불러옴."""
+    cdm.initialize()
+
+
+def _load_level(level_path: str) -> dict:
+    if level_path not in _worker_levels:
+        with open(level_path, encoding="utf-8") as f:
+            _worker_levels[level_path] = json.load(f)
+    return _worker_levels[level_path]
+
+
+def _run_chunk(level_path: str, policy: Policy, seeds: Sequence[int], max_turns: int) -> SimulationStats:
+    """작업 프로세스에서 주어진 시드들로 게임을 진행하고 부분 통계를 반환."""
+    tree: dict = _load_level(level_path)
+    stats = SimulationStats()
+    for seed in seeds:
+        stats.add(simulate_game(tree, policy, seed, max_turns))
+    return stats
+
+
+def run_simulations(
+        level_path: str,
+        policy: Policy,
+        games: int,
+        base_seed: int = 0,
+        workers: Optional[int] = None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        chunk_size: int = 50
+        ) -> SimulationStats:
+    """레벨을 games번 시뮬레이션하고 통계를 반환.
+    workers가 1이면 현재 프로세스에서, 그렇지 않으면 ProcessPoolExecutor로 나누어 실행함.
+    i번째 게임은 base_seed + i를 시드로 사용하므로 결과는 재현 가능함."""
+    seeds: List[int] = list(range(base_seed, base_seed + games))
+    chunks: List[List[int]] = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    stats = SimulationStats()
+    started: float = time.perf_counter()
+
+    if workers == 1:
+        _init_worker()
+        for chunk in chunks:
+            stats.merge(_run_chunk(level_path, policy, chunk, max_turns))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = [executor.submit(_run_chunk, level_path, policy, chunk, max_turns) for chunk in chunks]
+            for future in futures:
+                stats.merge(future.result())
+
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def print_stats(stats: SimulationStats) -> None:
+    """통계를 사람이 읽기 쉬운 형태로 출력."""
+    print(
+        f"게임 수: {stats.games}\n"
+        f"승률: {stats.win_rate*100:.1f}% ({stats.wins}승)\n"
+        f"평균 승리 턴: {stats.mean_turns_to_win:.2f}\n"
+        f"패배 원인: 체력 고갈 {stats.losses_by_health}, 행동 불능 {stats.losses_by_no_action}, 시간 초과 {stats.timeouts}"
+    )
+    if stats.wins > 0:
+        print("승리 턴 분포: " + ", ".join(f"{turn}턴 {count}" for turn, count in sorted(stats.turns_to_win.items())))
+    print("카드별 게임당 구매 횟수:")
+    for data_id, frequency in sorted(stats.purchase_frequency().items()):
+        card = cdm.get_card_data(data_id)
+        print(f" {data_id:>4d} {card.name if card is not None else '?':20s}\t{frequency:.3f}")
+    print(f"소요 시간: {stats.elapsed:.2f}초 ({stats.games_per_second:.1f} games/s, {stats.actions / stats.elapsed if stats.elapsed > 0 else 0:.1f} actions/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="레벨을 화면 없이 대량으로 시뮬레이션합니다.")
+    parser.add_argument("level", help="레벨 파일 경로")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", choices=POLICIES.keys(), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="첫 게임의 시드")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="작업 프로세스 수(1이면 현재 프로세스에서 실행)")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    args = parser.parse_args()
+
+    stats: SimulationStats = run_simulations(
+        args.level, POLICIES[args.policy](), args.games, args.seed, args.workers, args.max_turns
+    )
+    cdm.initialize()
+    print_stats(stats)
+
+
+if __name__ == "__main__":
+    main()
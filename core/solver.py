@@ -0,0 +1,222 @@
+"""
+레벨을 승리하기 위한 최소 턴 수를 구하거나, 승리할 수 없음을 증명하는 탐색기.
+구매/사용/턴 종료 행동을 최선 우선(턴 수, 행동 수 순) 탐색하며,
+같은 게임 상태에 다시 도달하면 치환표(transposition table)로 가지치기함.
+난수를 쓰는 효과가 있을 수 있으므로 결과는 주어진 시드에 대해서만 유효함.
+
+사용 예: python -m core.solver data/levels/tutorial_0.json --seed 0
+"""
+import json
+import time
+import heapq
+import argparse
+from enum import Enum, auto
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Final, List, Optional, Tuple
+
+import core.card_data_manager as cdm
+from core.enums import GameResult
+from core.game_manager import GameManager
+from core.obj_data_formats import Action
+
+
+DEFAULT_MAX_TURNS: Final[int] = 30
+DEFAULT_MAX_TABLE_ENTRIES: Final[int] = 500_000
+DEFAULT_MAX_NODES: Final[int] = 2_000_000
+
+
+class SolveStatus(Enum):
+    """탐색 결과의 종류."""
+    Solved = auto()
+    """승리하는 방법을 찾음. min_turns가 최소 턴 수."""
+    Unwinnable = auto()
+    """max_turns 안에 승리할 수 없음이 증명됨."""
+    Unknown = auto()
+    """노드 수 제한에 걸려 탐색을 끝내지 못함."""
+
+
+@dataclass
+class SolverResult:
+    """탐색 결과와 성능 지표."""
+    status: SolveStatus
+    min_turns: Optional[int] = None
+    actions: List[Action] = field(default_factory=list)
+    """찾은 승리 경로. Solved가 아니면 비어 있음."""
+    expanded_nodes: int = 0
+    generated_nodes: int = 0
+    pruned_nodes: int = 0
+    table_evictions: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.generated_nodes / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+class TranspositionTable:
+    """크기가 제한된 치환표. 가득 차면 가장 오래 전에 사용한 항목부터 버림(LRU).
+    항목을 버리면 같은 상태를 다시 탐색할 수는 있지만 결과의 정확성에는 영향이 없음."""
+    def __init__(self, max_entries: int) -> None:
+        self.__max_entries: int = max_entries
+        self.__table: OrderedDict[Tuple[int, int], Tuple[int, int]] = OrderedDict()
+        self.evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__table)
+
+    def check_and_store(self, key: Tuple[int, int], cost: Tuple[int, int]) -> bool:
+        """key 상태에 cost로 도달한 것이 기존 기록보다 나은지 검사하고, 낫다면 기록.
+        :return: 새로 탐색할 가치가 있으면 참."""
+        previous: Optional[Tuple[int, int]] = self.__table.get(key)
+        if previous is not None:
+            self.__table.move_to_end(key)
+            if previous <= cost:
+                return False
+        self.__table[key] = cost
+        self.__table.move_to_end(key)
+        if len(self.__table) > self.__max_entries:
+            self.__table.popitem(last=False)
+            self.evictions += 1
+        return True
+
+
+class LevelSolver:
+    """주어진 레벨과 시드에 대해 최소 턴 승리 경로를 찾는 탐색기."""
+    def __init__(
+            self,
+            tree: dict,
+            seed: int = 0,
+            max_turns: int = DEFAULT_MAX_TURNS,
+            max_table_entries: int = DEFAULT_MAX_TABLE_ENTRIES,
+            max_nodes: int = DEFAULT_MAX_NODES,
+            allow_end_turn: bool = True
+            ) -> None:
+        """LevelSolver의 초기화 메소드. 카드 데이터는 미리 불러와 있어야 함(cdm.initialize()).
+        :param tree: 레벨 파일의 내용.
+        :param seed: 게임의 난수 생성기 시드.
+        :param max_turns: 이 턴을 넘어서는 경로는 탐색하지 않음.
+        :param max_table_entries: 치환표의 최대 항목 수. 메모리 사용량의 상한.
+        :param max_nodes: 생성할 최대 노드 수. 넘어서면 Unknown으로 끝냄.
+        :param allow_end_turn: 행동이 남아 있어도 턴을 넘기는 것을 허용할지 여부."""
+        self.tree: dict = tree
+        self.seed: int = seed
+        self.max_turns: int = max_turns
+        self.max_nodes: int = max_nodes
+        self.allow_end_turn: bool = allow_end_turn
+        self.table = TranspositionTable(max_table_entries)
+        # 대부분의 노드는 같은 난수 상태를 공유하므로, 상태마다 번호를 붙여 한 벌만 보관.
+        self.__rng_states: Dict[tuple, int] = {}
+        self.__rng_state_list: List[list] = []
+
+    def _snapshot(self, game: GameManager) -> Tuple[dict, int]:
+        """게임을 다시 만들 수 있는 (저장 내용, 난수 상태 번호)로 변환."""
+        tree: dict = game.to_save_tree()
+        rng_state: list = tree.pop("rng_state")
+        key: tuple = (rng_state[0], tuple(rng_state[1]), rng_state[2])
+        if key not in self.__rng_states:
+            self.__rng_states[key] = len(self.__rng_state_list)
+            self.__rng_state_list.append(rng_state)
+        return tree, self.__rng_states[key]
+
+    def _restore(self, snapshot: Tuple[dict, int]) -> GameManager:
+        tree, rng_index = snapshot
+        return GameManager.create_from_tree(
+            tree | {"rng_state": self.__rng_state_list[rng_index]}, autosave=False
+        )
+
+    def solve(self) -> SolverResult:
+        """탐색을 실행하고 결과를 반환."""
+        started: float = time.perf_counter()
+        result = SolverResult(SolveStatus.Unwinnable)
+
+        root: GameManager = GameManager.create_from_tree(self.tree, self.seed, autosave=False)
+        root.get_draw_events()
+        root_snapshot = self._snapshot(root)
+        self.table.check_and_store((root.state_hash(), root_snapshot[1]), (root.current_turn, 0))
+
+        counter: int = 0
+        # (턴, 행동 수, 삽입 순서, 승리 여부, 스냅숏, 경로)
+        frontier: List[tuple] = [(root.current_turn, 0, counter, False, root_snapshot, ())]
+
+        while len(frontier) > 0:
+            turn, depth, _, won, snapshot, path = heapq.heappop(frontier)
+            if won:
+                result.status = SolveStatus.Solved
+                result.min_turns = turn
+                result.actions = list(path)
+                break
+            if result.generated_nodes >= self.max_nodes:
+                result.status = SolveStatus.Unknown
+                break
+            result.expanded_nodes += 1
+
+            parent: GameManager = self._restore(snapshot)
+            parent.get_draw_events()
+            # 합법성 검사(can_buy_card 등)를 통과한 행동만 탐색.
+            actions: List[Action] = parent.get_legal_actions(self.allow_end_turn)
+            if len(actions) == 0 and not self.allow_end_turn:
+                actions = parent.get_legal_actions(allow_end_turn=True)
+
+            for i, action in enumerate(actions):
+                # 마지막 행동은 부모 게임을 그대로 사용해 복제 비용을 줄임.
+                game: GameManager = parent if i == len(actions) - 1 else self._restore(snapshot)
+                game.get_draw_events()
+                if not game.apply_action(action):
+                    continue
+                game.get_draw_events()
+                result.generated_nodes += 1
+
+                if game.result == GameResult.Won:
+                    counter += 1
+                    heapq.heappush(frontier, (game.current_turn, depth + 1, counter, True, None, path + (action,)))
+                    continue
+                if game.game_end or game.current_turn > self.max_turns:
+                    continue
+
+                child_snapshot = self._snapshot(game)
+                cost: Tuple[int, int] = (game.current_turn, depth + 1)
+                if not self.table.check_and_store((game.state_hash(), child_snapshot[1]), cost):
+                    result.pruned_nodes += 1
+                    continue
+                counter += 1
+                heapq.heappush(frontier, (*cost, counter, False, child_snapshot, path + (action,)))
+
+        result.table_evictions = self.table.evictions
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="레벨을 승리하기 위한 최소 턴 수를 탐색합니다.")
+    parser.add_argument("level", help="레벨 파일 경로")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--max-table", type=int, default=DEFAULT_MAX_TABLE_ENTRIES, help="치환표 최대 항목 수")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES)
+    parser.add_argument("--no-end-turn", action="store_true", help="행동이 남아 있을 때 턴을 넘기지 않음(게임 화면과 같은 규칙)")
+    args = parser.parse_args()
+
+    cdm.initialize()
+    with open(args.level, encoding="utf-8") as f:
+        tree: dict = json.load(f)
+    solver = LevelSolver(tree, args.seed, args.max_turns, args.max_table, args.max_nodes, not args.no_end_turn)
+    result: SolverResult = solver.solve()
+
+    match (result.status):
+        case SolveStatus.Solved:
+            print(f"최소 {result.min_turns}턴에 승리할 수 있습니다.")
+            print("경로: " + ", ".join(f"{action.action_type.name}({action.index})" for action in result.actions))
+        case SolveStatus.Unwinnable:
+            print(f"{args.max_turns}턴 안에 승리할 수 없습니다.")
+        case SolveStatus.Unknown:
+            print(f"노드 수 제한({args.max_nodes})에 걸려 탐색을 끝내지 못했습니다.")
+    print(
+        f"노드: 확장 {result.expanded_nodes}, 생성 {result.generated_nodes}, 가지치기 {result.pruned_nodes}, "
+        f"치환표 {len(solver.table)} (제거 {result.table_evictions})\n"
+        f"소요 시간: {result.elapsed:.2f}초 ({result.nodes_per_second:.1f} nodes/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
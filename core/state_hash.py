@@ -0,0 +1,52 @@
+"""
+게임 상태의 64비트 지문을 점진적으로 관리하는 스크립트. (Zobrist 해싱과 같은 방식)
+상태를 (종류, 값...) 형태의 특징들의 모음으로 보고, 각 특징마다 정해진 64비트 키의 합(mod 2^64)을 지문으로 사용함.
+특징 하나가 바뀌면 이전 키를 빼고 새 키를 더하기만 하면 되므로 O(1)에 갱신됨.
+XOR 대신 덧셈을 사용하므로 같은 특징이 여러 번 있어도(예: 같은 종류의 아이템 두 개) 서로 상쇄되지 않음.
+"""
+from typing import Final
+
+
+MASK64: Final[int] = (1 << 64) - 1
+
+# 특징의 종류. 서로 다른 종류의 특징이 같은 키를 갖지 않도록 구분.
+FEATURE_CARD: Final[int] = 1
+FEATURE_ITEM: Final[int] = 2
+FEATURE_PLAYER: Final[int] = 3
+
+
+def feature_key(*feature: int) -> int:
+    """정수(bool 포함)로 이루어진 특징의 64비트 키.
+    정수 튜플의 hash는 실행마다 같으므로, 다른 프로세스에서 계산한 지문과도 비교할 수 있음."""
+    # splitmix64로 hash 값을 고르게 섞음.
+    z = (hash(feature) + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+def card_key(index: int, data_id: int, is_front_face: bool, modified_cost: int, instant_cost_modifier: int) -> int:
+    """덱의 index번째 자리에 있는 카드의 키."""
+    return feature_key(FEATURE_CARD, index, data_id, is_front_face, modified_cost, instant_cost_modifier)
+
+
+def item_key(data_id: int) -> int:
+    """인벤토리에 있는 아이템의 키. 아이템의 순서는 게임 진행에 영향을 주지 않으므로 위치는 포함하지 않음."""
+    return feature_key(FEATURE_ITEM, data_id)
+
+
+class StateHasher:
+    """특징 키의 합을 관리. Deck과 Inventory가 카드/아이템이 바뀔 때마다 갱신함."""
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: int = 0
+
+    def add(self, key: int) -> None:
+        self.value = (self.value + key) & MASK64
+
+    def remove(self, key: int) -> None:
+        self.value = (self.value - key) & MASK64
+
+    def replace(self, old_key: int, new_key: int) -> None:
+        self.value = (self.value - old_key + new_key) & MASK64
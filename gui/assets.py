@@ -0,0 +1,128 @@
+"""
+게임에서 사용하는 이미지를 처음 사용하기 전에 한 번에 불러와 텍스처 아틀라스에 모아 두는 스크립트.
+파일 읽기(decode)는 작업 스레드에서 미리 할 수 있으며, 텍스처 전송(load)만 주 스레드에서 수행함.
+같은 아틀라스에 있는 이미지를 사용하는 스프라이트는 텍스처를 한 번만 바꾸고 함께 그려짐.
+image()가 반환하는 이미지는 기준점과 크기가 미리 지정된 채 캐시되어 여러 곳에서 공유되므로 수정하면 안 됨.
+"""
+import os
+import threading
+from typing import Callable, Dict, Final, FrozenSet, Optional, Set, Tuple
+
+import pyglet
+from pyglet.image import AbstractImage, TextureRegion
+from pyglet.image.atlas import AllocatorException, TextureBin
+
+
+IMAGES_PATH: Final[str] = "data/images"
+"""이미지를 찾을 폴더. 하위 폴더까지 모두 불러옴."""
+IMAGE_EXTENSIONS: Final[Tuple[str, ...]] = (".png",)
+ATLAS_SIZE: Final[int] = 2048
+ATLAS_BORDER: Final[int] = 2
+"""아틀라스 안의 이미지 사이 여백. 크기를 바꿔 그릴 때 옆 이미지가 번지지 않도록 함."""
+
+ANCHOR_BOTTOM_LEFT: Final[Tuple[float, float]] = (0.0, 0.0)
+ANCHOR_CENTER: Final[Tuple[float, float]] = (0.5, 0.5)
+ANCHOR_LEFT: Final[Tuple[float, float]] = (0.0, 0.5)
+
+_ImageKey = Tuple[str, Optional[str], Tuple[float, float], Optional[Tuple[float, float]]]
+
+
+class AssetManager:
+    """이미지를 파일 이름으로 찾아 주는 객체. pyglet.resource.image 대신 사용."""
+    def __init__(self, root: str = IMAGES_PATH, atlas_size: int = ATLAS_SIZE) -> None:
+        self.root: str = root
+        self.atlas_size: int = atlas_size
+        self.__bin: Optional[TextureBin] = None
+        self.__sources: Dict[str, AbstractImage] = {}
+        """파일 이름 -> 아틀라스의 영역(너무 큰 이미지는 별도 텍스처)."""
+        self.__missing: Set[str] = set()
+        """찾지 못한 파일 이름. 다시 찾지 않고 바로 대체 이미지를 사용함."""
+        self.__images: Dict[_ImageKey, TextureRegion] = {}
+        self.__decoded: Optional[Dict[str, AbstractImage]] = None
+        """decode()로 읽었지만 아직 아틀라스에 담지 않은 이미지."""
+        self.__decode_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.__bin is not None
+
+    @property
+    def missing(self) -> FrozenSet[str]:
+        """요청되었지만 찾지 못한 이미지 이름."""
+        return frozenset(self.__missing)
+
+    def decode(self, progress: Optional[Callable[[float], None]] = None) -> None:
+        """root 아래의 모든 이미지 파일을 읽어 둠. GL을 사용하지 않으므로 작업 스레드에서 호출할 수 있음.
+        이미 읽었거나 불러왔다면 아무것도 하지 않음.
+        params:
+            `progress`: Callable[[float], None] | None - 파일 하나를 읽을 때마다 진행률(0~1)을 받는 함수."""
+        with self.__decode_lock:
+            if self.__decoded is not None or self.__bin is not None:
+                return
+            paths: Dict[str, str] = {}
+            for directory, _, files in sorted(os.walk(self.root)):
+                for file_name in sorted(files):
+                    if file_name.lower().endswith(IMAGE_EXTENSIONS) and file_name not in paths:
+                        paths[file_name] = os.path.join(directory, file_name)
+            decoded: Dict[str, AbstractImage] = {}
+            for index, (file_name, path) in enumerate(paths.items()):
+                decoded[file_name] = pyglet.image.load(path)
+                if progress is not None:
+                    progress((index + 1) / len(paths))
+            self.__decoded = decoded
+
+    def load(self) -> None:
+        """root 아래의 모든 이미지를 아틀라스에 담음. 이미 불러왔다면 아무것도 하지 않음.
+        GL 문맥이 필요하므로 창을 만든 뒤 주 스레드에서 호출해야 함. 미리 decode()했다면 텍스처 전송만 수행함."""
+        if self.__bin is not None:
+            return
+        self.decode()
+        with self.__decode_lock:
+            decoded: Dict[str, AbstractImage] = self.__decoded or {}
+            self.__decoded = None
+            self.__bin = TextureBin(self.atlas_size, self.atlas_size)
+        for file_name, image in decoded.items():
+            try:
+                self.__sources[file_name] = self.__bin.add(image, ATLAS_BORDER)
+            except AllocatorException:
+                self.__sources[file_name] = image.get_texture()
+
+    def _find(self, name: str) -> Optional[AbstractImage]:
+        source: Optional[AbstractImage] = self.__sources.get(name)
+        if source is None:
+            self.__missing.add(name)
+        return source
+
+    def image(
+            self,
+            name: str,
+            fallback: Optional[str] = None,
+            anchor: Tuple[float, float] = ANCHOR_BOTTOM_LEFT,
+            size: Optional[Tuple[float, float]] = None
+        ) -> TextureRegion:
+        """이름이 name인 이미지를 반환. 없다면 fallback을 사용하며, 둘 다 없다면 ResourceNotFoundException 발생.
+        params:
+            `anchor`: Tuple[float, float] - 기준점의 위치. 이미지 크기에 대한 비율.
+            `size`: Tuple[float, float] | None - 그려질 크기. None이면 원래 크기."""
+        key: _ImageKey = (name, fallback, anchor, size)
+        region: Optional[TextureRegion] = self.__images.get(key)
+        if region is not None:
+            return region
+        if self.__bin is None:
+            self.load()
+        source: Optional[AbstractImage] = None if name in self.__missing else self._find(name)
+        if source is None and fallback is not None:
+            source = self._find(fallback)
+        if source is None:
+            raise pyglet.resource.ResourceNotFoundException(name)
+        region = source.get_region(0, 0, source.width, source.height)
+        if size is not None:
+            region.width, region.height = size
+        region.anchor_x = region.width * anchor[0]
+        region.anchor_y = region.height * anchor[1]
+        self.__images[key] = region
+        return region
+
+
+assets: Final[AssetManager] = AssetManager()
+"""게임 전체에서 공유하는 AssetManager."""
@@ -0,0 +1,58 @@
+"""
+파일 읽기, 게임 생성 등 오래 걸리는 준비 작업을 별도 스레드에서 실행하는 스크립트.
+작업 함수는 GL이나 pyglet 객체를 다루면 안 되며, 화면 갱신 루프는 poll로 끝났는지만 확인함.
+"""
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[float], None]
+"""작업 함수가 진행률(0~1)을 알릴 때 호출하는 함수."""
+
+
+class BackgroundTask(Generic[T]):
+    """func(progress)를 별도 스레드에서 실행. 결과나 발생한 예외는 poll()로 가져감."""
+    def __init__(self, func: Callable[[ProgressCallback], T], name: str = "BackgroundTask") -> None:
+        self.__lock = threading.Lock()
+        self.__progress: float = 0.0
+        self.__done: bool = False
+        self.__result: Optional[T] = None
+        self.__error: Optional[BaseException] = None
+        threading.Thread(target=self._run, args=(func,), name=name, daemon=True).start()
+
+    @property
+    def progress(self) -> float:
+        """작업 함수가 마지막으로 알린 진행률(0~1)."""
+        with self.__lock:
+            return self.__progress
+
+    def _set_progress(self, progress: float) -> None:
+        with self.__lock:
+            self.__progress = progress
+
+    def _run(self, func: Callable[[ProgressCallback], T]) -> None:
+        try:
+            result: T = func(self._set_progress)
+        except BaseException as e:
+            with self.__lock:
+                self.__error = e
+                self.__done = True
+            return
+        with self.__lock:
+            self.__result = result
+            self.__progress = 1.0
+            self.__done = True
+
+    def poll(self) -> bool:
+        """작업이 끝났는지 여부. 작업 함수에서 예외가 발생했다면 그 예외를 다시 발생시킴."""
+        with self.__lock:
+            if self.__error is not None:
+                raise self.__error
+            return self.__done
+
+    def result(self) -> Optional[T]:
+        """작업 함수의 반환값. 끝나지 않았다면 None."""
+        with self.__lock:
+            return self.__result
@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-import time
 from typing import Optional, TYPE_CHECKING, Tuple
 
 import pyglet
@@ -8,6 +7,7 @@ from gui.anchored_widget import AnchorPreset, AnchoredWidget
 
 from gui.color import Color
 from gui.transitions import Transition
+from gui.utils import set_label_layout
 
 if TYPE_CHECKING:
     from gui.scenes.scene import Scene
@@ -99,12 +99,8 @@ class SolidButton(AnchoredWidget):
             self._pressed_state.transition
         )
 
-        self._scene.push_handlers(on_scene_updated = self.update_transition, on_scene_window_resized=self._on_scene_window_resized)
-        self._scene.window.push_handlers(
-            self.on_mouse_press,
-            self.on_mouse_release,
-            self.on_mouse_motion
-        )
+        self._scene.push_handlers(on_scene_window_resized=self._on_scene_window_resized)
+        self._scene.input_router.add(self)
 
         self._pressed = False
 
@@ -113,22 +109,22 @@ class SolidButton(AnchoredWidget):
 
     def _update_position(self):
         self._shape.position = self._x, self._y
+        self._scene.input_router.invalidate()
 
     def update_layout(self):
         super().update_layout(self._scene.scale_factor)
         self._update_position()
         self._shape.width, self._shape.height = self._width, self._height
         self._label.x, self._label.y = self._x + self._width/2, self._y + self._height/2
-        self._label.font_size = self.base_font_size * self.scale_factor
+        set_label_layout(self._label, self.base_font_size * self.scale_factor)
 
     def trigger_transition(self, start: SolidButtonState, end: SolidButtonState):
         self._state_transition.start_value = start
         self._state_transition.destination_value = end
-        self._state_transition.start(time.time(), end.transition)
+        self._scene.timeline.play(self._state_transition, self._on_transition_updated, end.transition)
 
-    def update_transition(self, dt: float):
-        if not self._state_transition.active: return
-        self._current_state = self._state_transition.update(time.time())
+    def _on_transition_updated(self, state: SolidButtonState):
+        self._current_state = state
         self._shape.color = self._current_state.box_color.tuple_256()
         self._shape.border_color = self._current_state.border_color.tuple_256()
         self._label.color = self._current_state.label_color.tuple_256()
@@ -190,12 +186,9 @@ class SolidButton(AnchoredWidget):
         """이 버튼 객체 삭제."""
         self._shape.delete()
         self._label.delete()
-        self._scene.remove_handlers(on_scene_updated = self.update_transition, on_scene_window_resized=self._on_scene_window_resized)
-        self._scene.window.remove_handlers(
-            self.on_mouse_press,
-            self.on_mouse_release,
-            self.on_mouse_motion
-        )
+        self._scene.timeline.stop(self._state_transition)
+        self._scene.remove_handlers(on_scene_window_resized=self._on_scene_window_resized)
+        self._scene.input_router.remove(self)
 
 
 SolidButton.register_event_type("on_press")
@@ -1,15 +1,20 @@
-import time
-from typing import Dict, Final, Tuple
+import math
+from collections import OrderedDict
+from typing import Dict, Final, List, Optional, Tuple
 
 import pyglet
-from pyglet.math import Vec2, Vec3
+from pyglet.math import Vec2
 
 from core.enums import CardType
 from core.obj_data_formats import CardDrawData
+from gui.assets import ANCHOR_CENTER, assets
 from gui.color import Color
 from gui.elements_layout import CardsLayout
+from gui.offscreen import render_to_region
+from gui.text_cache import TextTextureCache, scale_bucket
 from gui.transform import Transform2D
 from pyglet.graphics import Batch, Group
+from pyglet.image import Texture, TextureRegion
 from pyglet.sprite import Sprite
 
 from gui.transitions import Transition
@@ -19,151 +24,325 @@ CARD_SPRITE: Final[Dict[CardType, Tuple[str, str]]] = {
     CardType.Event: ("card_event_front.png", "card_event_back.png"),
     CardType.Item: ("card_item_front.png", "card_item_back.png"),
 }
+UNKNOWN_SPRITE: Final[str] = "card_unknown.png"
 COST_FONT: Final[str] = "Algerian"
 TITLE_FONT: Final[str] = "Neo둥근모 Pro"
 CONTENT_FONT: Final[str] = "Neo둥근모 Pro"
+CARD_FACE_SHEET_SIZE: Final[int] = 2048
+"""카드 앞면을 격자로 담는 텍스처의 한 변 길이."""
+CARD_FACE_SHEET_SPACING: Final[int] = 2
+"""격자 칸 사이의 여백. 크기를 바꿔 그릴 때 옆 칸이 번지지 않도록 함."""
+
+_FaceKey = Tuple[int, int, float, bool, float]
+
+
+def _centered_image(name: str) -> TextureRegion:
+    """중앙을 기준점으로 하는 이미지를 불러옴. 없는 이미지는 card_unknown.png로 대체."""
+    return assets.image(name, fallback=UNKNOWN_SPRITE, anchor=ANCHOR_CENTER)
+
+
+def _highlight_color(highlighted: bool) -> Tuple[int, int, int]:
+    return (Color.lerp(Color.white(), Color.yellow(), 0.5) if highlighted else Color.white()).tuple_256()[:3]
+
+
+def _cost_color(data: CardDrawData) -> Tuple[int, int, int, int]:
+    return (
+        Color.black() if data.base_cost == data.current_cost else (
+            Color.green() if ((data.type == CardType.Enemy) ^ (data.current_cost > data.base_cost))
+            else Color.red()
+        )
+    ).tuple_256()
+
+
+class _FaceSheet:
+    """같은 크기의 카드 앞면을 격자로 담는 텍스처 한 장."""
+    def __init__(self, slot_width: int, slot_height: int, size: int) -> None:
+        self.texture: Texture = Texture.create(size, size)
+        stride_x: int = slot_width + CARD_FACE_SHEET_SPACING
+        stride_y: int = slot_height + CARD_FACE_SHEET_SPACING
+        self.slots: List[TextureRegion] = []
+        for row in range(max(1, size // stride_y)):
+            for column in range(max(1, size // stride_x)):
+                region: TextureRegion = self.texture.get_region(column * stride_x, row * stride_y, slot_width, slot_height)
+                region.anchor_x, region.anchor_y = slot_width // 2, slot_height // 2
+                self.slots.append(region)
+        self.free: List[int] = list(range(len(self.slots) - 1, -1, -1))
+
+
+class CardFaceCache:
+    """카드 앞면(틀, 그림, 비용, 제목, 설명)을 합성해 보관.
+    (카드 종류(CardData)의 id, 현재 비용, 크기 구간, 강조 여부, 카드 높이)마다 한 번만 그리므로 같은 종류의 카드는 앞면을 공유함.
+    문구는 TextTextureCache의 텍스처를 사용함.
+    같은 크기의 앞면은 한 텍스처의 격자 칸에 그려지므로 화면의 카드 앞면이 텍스처를 한 번만 바꾸고 함께 그려짐.
+    acquire로 받은 앞면은 release할 때까지 다른 앞면이 덮어쓰지 않음."""
+    def __init__(self, window: pyglet.window.Window, text_cache: TextTextureCache, sheet_size: int = CARD_FACE_SHEET_SIZE) -> None:
+        self.window: pyglet.window.Window = window
+        self.text_cache: TextTextureCache = text_cache
+        self.sheet_size: int = sheet_size
+        self.__sheets: Dict[Tuple[int, int], List[_FaceSheet]] = {}
+        """칸 크기 -> 그 크기의 격자 텍스처들."""
+        self.__faces: OrderedDict[_FaceKey, Tuple[_FaceSheet, int]] = OrderedDict()
+        """앞면 -> (격자 텍스처, 칸 번호). 오래 쓰이지 않은 순서."""
+        self.__users: Dict[_FaceKey, int] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__faces)
+
+    def acquire(self, data: CardDrawData, base_height: float, bucket: float, highlighted: bool) -> Tuple[_FaceKey, TextureRegion]:
+        """data의 앞면을 bucket배 크기로 합성한 이미지와 그 키를 반환. 없다면 새로 그림. 기준점은 이미지 중앙.
+        다 쓴 뒤에는 키로 release해야 함."""
+        key: _FaceKey = (data.card_data.id, data.current_cost, bucket, highlighted, base_height)
+        self.__users[key] = self.__users.get(key, 0) + 1
+        entry: Optional[Tuple[_FaceSheet, int]] = self.__faces.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.__faces.move_to_end(key)
+            return key, entry[0].slots[entry[1]]
+        self.misses += 1
+        size: Tuple[int, int] = (max(1, math.ceil(base_height / 1.5 * bucket)), max(1, math.ceil(base_height * bucket)))
+        sheet, slot = self._allocate(size)
+        self.__faces[key] = (sheet, slot)
+        region: TextureRegion = sheet.slots[slot]
+        self._render(region, data, base_height, bucket, highlighted)
+        return key, region
+
+    def release(self, key: _FaceKey) -> None:
+        """acquire로 받은 앞면을 더 이상 그리지 않음. 칸은 다른 앞면이 필요할 때까지 남아 있음."""
+        users: int = self.__users.get(key, 0) - 1
+        if users > 0:
+            self.__users[key] = users
+        else:
+            self.__users.pop(key, None)
+
+    def _allocate(self, size: Tuple[int, int]) -> Tuple[_FaceSheet, int]:
+        """size 크기의 빈 칸을 찾음. 없다면 사용 중이지 않은 가장 오래된 앞면을 지우고, 그래도 없다면 텍스처를 추가."""
+        sheets: List[_FaceSheet] = self.__sheets.setdefault(size, [])
+        for sheet in sheets:
+            if len(sheet.free) > 0:
+                return sheet, sheet.free.pop()
+        for key, (sheet, slot) in self.__faces.items():
+            if key not in self.__users and (sheet.slots[slot].width, sheet.slots[slot].height) == size:
+                del self.__faces[key]
+                return sheet, slot
+        sheet = _FaceSheet(*size, self.sheet_size)
+        sheets.append(sheet)
+        return sheet, sheet.free.pop()
+
+    def clear(self) -> None:
+        self.__faces.clear()
+        self.__users.clear()
+        self.__sheets.clear()
+
+    def _render(self, region: TextureRegion, data: CardDrawData, base_height: float, bucket: float, highlighted: bool) -> None:
+        width: float = base_height / 1.5 * bucket
+        height: float = base_height * bucket
+        w, h = region.width, region.height
+        batch = Batch()
+        group_thumbnail, group_body, group_text = Group(order=0), Group(order=1), Group(order=2)
+        content_pos, cost_pos, title_pos, description_pos = Transform2D(
+            Vec2(w / 2, h / 2), 0.0, Vec2(bucket, bucket)
+        ).transform_points(Card.child_offsets(base_height / 1.5, base_height))
+
+        front = Sprite(_centered_image(CARD_SPRITE[data.type][0]), w / 2, h / 2, batch=batch, group=group_body)
+        front.width, front.height = width, height
+        front.color = _highlight_color(highlighted)
+        content = Sprite(_centered_image(data.sprite_name), *content_pos, batch=batch, group=group_thumbnail)
+        content.width, content.height = width * 100 / 120, height * 75 / 180
+
+        texts: List[Sprite] = []
+        def add_text(text: str, font_name: str, font_size: float, position: Tuple[float, float],
+                     color: Tuple[int, int, int, int], text_width: Optional[float] = None) -> None:
+            sprite = Sprite(
+                self.text_cache.get(text, font_name, font_size * bucket,
+                                    None if text_width is None else text_width * bucket, "center", text_width is not None),
+                *position, batch=batch, group=group_text
+            )
+            sprite.color, sprite.opacity = color[:3], color[3]
+            texts.append(sprite)
+        if data.type != CardType.Event:
+            add_text(str(data.current_cost), COST_FONT, 15, cost_pos, _cost_color(data))
+        add_text(data.name, TITLE_FONT, 10, title_pos, Color.black().tuple_256())
+        add_text(data.description, TITLE_FONT, 8, description_pos, Color.black().tuple_256(), base_height / 1.5 / 1.2)
+
+        try:
+            render_to_region(self.window, region.owner, region.x, region.y, w, h, batch.draw)
+        finally:
+            for sprite in texts:
+                sprite.delete()
+            content.delete()
+            front.delete()
+
+
+class CardVisual:
+    """카드 하나를 그리는 스프라이트. 화면에 보이는 카드만 가지며, CardVisualPool에서 재사용됨.
+    앞면이면 CardFaceCache가 합성한 이미지를, 뒷면이면 뒷면 이미지를 그림."""
+    def __init__(self, batch: Batch, group: Group) -> None:
+        self.sprite = Sprite(_centered_image(UNKNOWN_SPRITE), z=2, batch=batch, group=group)
+        self.data_id: Optional[int] = None
+        self.face_key: Optional[Tuple] = None
+        """현재 그리고 있는 모습. 바뀐 경우에만 이미지를 교체함."""
+        self.face_cache_key: Optional[_FaceKey] = None
+        """CardFaceCache에서 받은 앞면의 키. 앞면을 그리지 않게 되면 반납함."""
+        self.sprite.visible = False
+
+    def show_face(self, face_cache: CardFaceCache, data: CardDrawData, base_height: float, bucket: float, highlighted: bool) -> None:
+        """합성된 앞면을 그림."""
+        key, region = face_cache.acquire(data, base_height, bucket, highlighted)
+        self.release_face(face_cache)
+        self.face_cache_key = key
+        self.sprite.image = region
+
+    def release_face(self, face_cache: CardFaceCache) -> None:
+        if self.face_cache_key is not None:
+            face_cache.release(self.face_cache_key)
+            self.face_cache_key = None
+
+    def bind(self, data: CardDrawData) -> None:
+        """주어진 카드를 그리도록 교체."""
+        self.data_id = data.id
+        self.face_key = None
+
+    def hide(self) -> None:
+        self.sprite.visible = False
+
+    def delete(self) -> None:
+        self.sprite.delete()
+
+
+class CardVisualPool:
+    """화면 밖으로 나간 카드의 CardVisual을 모아 두었다가 새로 보이는 카드에 다시 사용함."""
+    def __init__(self, batch: Batch, group: Group, face_cache: CardFaceCache) -> None:
+        self.batch: Batch = batch
+        self.group: Group = group
+        self.face_cache: CardFaceCache = face_cache
+        self.__free: List[CardVisual] = []
+        self.created: int = 0
+        """지금까지 만든 CardVisual의 수. 화면에 동시에 보인 카드 수의 최댓값과 같음."""
+
+    def acquire(self, data: CardDrawData) -> CardVisual:
+        """data를 그리는 CardVisual을 반환. 남는 것이 없다면 새로 만듦."""
+        # 같은 카드가 다시 보이는 경우 이미지를 다시 설정하지 않도록 우선 사용.
+        for i in range(len(self.__free) - 1, -1, -1):
+            if self.__free[i].data_id == data.id:
+                return self.__free.pop(i)
+        if len(self.__free) > 0:
+            visual: CardVisual = self.__free.pop()
+            visual.release_face(self.face_cache)
+        else:
+            visual = CardVisual(self.batch, self.group)
+            self.created += 1
+        visual.bind(data)
+        return visual
+
+    def release(self, visual: CardVisual) -> None:
+        """더 이상 보이지 않는 카드의 CardVisual을 반납."""
+        visual.hide()
+        self.__free.append(visual)
+
+    def delete(self) -> None:
+        for visual in self.__free:
+            visual.release_face(self.face_cache)
+            visual.delete()
+        self.__free.clear()
+
 
 class Card:
-    """게임 화면에 그려지는 카드 객체."""
+    """게임 화면에 그려지는 카드 객체.
+    화면(과 여백) 안에 있는 동안만 CardVisualPool에서 스프라이트를 빌려 오며, 그 밖에서는 데이터만 가짐."""
     def __init__(
-            self, 
-            data: CardDrawData, 
+            self,
+            data: CardDrawData,
             layout: CardsLayout,
-            batch: Batch,
-            group_body: Group,
-            group_thumbnail: Group,
-            group_text: Group,
+            pool: CardVisualPool,
             height: float = 240.0,
             index: int = 0
             ) -> None:
         self.data: CardDrawData = data
         self.layout: CardsLayout = layout
-        self.batch: Batch = batch
-        self.group_body: Group = group_body
-        self.group_thumbnail: Group = group_thumbnail
-        self.group_text: Group = group_text
+        self.pool: CardVisualPool = pool
         self.base_width: float = height / 1.5
         self.base_height: float = height
         self.index: int = index
-        self.transform = Transform2D(
-            layout.get_position(index),
-            layout.get_rotation(index),
-            Vec2(1, 1) * layout.get_scale(index)
-        )
+        self.transform: Transform2D = layout.get_transform(index)
         self.transition = Transition[Transform2D](self.transform, self.transform, 0.5)
         self.alive: bool = True
+        self.highlighted: bool = False
+        self.visual: Optional[CardVisual] = None
 
-        image_front = pyglet.resource.image(CARD_SPRITE[data.type][0])
-        try:
-            image_content = pyglet.resource.image(data.sprite_name)
-        except pyglet.resource.ResourceNotFoundException:
-            image_content = pyglet.resource.image("card_unknown.png")
-        image_back = pyglet.resource.image(CARD_SPRITE[data.type][1])
-
-        image_front.anchor_x = image_front.width / 2
-        image_front.anchor_y = image_front.height / 2
-        image_content.anchor_x = image_content.width / 2
-        image_content.anchor_y = image_content.height / 2
-        image_back.anchor_x = image_back.width / 2
-        image_back.anchor_y = image_back.height / 2
-
-        self.sprite_front = Sprite(image_front, z=2, batch=batch, group=group_body)
-        self.sprite_content = Sprite(image_content, z=1, batch=batch, group=group_thumbnail)
-        self.sprite_back = Sprite(image_back, z=2, batch=batch, group=group_body)
-
-        
-        self.label_cost = pyglet.text.Label(
-            str(data.current_cost), 
-            font_name=COST_FONT, font_size=15,
-            anchor_x="center", anchor_y="center", align="center", z=3, 
-            batch=batch, group=group_text
-        )
-        self.label_title = pyglet.text.Label(
-            data.name, 
-            font_name=TITLE_FONT, font_size=10,
-            color=Color.black().tuple_256(),
-            anchor_x="center", anchor_y="center", align="center", z=3, 
-            batch=batch, group=group_text
-        )
-        self.label_description = pyglet.text.Label(
-            data.description, 
-            font_name=TITLE_FONT, font_size=8,
-            color=Color.black().tuple_256(),
-            anchor_x="center", anchor_y="center", align="center", z=3, 
-            width=self.base_width / 1.5 * layout.scene.scale_factor, multiline=True,
-            batch=batch, group=group_text
-        )
-
-        self.layout.push_handlers(on_layout_modified=lambda : self.update_state())
-        self.layout.scene.push_handlers(on_scene_updated=self._update_transition)
+        self._on_layout_modified = lambda : self.update_state()
+        self.layout.push_handlers(on_layout_modified=self._on_layout_modified)
         self.update_state()
 
     def __eq__(self, __value: object) -> bool:
         return isinstance(__value, Card) and self.data.id == __value.data.id
-    
-    def _update_transition(self, dt: float):
-        if self.transition.active and self.alive:
-            self.transform = self.transition.update(time.time())
+
+    @staticmethod
+    def child_offsets(width: float, height: float) -> Tuple[Tuple[float, float], ...]:
+        """카드 중앙 기준의 그림, 비용, 제목, 설명 위치."""
+        return (
+            (0, height * 42.5 / 180),
+            (-width * 45 / 120, height * 75 / 180),
+            (0, 0),
+            (0, -height * 0.25),
+        )
+
+    def _on_transition_updated(self, transform: Transform2D):
+        if self.alive:
+            self.update_state()
+
+    def _release_visual(self) -> None:
+        if self.visual is not None:
+            self.pool.release(self.visual)
+            self.visual = None
 
     def update_state(self):
-        """현재 데이터를 기준으로 상태를 갱신."""
+        """현재 데이터를 기준으로 상태를 갱신. 화면 밖으로 나갔다면 스프라이트를 반납함."""
         if not self.alive:
             return
-        self.transform = Transform2D(
-            self.layout.get_position(self.index),
-            self.layout.get_rotation(self.index),
-            Vec2(1, 1) * self.layout.get_scale(self.index)
-        ) if not self.transition.active else self.transition.update(time.time())
-        trs = self.transform.matrix
+        self.transform = self.layout.get_transform(self.index) \
+            if not self.transition.active else self.transition.current_value
+        if not self.layout.is_visible(self.transform.position.x):
+            self._release_visual()
+            return
+        if self.visual is None:
+            self.visual = self.pool.acquire(self.data)
+        v: CardVisual = self.visual
 
+        # 앞면은 비용, 크기 구간, 강조 여부가 바뀔 때만 다시 합성하고, 그 사이의 크기는 스프라이트로 조정.
         if self.data.is_front_face:
-            self.sprite_back.visible = False
-            self.sprite_front.visible = self.sprite_content.visible = True
-            self.label_title.visible = self.label_description.visible = True
-            self.label_cost.visible = self.data.type != CardType.Event
-
-            # translation이 제대로 이루어지려면 z=1인 3차원 벡터 필요.
-            self.sprite_content.position = (*(trs @ (Vec3(0, self.base_height * 42.5 / 180, 1)))[:2], 1)
-            self.sprite_content.rotation = self.transform.rotation
-            self.sprite_content.width, self.sprite_content.height = self.base_width*100/120*self.transform.scale.x, self.base_height*75/180*self.transform.scale.y
-
-            self.sprite_front.position = (*self.transform.position, 2)
-            self.sprite_front.rotation = self.transform.rotation
-            self.sprite_front.width, self.sprite_front.height = self.base_width*self.transform.scale.x, self.base_height*self.transform.scale.y
-            
-            if self.data.type != CardType.Event:
-                self.label_cost.position = (*(trs @ (Vec3(-self.base_width * 45 / 120, self.base_height * 75 / 180, 1)))[:2], 3)
-                self.label_cost.rotation = self.transform.rotation
-                self.label_cost.font_size = 15 * self.transform.scale.x
-                self.label_cost.color = (
-                    Color.black() if self.data.base_cost == self.data.current_cost else (
-                        Color.green() if ((self.data.type == CardType.Enemy) ^ (self.data.current_cost > self.data.base_cost))
-                        else Color.red()
-                    )
-                ).tuple_256()
-            
-            self.label_title.position = (*(trs @ (Vec3(0, self.base_height * 0, 1)))[:2], 3)
-            self.label_title.rotation = self.transform.rotation
-            self.label_title.font_size = 10 * self.transform.scale.x
-
-            self.label_description.position = (*(trs @ (Vec3(0, -self.base_height * 0.25, 1)))[:2], 3)
-            self.label_description.rotation = self.transform.rotation
-            self.label_description.width = self.transform.scale.x * self.base_width / 1.2
-            self.label_description.font_size = 8 * self.transform.scale.x
+            bucket: float = scale_bucket(self.transform.scale.x)
+            key: Tuple = (True, self.data.current_cost, bucket, self.highlighted)
+            if v.face_key != key:
+                v.face_key = key
+                v.show_face(self.pool.face_cache, self.data, self.base_height, bucket, self.highlighted)
+                v.sprite.color = _highlight_color(False)
         else:
-            self.sprite_front.visible = self.sprite_content.visible = False
-            self.label_cost.visible = self.label_title.visible = self.label_description.visible = False
-            self.sprite_back.visible = True
-
-            self.sprite_back.position = (*self.transform.position, 2)
-            self.sprite_back.rotation = self.sprite_back.rotation
-            self.sprite_back.width, self.sprite_back.height = self.base_width*self.transform.scale.x, self.base_height*self.transform.scale.y
-    
+            key = (False, self.highlighted)
+            if v.face_key != key:
+                v.face_key = key
+                v.release_face(self.pool.face_cache)
+                v.sprite.image = _centered_image(CARD_SPRITE[self.data.type][1])
+                v.sprite.color = _highlight_color(self.highlighted)
+
+        v.sprite.position = (*self.transform.position, 2)
+        v.sprite.rotation = self.transform.rotation
+        v.sprite.width, v.sprite.height = self.base_width*self.transform.scale.x, self.base_height*self.transform.scale.y
+        v.sprite.visible = True
+
     def set_front_face(self, is_front_face: bool):
         """앞/뒷면 설정."""
         self.data.is_front_face = is_front_face
         self.update_state()
 
+    def set_highlight(self, highlight: bool):
+        """추천 카드 강조 표시 설정."""
+        if not self.alive:
+            return
+        self.highlighted = highlight
+        self.update_state()
+
     def move_to(self, new_index: int, duration: float = 0.5):
         """주어진 인덱스로 이동함."""
         if not self.alive:
@@ -174,35 +353,22 @@ class Card:
             self.update_state()
             return
         self.transition.start_value = self.transform
-        self.transition.destination_value = Transform2D(
-            self.layout.get_position(new_index),
-            self.layout.get_rotation(new_index),
-            Vec2(1, 1) * self.layout.get_scale(new_index)
-        )
-        self.transition.start(time.time(), duration)
+        self.transition.destination_value = self.layout.get_transform(new_index)
+        self.layout.scene.timeline.play(self.transition, self._on_transition_updated, duration)
 
     def set_cost(self, new_cost: int):
         """표시되는 비용을 변경."""
         if not self.alive:
             return
         if self.data.type == CardType.Event: return
-        if (delta := new_cost - self.data.base_cost) == 0:
-            self.label_cost.color = Color.black().tuple_256()
-        elif (delta > 0) ^ (self.data.type == CardType.Item):
-            self.label_cost.color = Color.green().tuple_256()
-        else:
-            self.label_cost.color = Color.red().tuple_256()
-        self.label_cost.text = str(new_cost)
+        self.data.current_cost = new_cost
         self.update_state()
 
     def delete(self):
         """이 카드를 파괴함."""
         self.alive = False
-        self.label_cost.delete()
-        self.label_title.delete()
-        self.label_description.delete()
-        self.sprite_back.delete()
-        self.sprite_content.delete()
-        self.sprite_front.delete()
+        self.layout.scene.timeline.stop(self.transition)
+        self.layout.remove_handlers(on_layout_modified=self._on_layout_modified)
+        self._release_visual()
         self.layout.length -= 1
-        self.layout.trigger_scroll()
\ No newline at end of file
+        self.layout.trigger_scroll()
@@ -0,0 +1,93 @@
+"""
+GUI의 전이와 장면 갱신이 사용하는 시계.
+실제 시간, 배속 시간(빨리 감기), 직접 진행시키는 시간을 같은 방식으로 다룰 수 있어
+애니메이션 전체를 창 없이 원하는 속도로 재생하거나 검사할 수 있음.
+"""
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gui.timeline import Timeline
+
+
+class Clock(ABC):
+    """시계의 기본 클래스. 호출하면 현재 시각(초)을 반환함."""
+    @abstractmethod
+    def now(self) -> float:
+        """현재 시각(초)."""
+
+    def tick(self, real_dt: float) -> float:
+        """장면이 갱신될 때 호출됨. 실제로 흐른 시간을 받아 이 시계에서 흐른 시간을 반환."""
+        return real_dt
+
+    def to_real(self, duration: float) -> float:
+        """이 시계에서 duration초가 흐르는 데 걸리는 실제 시간."""
+        return duration
+
+    def __call__(self) -> float:
+        return self.now()
+
+
+class RealClock(Clock):
+    """실제 시간을 따르는 시계. 기본값."""
+    def now(self) -> float:
+        return time.perf_counter()
+
+
+class ScaledClock(Clock):
+    """실제 시간보다 scale배 빠르게(1 미만이면 느리게) 흐르는 시계."""
+    def __init__(self, scale: float = 1.0) -> None:
+        self.__scale: float = scale
+        self.__base_real: float = time.perf_counter()
+        self.__base_time: float = 0.0
+
+    @property
+    def scale(self) -> float:
+        return self.__scale
+
+    @scale.setter
+    def scale(self, value: float) -> None:
+        # 배속을 바꾸는 시점까지 흐른 시간을 고정해 시각이 튀지 않도록 함.
+        self.__base_time = self.now()
+        self.__base_real = time.perf_counter()
+        self.__scale = value
+
+    def now(self) -> float:
+        return self.__base_time + (time.perf_counter() - self.__base_real) * self.__scale
+
+    def tick(self, real_dt: float) -> float:
+        return real_dt * self.__scale
+
+    def to_real(self, duration: float) -> float:
+        return duration / self.__scale if self.__scale > 0 else float("inf")
+
+
+class ManualClock(Clock):
+    """step을 호출할 때만 흐르는 시계. 고정 간격으로 시뮬레이션하거나 테스트할 때 사용."""
+    def __init__(self, start: float = 0.0) -> None:
+        self.__time: float = start
+
+    def now(self) -> float:
+        return self.__time
+
+    def tick(self, real_dt: float) -> float:
+        # 실제 시간과 무관하게 step으로만 진행됨.
+        return 0.0
+
+    def step(self, dt: float) -> None:
+        """시계를 dt초 진행."""
+        self.__time += dt
+
+    def run(self, timeline: "Timeline", duration: float, step: float = 1 / 60) -> int:
+        """step초 간격으로 시계를 진행하며 timeline을 duration초 동안 갱신. 갱신한 프레임 수를 반환.
+        타임라인이 도중에 유휴 상태가 되면 남은 프레임을 건너뜀."""
+        frames: int = 0
+        end: float = self.__time + duration
+        while self.__time < end:
+            self.step(min(step, end - self.__time))
+            timeline.tick()
+            frames += 1
+            if timeline.idle:
+                self.__time = end
+        return frames
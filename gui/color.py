@@ -58,6 +58,10 @@ class Color:
     def blue() -> "Color":
         return Color(0.0, 0.0, 1.0, 1.0)
 
+    @staticmethod
+    def yellow() -> "Color":
+        return Color(1.0, 1.0, 0.0, 1.0)
+
     def __repr__(self) -> str:
         return f"Color({self.r}, {self.g}, {self.b}, {self.a})"
 
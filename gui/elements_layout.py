@@ -1,10 +1,11 @@
-import time
+from typing import List
 
 import pyglet
 from pyglet.math import Vec2
 from pyglet.event import EventDispatcher
 
 from gui.scenes import Scene
+from gui.transform import Transform2D
 from gui.transitions import Transition
 from gui.utils import clamp, lerp
 
@@ -57,6 +58,12 @@ class CardsLayout(ElementsLayoutBase):
             `initial_scroll`: float - 초기 스크롤 값. 0인 경우 가장 왼쪽 카드가 화면 중앙에 위치.
             `selected`: int - 현재 선택된 카드 인덱스.
             `scroll_sensitivity`: float - 스크롤 속력."""
+        self.__cache_valid: bool = False
+        self.__xs: List[float] = []
+        """인덱스별 x좌표 캐시."""
+        self.__scales: List[float] = []
+        """인덱스별 크기 계수 캐시."""
+        self.__cache_y: float = 0.0
         super().__init__(scene, length)
         self.space: int = space
         self.y: int = y
@@ -68,13 +75,7 @@ class CardsLayout(ElementsLayoutBase):
         self.scroll_sensitivity: float = scroll_sensitivity
         self.selected: int = selected
         self.scroll_transition: Transition = Transition(self.scroll_value, float(selected * space), 1.0)
-        self.scroll_transition.start(time.time())
-
-        @self.scene.event
-        def on_scene_updated(dt: float):
-            if self.scroll_transition.active:
-                self.scroll_value = self.scroll_transition.update(time.time())
-                self.dispatch_event("on_layout_modified")
+        self.scene.timeline.play(self.scroll_transition, self._on_scroll_updated)
 
         @self.scene.window.event
         def on_mouse_scroll(x: int, y: int, scroll_x: float, scroll_y: float):
@@ -111,30 +112,89 @@ class CardsLayout(ElementsLayoutBase):
         # @self.scene.window.event
         # def on_resize(w: int, h: int):
         #     self.dispatch_event("on_layout_modified")
-        self.scene.push_handlers(on_scene_window_resized=lambda w,h: self.dispatch_event("on_layout_modified"))
+        self.scene.push_handlers(on_scene_window_resized=self._on_scene_window_resized)
 
     # def _nearest_index(start: float, space: float, length: int, target: float) -> int:
     #     """target과 가장 가까운 등차수열 항의 번호를 계산."""
     #     index: int = round((target - start) / space)
     #     return 0 if index < 0 else (length - 1 if index >= length else index)
+    @property
+    def length(self) -> int:
+        return self.__length
+
+    @length.setter
+    def length(self, value: int) -> None:
+        self.__length = value
+        self.__cache_valid = False
+
+    def _on_scene_window_resized(self, w: int, h: int):
+        self.__cache_valid = False
+        self.dispatch_event("on_layout_modified")
+
+    def _on_scroll_updated(self, scroll_value: float):
+        self.scroll_value = scroll_value
+        self.__cache_valid = False
+        self.dispatch_event("on_layout_modified")
+
+    def _rebuild_cache(self) -> None:
+        """모든 인덱스의 위치와 크기 계수를 한 번에 계산해 캐시에 저장."""
+        length: int = self.__length
+        if len(self.__xs) != length:
+            self.__xs = [0.0] * length
+            self.__scales = [0.0] * length
+        xs, scales = self.__xs, self.__scales
+        scale_factor: float = self.scene.scale_factor
+        width: int = self.scene.window.width
+        base_x: float = -self.scroll_value * scale_factor + width // 2
+        step: float = self.space * scale_factor
+        center_scale, scale_width = self.center_scale, self.scale_width
+        for i in range(length):
+            x: float = base_x + step * i
+            distance: float = abs(x / width - 0.5) * 2
+            xs[i] = x
+            scales[i] = scale_factor if distance > scale_width \
+                else lerp(center_scale, 1.0, distance / scale_width) * scale_factor
+        self.__cache_y = self.y * scale_factor + self.scene.window.height // 2
+        self.__cache_valid = True
+
     def trigger_scroll(self):
         self.scroll_transition.start_value = self.scroll_value
         self.scroll_transition.destination_value = float(self.space * self.selected)
-        self.scroll_transition.start(time.time())
+        self.scene.timeline.play(self.scroll_transition, self._on_scroll_updated)
 
     def get_position(self, index: int) -> Vec2:
+        if not self.__cache_valid:
+            self._rebuild_cache()
+        if 0 <= index < len(self.__xs):
+            return Vec2(self.__xs[index], self.__cache_y)
         return Vec2(self.space*index - self.scroll_value, self.y) * self.scene.scale_factor + Vec2(self.scene.window.width // 2, self.scene.window.height // 2)
     
     def get_rotation(self, index: int) -> float:
         return 0.0
     
     def get_scale(self, index: int) -> float:
+        if not self.__cache_valid:
+            self._rebuild_cache()
+        if 0 <= index < len(self.__scales):
+            return self.__scales[index]
         pos_x: float = self.get_position(index).x
         normal_x: float = pos_x / self.scene.window.width
         if abs(normal_x - 0.5)*2 > self.scale_width:
             return self.scene.scale_factor
         return lerp(self.center_scale, 1.0, abs(normal_x - 0.5)*2/self.scale_width) * self.scene.scale_factor
 
+    def get_transform(self, index: int) -> Transform2D:
+        """index번째 카드의 위치, 회전, 크기를 한 번에 반환."""
+        scale: float = self.get_scale(index)
+        return Transform2D(self.get_position(index), self.get_rotation(index), Vec2(scale, scale))
+
+    def is_visible(self, x: float, margin: float | None = None) -> bool:
+        """x좌표에 위치한 카드가 창 안(좌우 여백 포함)에 있는지 여부.
+        여백을 주지 않으면 가장 크게 그려진 카드의 간격만큼 사용."""
+        if margin is None:
+            margin = self.space * self.scene.scale_factor * self.center_scale
+        return -margin <= x <= self.scene.window.width + margin
+
     def get_width(self) -> int:
         """가장 왼쪽 카드의 기준점부터 가장 오른쪽 카드 기준점까지의 거리 계산.
         화면비에 영향을 받지 않는 값."""
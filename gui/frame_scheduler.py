@@ -0,0 +1,122 @@
+"""
+장면 갱신과 다시 그리기를 필요할 때만 수행하는 스케줄러.
+전이가 진행 중이거나 예약된 단계가 있거나 입력이 들어온 경우에만 프레임을 예약하고,
+할 일이 없으면 다음 예약 단계까지(없다면 다음 입력까지) 아무것도 하지 않음.
+pyglet.app.run(None)과 함께 사용해야 pyglet이 스스로 다시 그리지 않음.
+"""
+import time
+from collections import deque
+from typing import Deque, Final, Optional, Tuple, TYPE_CHECKING
+
+import pyglet
+
+if TYPE_CHECKING:
+    from gui.scenes.scene import Scene
+
+
+FRAME_INTERVAL: Final[float] = 1 / 60
+"""프레임이 연속으로 필요할 때의 간격."""
+STATS_WINDOW: Final[float] = 2.0
+"""FrameStats가 집계하는 최근 시간(초)."""
+# 프레임을 깨우는 창 이벤트.
+_WAKE_EVENTS: Final[Tuple[str, ...]] = (
+    "on_key_press", "on_key_release", "on_text",
+    "on_mouse_motion", "on_mouse_press", "on_mouse_release", "on_mouse_drag", "on_mouse_scroll",
+    "on_mouse_enter", "on_mouse_leave",
+    "on_resize", "on_expose", "on_show", "on_activate",
+)
+
+
+class FrameStats:
+    """최근 STATS_WINDOW초 동안 그린 프레임 수와 갱신/그리기에 쓴 시간."""
+    def __init__(self, window: float = STATS_WINDOW) -> None:
+        self.window: float = window
+        self.__frames: Deque[Tuple[float, float]] = deque()
+        """(시작 시각, 끝 시각)."""
+        self.total_frames: int = 0
+
+    def record(self, start: float, end: float) -> None:
+        """프레임 하나를 기록. time.perf_counter() 기준."""
+        self.__frames.append((start, end))
+        self.total_frames += 1
+        self._trim(end)
+
+    def _trim(self, now: float) -> None:
+        while len(self.__frames) > 0 and self.__frames[0][1] < now - self.window:
+            self.__frames.popleft()
+
+    def fps(self, now: Optional[float] = None) -> float:
+        """최근 초당 프레임 수."""
+        self._trim(time.perf_counter() if now is None else now)
+        return len(self.__frames) / self.window
+
+    def busy_ratio(self, now: Optional[float] = None) -> float:
+        """최근 시간 중 갱신과 그리기에 쓴 비율(0~1). 유휴 상태라면 0에 가까움."""
+        self._trim(time.perf_counter() if now is None else now)
+        return sum(end - start for start, end in self.__frames) / self.window
+
+    def frame_time(self) -> float:
+        """최근 프레임 하나에 걸린 평균 시간(초)."""
+        if len(self.__frames) == 0:
+            return 0.0
+        return sum(end - start for start, end in self.__frames) / len(self.__frames)
+
+    def summary(self) -> str:
+        now: float = time.perf_counter()
+        return f"{self.fps(now):.1f} fps | busy {self.busy_ratio(now) * 100:.1f}% | {self.frame_time() * 1000:.2f} ms/frame"
+
+
+class FrameScheduler:
+    """창 하나의 장면 갱신과 다시 그리기를 예약. GameContext.frames로 공유되며 Scene이 load될 때 연결됨.
+    continuous가 참이면 예전처럼 매 프레임 갱신하고 그림."""
+    def __init__(self, window: pyglet.window.Window, interval: float = FRAME_INTERVAL, continuous: bool = False) -> None:
+        self.window: pyglet.window.Window = window
+        self.interval: float = interval
+        self.continuous: bool = continuous
+        self.stats: FrameStats = FrameStats()
+        self.__scene: Optional["Scene"] = None
+        self.__next_frame: Optional[float] = None
+        """예약된 프레임의 시각. 없다면 None."""
+        self.__last_frame: float = time.perf_counter()
+
+        self.window.push_handlers(**{name: self._on_window_event for name in _WAKE_EVENTS})
+        # 이후 window.event로 등록되는 처리기가 위 처리기를 덮어쓰지 않도록 빈 층을 추가.
+        self.window.push_handlers()
+
+    def _on_window_event(self, *_) -> None:
+        self.request()
+
+    def attach(self, scene: "Scene") -> None:
+        """장면을 연결하고 첫 프레임을 예약."""
+        self.__scene = scene
+        self.request()
+
+    def detach(self, scene: "Scene") -> None:
+        if self.__scene is scene:
+            self.__scene = None
+
+    def request(self, delay: float = 0.0) -> None:
+        """delay초 뒤에 프레임을 예약. 이미 그보다 먼저 예약된 프레임이 있다면 무시.
+        입력이 몰려도 프레임 간격은 interval 이상으로 유지됨."""
+        now: float = time.perf_counter()
+        target: float = max(now + delay, self.__last_frame + self.interval)
+        if self.__next_frame is not None and self.__next_frame <= target:
+            return
+        pyglet.clock.unschedule(self._frame)
+        pyglet.clock.schedule_once(self._frame, target - now)
+        self.__next_frame = target
+
+    def _frame(self, _) -> None:
+        self.__next_frame = None
+        start: float = time.perf_counter()
+        dt: float = start - self.__last_frame
+        self.__last_frame = start
+        scene: Optional["Scene"] = self.__scene
+        if scene is not None and scene.active:
+            scene.on_update_scene(dt)
+        self.window.draw(dt)
+        self.stats.record(start, time.perf_counter())
+
+        delay: Optional[float] = 0.0 if self.continuous or scene is None else scene.update_delay()
+        if delay is not None:
+            self.request(delay)
@@ -1,12 +1,28 @@
-from typing import Callable
+from typing import Callable, Optional
+
+from gui.clock import Clock, RealClock
+from gui.frame_scheduler import FrameScheduler
 
 
 class GameContext:
     """모든 Scene이 공유하는 게임 상태.
     Scene을 관리하고 있는 스크립트에서 생성해 사용."""
-    def __init__(self, on_change_scene: Callable[[str], None], file_path: str = "") -> None:
+    def __init__(
+            self,
+            on_change_scene: Callable[[str], None],
+            file_path: str = "",
+            clock: Optional[Clock] = None,
+            frames: Optional[FrameScheduler] = None,
+            engine_process: bool = False
+        ) -> None:
         self.on_change_scene = on_change_scene
         self.file_path: str = file_path
+        self.clock: Clock = clock if clock is not None else RealClock()
+        """모든 Scene의 전이와 갱신이 사용하는 시계. 배속이나 수동 진행 시계로 바꿀 수 있음."""
+        self.frames: Optional[FrameScheduler] = frames
+        """필요할 때만 장면을 갱신하고 다시 그리는 스케줄러. None이면 Scene이 고정 간격으로 갱신됨."""
+        self.engine_process: bool = engine_process
+        """참이면 게임 화면이 GameManager를 별도 프로세스(core.engine_process)에서 실행함."""
     
     def load_scene(self, name: str):
         """주어진 이름으로 Scene을 불러오게 함."""
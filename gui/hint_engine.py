@@ -0,0 +1,78 @@
+import threading
+from typing import Final, Optional
+
+from core.mcts import MCTSResult, MonteCarloSearch
+from core.obj_data_formats import Action
+
+
+HINT_TIME_BUDGET: Final[float] = 1.5
+"""한 번의 추천에 사용할 탐색 시간(초)."""
+
+
+class HintEngine:
+    """게임 화면에서 추천 행동을 계산하는 백그라운드 탐색기.
+    탐색은 별도 스레드에서 이루어지며, 화면 갱신 루프는 poll로 결과만 가져감.
+    새 요청이 들어오면 이전 탐색은 취소되고 그 결과는 버려짐."""
+    def __init__(self, time_budget: float = HINT_TIME_BUDGET) -> None:
+        self.time_budget: float = time_budget
+        self.last_result: Optional[MCTSResult] = None
+        """마지막으로 끝난 탐색의 결과. playouts_per_second 등의 확인용."""
+        self.__lock = threading.Lock()
+        self.__cancel: Optional[threading.Event] = None
+        self.__generation: int = 0
+        self.__result: Optional[MCTSResult] = None
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.last_result.playouts_per_second if self.last_result is not None else 0.0
+
+    @property
+    def busy(self) -> bool:
+        """탐색이 진행 중인지 여부."""
+        with self.__lock:
+            return self.__cancel is not None and not self.__cancel.is_set()
+
+    @property
+    def pending(self) -> bool:
+        """탐색이 진행 중이거나 아직 poll하지 않은 결과가 있는지 여부."""
+        with self.__lock:
+            return (self.__cancel is not None and not self.__cancel.is_set()) or self.__result is not None
+
+    def request(self, tree: dict) -> None:
+        """주어진 상태(GameManager.to_save_tree())에서 탐색을 새로 시작."""
+        cancel = threading.Event()
+        with self.__lock:
+            if self.__cancel is not None:
+                self.__cancel.set()
+            self.__cancel = cancel
+            self.__generation += 1
+            self.__result = None
+            generation: int = self.__generation
+        threading.Thread(
+            target=self._search, args=(tree, generation, cancel), name="HintEngine", daemon=True
+        ).start()
+
+    def cancel(self) -> None:
+        """진행 중인 탐색을 취소하고 아직 가져가지 않은 결과를 버림."""
+        with self.__lock:
+            if self.__cancel is not None:
+                self.__cancel.set()
+            self.__cancel = None
+            self.__generation += 1
+            self.__result = None
+
+    def poll(self) -> Optional[Action]:
+        """가장 최근 요청의 탐색이 끝났다면 추천 행동을, 아니면 None을 반환.
+        같은 결과는 한 번만 반환함."""
+        with self.__lock:
+            result, self.__result = self.__result, None
+        return result.action if result is not None else None
+
+    def _search(self, tree: dict, generation: int, cancel: threading.Event) -> None:
+        result: MCTSResult = MonteCarloSearch(tree).run(self.time_budget, cancel)
+        with self.__lock:
+            if generation != self.__generation or cancel.is_set():
+                return
+            self.last_result = result
+            self.__result = result
+            self.__cancel = None
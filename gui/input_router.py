@@ -0,0 +1,128 @@
+"""
+장면의 위젯에 마우스 이벤트를 나누어 주는 스크립트.
+위젯마다 창에 처리기를 등록하면 마우스가 움직일 때마다 모든 위젯이 호출되므로,
+장면마다 InputRouter 하나만 창에 등록하고 균일 격자로 커서 아래의 위젯만 찾아 전달함.
+"""
+from typing import Dict, Final, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from pyglet.gui import WidgetBase
+
+if TYPE_CHECKING:
+    from gui.scenes.scene import Scene
+
+
+GRID_CELL_SIZE: Final[int] = 64
+"""격자 한 칸의 크기(픽셀)."""
+
+_Cell = Tuple[int, int]
+
+
+class InputRouter:
+    """위젯의 영역을 균일 격자에 담아 두고 마우스 이벤트를 커서 아래의 위젯에만 전달.
+    격자는 위젯이 움직였다고 알리면(invalidate) 다음 마우스 이벤트에서 다시 만듦.
+    커서가 위젯을 벗어날 때와 누른 채 벗어난 뒤 뗄 때에도 해당 위젯에 전달해 hover와 눌림 상태가 풀리도록 함."""
+    def __init__(self, scene: "Scene", cell_size: int = GRID_CELL_SIZE) -> None:
+        self.scene: "Scene" = scene
+        self.cell_size: int = cell_size
+        self.__widgets: List[WidgetBase] = []
+        """등록 순서대로의 위젯. 같은 칸에서도 이 순서대로 전달됨."""
+        self.__grid: Dict[_Cell, List[WidgetBase]] = {}
+        self.__valid: bool = False
+        self.__hovered: List[WidgetBase] = []
+        """마지막 마우스 이동에서 커서 아래에 있던 위젯."""
+        self.__pressed: List[WidgetBase] = []
+        """마우스를 누를 때 커서 아래에 있던 위젯. 뗄 때와 끌 때 전달됨."""
+        self.__attached: bool = False
+
+    def attach(self) -> None:
+        """창에 마우스 처리기를 등록. Scene.load에서 호출됨."""
+        if self.__attached:
+            return
+        self.scene.window.push_handlers(
+            on_mouse_motion=self.on_mouse_motion,
+            on_mouse_press=self.on_mouse_press,
+            on_mouse_release=self.on_mouse_release,
+            on_mouse_drag=self.on_mouse_drag
+        )
+        self.scene.push_handlers(on_scene_window_resized=self._on_scene_window_resized)
+        self.__attached = True
+
+    def detach(self) -> None:
+        if not self.__attached:
+            return
+        self.scene.window.remove_handlers(
+            on_mouse_motion=self.on_mouse_motion,
+            on_mouse_press=self.on_mouse_press,
+            on_mouse_release=self.on_mouse_release,
+            on_mouse_drag=self.on_mouse_drag
+        )
+        self.scene.remove_handlers(on_scene_window_resized=self._on_scene_window_resized)
+        self.__attached = False
+
+    def add(self, widget: WidgetBase) -> None:
+        self.__widgets.append(widget)
+        self.__valid = False
+
+    def remove(self, widget: WidgetBase) -> None:
+        if widget in self.__widgets:
+            self.__widgets.remove(widget)
+        if widget in self.__hovered:
+            self.__hovered.remove(widget)
+        if widget in self.__pressed:
+            self.__pressed.remove(widget)
+        self.__valid = False
+
+    def invalidate(self) -> None:
+        """위젯의 위치나 크기가 바뀌었음을 알림."""
+        self.__valid = False
+
+    def _on_scene_window_resized(self, w: int, h: int) -> None:
+        self.__valid = False
+
+    def _cell_range(self, start: float, end: float) -> range:
+        return range(int(start // self.cell_size), int(end // self.cell_size) + 1)
+
+    def _rebuild(self) -> None:
+        self.__grid.clear()
+        for widget in self.__widgets:
+            left, bottom, right, top = widget.aabb
+            for cx in self._cell_range(left, right):
+                for cy in self._cell_range(bottom, top):
+                    self.__grid.setdefault((cx, cy), []).append(widget)
+        self.__valid = True
+
+    def widgets_at(self, x: float, y: float) -> List[WidgetBase]:
+        """(x, y)를 포함하는 위젯을 등록 순서대로 반환."""
+        if not self.__valid:
+            self._rebuild()
+        cell: Optional[List[WidgetBase]] = self.__grid.get((int(x // self.cell_size), int(y // self.cell_size)))
+        if cell is None:
+            return []
+        return [widget for widget in cell if widget._check_hit(x, y)]
+
+    def on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> None:
+        hovered: List[WidgetBase] = self.widgets_at(x, y)
+        current: Set[int] = {id(widget) for widget in hovered}
+        # 커서가 벗어난 위젯도 hover 상태를 풀 수 있도록 한 번 더 전달.
+        for widget in list(self.__hovered):
+            if id(widget) not in current:
+                widget.on_mouse_motion(x, y, dx, dy)
+        for widget in hovered:
+            widget.on_mouse_motion(x, y, dx, dy)
+        self.__hovered = hovered
+
+    def on_mouse_press(self, x: int, y: int, buttons: int, modifiers: int) -> None:
+        # 처리 중에 위젯이 삭제될 수 있으므로 복사본을 순회함.
+        pressed: List[WidgetBase] = self.widgets_at(x, y)
+        self.__pressed = list(pressed)
+        for widget in pressed:
+            widget.on_mouse_press(x, y, buttons, modifiers)
+
+    def on_mouse_release(self, x: int, y: int, buttons: int, modifiers: int) -> None:
+        pressed, self.__pressed = self.__pressed, []
+        for widget in pressed:
+            widget.on_mouse_release(x, y, buttons, modifiers)
+
+    def on_mouse_drag(self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int) -> None:
+        for widget in list(self.__pressed):
+            widget.on_mouse_drag(x, y, dx, dy, buttons, modifiers)
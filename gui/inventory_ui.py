@@ -1,4 +1,4 @@
-from typing import Dict, Final, List
+from typing import Dict, Final, List, Optional
 
 import pyglet
 from pyglet.math import Vec2
@@ -10,10 +10,12 @@ from pyglet.graphics import Batch, Group
 
 from core.obj_data_formats import ItemDrawData
 from gui.anchored_widget import AnchorPreset
+from gui.assets import ANCHOR_CENTER, assets
 from gui.buttons import SolidButton, SolidButtonState
 from gui.color import Color
 from gui.elements_layout import ItemsLayout
 from gui.scenes.scene import Scene
+from gui.utils import set_label_layout
 
 
 ITEM_DEFAULT_ICON: Final[str] = "item_unknown.png"
@@ -55,15 +57,15 @@ class InventoryUI(EventDispatcher):
 
         self.user_purchasable: bool = True
 
-        self.item_default_image = pyglet.resource.image(ITEM_DEFAULT_ICON)
-        self.item_default_image.width = self.item_default_image.height = icon_size
-        self.item_default_image.anchor_x = self.item_default_image.anchor_y = icon_size // 2
+        self.item_default_image = assets.image(ITEM_DEFAULT_ICON, anchor=ANCHOR_CENTER, size=(icon_size, icon_size))
 
         self.icons: List[Sprite] = []
         self.placeholders: List[BorderedRectangle] = []
         self.index_labels: List[Label] = []
 
         self.items_table: Dict[int, ItemDrawData] = {}
+        self.highlighted_id: Optional[int] = None
+        """강조 표시할(추천된) 아이템의 id."""
 
         for i in range(layout.length):
             # self.icons.append(Sprite(self.item_blank_image, batch=batch, group=self.group_content))
@@ -192,7 +194,7 @@ class InventoryUI(EventDispatcher):
     def update_layout(self) -> None:
         self.pagebtn_prev.position = self.layout.get_position(-1, scaled=False)
         self.pagebtn_next.position = self.layout.get_position(self.layout.length, scaled=False)
-        self.pagelabel.font_size = PAGE_FONT_SIZE*self.scene.scale_factor
+        set_label_layout(self.pagelabel, PAGE_FONT_SIZE*self.scene.scale_factor)
         self.pagelabel.position = *(
             Vec2(self.scene.window.width/2, 0) 
             + (Vec2(0, self.layout.y) + PAGE_LABEL_OFFSET)*self.scene.scale_factor), 0
@@ -203,14 +205,11 @@ class InventoryUI(EventDispatcher):
             self.placeholders[i].position = (*rect_position,)
             self.icons[i].scale = ICON_CONTENT_SCALE * self.scene.scale_factor
             self.icons[i].position = (*center_position, 0)
-            self.index_labels[i].font_size = ITEM_INDEX_FONT_SIZE*self.scene.scale_factor
+            set_label_layout(self.index_labels[i], ITEM_INDEX_FONT_SIZE*self.scene.scale_factor)
             self.index_labels[i].position = *(rect_position + (Vec2(0, self.icon_size)+ITEM_INDEX_LABEL_OFFSET)*self.scene.scale_factor), 0
 
         if self.group_tooltip.visible and self._calc_hovered_index(self.tooltip_index):
-            self.tooltip_title.font_size = TOOLTIP_TITLE_FONT_SIZE * self.scene.scale_factor
-            self.tooltip_description.font_size = self.tooltip_additional_description.font_size = \
-                TOOLTIP_CONTENT_FONT_SIZE * self.scene.scale_factor
-            self.tooltip_description.width = TOOLTIP_MAX_WIDTH * self.scene.scale_factor
+            self._update_tooltip_font()
             self._update_tooltip_layout(self.tooltip_index)
 
     def update_image(self) -> None:
@@ -218,14 +217,14 @@ class InventoryUI(EventDispatcher):
             global_index: int = i + self.layout.length*self.pages
             if global_index in self.items_table:
                 item_data: ItemDrawData = self.items_table[global_index]
-                try:
-                    img = pyglet.resource.image(item_data.sprite_name)
-                except pyglet.resource.ResourceNotFoundException:
-                    img = pyglet.resource.image(ITEM_DEFAULT_ICON)
-                img.width = img.height = self.icon_size
-                img.anchor_x = img.anchor_y = self.icon_size // 2
-                self.icons[i].image = img
+                self.icons[i].image = assets.image(
+                    item_data.sprite_name, fallback=ITEM_DEFAULT_ICON,
+                    anchor=ANCHOR_CENTER, size=(self.icon_size, self.icon_size)
+                )
                 self.icons[i].visible = True
+                self.placeholders[i].border_color = (
+                    Color.yellow() if item_data.id == self.highlighted_id else Color.white()
+                ).tuple_256()
                 if self.user_purchasable:
                     self.placeholders[i].opacity = 255
                     self.index_labels[i].opacity = 255
@@ -234,9 +233,15 @@ class InventoryUI(EventDispatcher):
                     self.index_labels[i].opacity = 64
             else:
                 self.icons[i].visible = False
+                self.placeholders[i].border_color = Color.white().tuple_256()
                 self.placeholders[i].opacity = 32
                 self.index_labels[i].opacity = 64
             
+    def set_highlight(self, item_id: Optional[int]) -> None:
+        """주어진 id의 아이템을 강조 표시. None이면 강조 표시를 없앰."""
+        self.highlighted_id = item_id
+        self.update_image()
+
     def push_item(self, item_data: ItemDrawData) -> None:
         """아이템을 목록에 추가.
         
@@ -284,15 +289,20 @@ class InventoryUI(EventDispatcher):
             return -1
         return int(local_x / self.layout.space)
 
+    def _update_tooltip_font(self) -> None:
+        set_label_layout(self.tooltip_title, TOOLTIP_TITLE_FONT_SIZE * self.scene.scale_factor)
+        set_label_layout(
+            self.tooltip_description, TOOLTIP_CONTENT_FONT_SIZE * self.scene.scale_factor,
+            width=TOOLTIP_MAX_WIDTH * self.scene.scale_factor
+        )
+        set_label_layout(self.tooltip_additional_description, TOOLTIP_CONTENT_FONT_SIZE * self.scene.scale_factor)
+
     def _show_tooltip(self, index: int, data: ItemDrawData):
         """주어진 정보를 이용해 툴팁을 보임."""
         if self.group_tooltip.visible and index == self.tooltip_index:
             return
         self.tooltip_index = index
-        self.tooltip_title.font_size = TOOLTIP_TITLE_FONT_SIZE * self.scene.scale_factor
-        self.tooltip_description.font_size = self.tooltip_additional_description.font_size = \
-            TOOLTIP_CONTENT_FONT_SIZE * self.scene.scale_factor
-        self.tooltip_description.width = TOOLTIP_MAX_WIDTH * self.scene.scale_factor
+        self._update_tooltip_font()
         self.tooltip_title.text = data.name
         self.tooltip_description.text = data.description
         self.tooltip_additional_description.text = f"사용하려면 아이콘을 클릭하거나 '{index+1}' 키를 입력하세요."
@@ -0,0 +1,70 @@
+"""화면 밖의 텍스처에 그리는 기능을 모아 둔 스크립트."""
+from typing import Callable
+
+import pyglet
+from pyglet.gl import (
+    GL_COLOR_BUFFER_BIT,
+    GL_COLOR_CLEAR_VALUE,
+    GL_SCISSOR_TEST,
+    GLfloat,
+    glClear,
+    glClearColor,
+    glDisable,
+    glEnable,
+    glGetFloatv,
+    glScissor,
+    glViewport,
+)
+from pyglet.image import Texture
+from pyglet.image.buffer import Framebuffer
+from pyglet.math import Mat4
+
+
+def render_to_region(
+        window: pyglet.window.Window,
+        texture: Texture,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        draw: Callable[[], None],
+        clear_color: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+    ) -> None:
+    """texture의 (x, y)부터 width x height 영역만 지우고 draw()가 그리는 내용을 담음.
+    draw()는 영역의 왼쪽 아래가 (0, 0)인 좌표계로 그리며, 창의 투영 행렬과 뷰포트, 지우는 색은 그린 뒤 되돌림."""
+    framebuffer = Framebuffer()
+    framebuffer.attach_texture(texture)
+    framebuffer.bind()
+    projection: Mat4 = window.projection
+    previous_clear_color = (GLfloat * 4)()
+    glGetFloatv(GL_COLOR_CLEAR_VALUE, previous_clear_color)
+    try:
+        glViewport(x, y, width, height)
+        glEnable(GL_SCISSOR_TEST)
+        glScissor(x, y, width, height)
+        window.projection = Mat4.orthogonal_projection(0, width, 0, height, -255, 255)
+        glClearColor(*clear_color)
+        glClear(GL_COLOR_BUFFER_BIT)
+        draw()
+    finally:
+        glDisable(GL_SCISSOR_TEST)
+        glClearColor(*previous_clear_color)
+        window.projection = projection
+        framebuffer.unbind()
+        window.viewport = window.viewport
+        framebuffer.delete()
+
+
+def render_to_texture(
+        window: pyglet.window.Window,
+        width: int,
+        height: int,
+        draw: Callable[[], None],
+        clear_color: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+    ) -> Texture:
+    """width x height 크기의 텍스처를 만들어 draw()가 그리는 내용을 담아 반환. 기준점은 텍스처 중앙으로 지정됨."""
+    texture: Texture = Texture.create(width, height)
+    render_to_region(window, texture, 0, 0, width, height, draw, clear_color)
+    texture.anchor_x = width // 2
+    texture.anchor_y = height // 2
+    return texture
@@ -1,14 +1,15 @@
 from enum import Enum, auto
 from typing import Dict, Final, List, Tuple
 
-import pyglet
 from pyglet.math import Vec2
 from pyglet.text import Label
 from pyglet.sprite import Sprite
 from pyglet.graphics import Batch, Group
+from gui.assets import ANCHOR_LEFT, assets
 from gui.color import Color
 
 from gui.scenes.scene import Scene
+from gui.utils import quantize_scale, set_label_layout
 
 class HUDValueType(Enum):
     """HUD에 출력할 데이터의 종류."""
@@ -72,8 +73,7 @@ class PlayerHUD:
         self.ui_space: int = space
         self.top_left: Vec2 = top_left
 
-        img_placeholder = pyglet.resource.image(PLACEHOLDER)
-        img_placeholder.width, img_placeholder.height = width, height
+        img_placeholder = assets.image(PLACEHOLDER, size=(width, height))
 
         text: Dict[HUDValueType, str] = {
             HUDValueType.Turn: f"{self.val_table[HUDValueType.Turn]}턴",
@@ -88,12 +88,7 @@ class PlayerHUD:
         self.change_labels: Dict[HUDValueType, Label] = {}
 
         for val_type in HUDValueType:
-            try:
-                img_icon = pyglet.resource.image(ICON_TABLE[val_type])
-            except pyglet.resource.ResourceNotFoundException:
-                img_icon = pyglet.resource.image(ICON_DEFALUT)
-            img_icon.width, img_icon.height = Vec2(1,1) * ICON_SIZE
-            img_icon.anchor_x, img_icon.anchor_y = 0, img_icon.height / 2
+            img_icon = assets.image(ICON_TABLE[val_type], fallback=ICON_DEFALUT, anchor=ANCHOR_LEFT, size=(ICON_SIZE, ICON_SIZE))
             self.icon_sprites[val_type] = Sprite(img_icon, batch=batch, group=self.group_content)    
             self.labels[val_type] = Label(
                 text=text[val_type],
@@ -125,13 +120,16 @@ class PlayerHUD:
             self.icon_sprites[val_type].position = *((bottom_left + Vec2(0, self.ui_height/2) + ICON_OFFSET)*self.scene.scale_factor_y), 0
             self.icon_sprites[val_type].scale = self.scene.scale_factor_y
             self.labels[val_type].position = *((bottom_left + Vec2(0, self.ui_height/2) + LABEL_OFFSET)*self.scene.scale_factor_y), 0
-            self.labels[val_type].width = (self.ui_width - ICON_SIZE)*self.scene.scale_factor_y
-            self.labels[val_type].font_size = STAT_FONT_SIZE*self.scene.scale_factor_y
+            set_label_layout(
+                self.labels[val_type], STAT_FONT_SIZE*self.scene.scale_factor_y,
+                # 너비는 글자 배치를 다시 계산하게 하므로 창 높이가 조금 바뀔 때마다 달라지지 않도록 반올림한 배율을 사용.
+                width=(self.ui_width - ICON_SIZE)*quantize_scale(self.scene.scale_factor_y)
+            )
             if self.change_labels[val_type].visible:
                 self._update_change_label_layout(val_type)
 
     def _update_change_label_layout(self, val_type: HUDValueType):
-        self.change_labels[val_type].font_size = CHANGES_FONT_SIZE*self.scene.scale_factor_y
+        set_label_layout(self.change_labels[val_type], CHANGES_FONT_SIZE*self.scene.scale_factor_y)
         self.change_labels[val_type].width = self.change_labels[val_type].content_width
         self.change_labels[val_type].position = *((
             Vec2(*self.labels[val_type].position[:2])
@@ -160,7 +158,7 @@ class PlayerHUD:
             self.change_labels[state_type].color = (Color.green() if delta > 0 else Color.red()).tuple_256()
             self.change_labels[state_type].visible = True
             self._update_change_label_layout(state_type)
-            pyglet.clock.schedule_once(
+            self.scene.timeline.schedule_once(
                 lambda dt, label, visible: self._set_label_visible(label, visible), 
                 duration, label=self.change_labels[state_type], visible=False
             )
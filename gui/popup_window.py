@@ -9,6 +9,7 @@ from gui.color import Color
 from gui.scenes.scene import Scene
 from gui.anchored_widget import AnchorPreset
 from gui.buttons import SolidButton, SolidButtonState
+from gui.utils import set_label_layout
 
 
 FONT_FAMILY: Final[str] = "Neo둥근모 Pro"
@@ -108,8 +109,8 @@ class PopupWindow:
         if not self.group_bg.visible:
             return
         
-        self.label_title.font_size = TITLE_FONT_SIZE * self.scene.scale_factor
-        self.label_content.font_size = CONTENT_FONT_SIZE * self.scene.scale_factor
+        set_label_layout(self.label_title, TITLE_FONT_SIZE * self.scene.scale_factor)
+        set_label_layout(self.label_content, CONTENT_FONT_SIZE * self.scene.scale_factor)
 
         self.bg.width = max(
             self.label_title.content_width, self.label_content.content_width,
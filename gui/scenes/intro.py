@@ -11,6 +11,8 @@ from gui.color import Color
 from gui.game_context import GameContext
 from gui.scenes.scene import Scene
 from gui.buttons import SolidButton, SolidButtonState
+from gui.background_task import ProgressCallback
+from gui.utils import set_label_layout
 
 
 TITLE_FONT: Final[str] = "Algerian"
@@ -24,6 +26,25 @@ BUTTON_TEXT_PIVOT: Final[int] = 20
 LEVEL_PATH: Final[str] = "data/levels"
 SAVES_PATH: Final[str] = "data/saves"
 
+
+def scan_game_files(is_savefile: bool, progress: ProgressCallback) -> List[Tuple[str, str]]:
+    """저장 파일(is_savefile이 참) 또는 레벨 파일을 모두 읽어 (표시할 이름, 파일 경로) 목록을 반환.
+    파일을 열어 읽으므로 작업 스레드에서 호출함."""
+    directory: str = SAVES_PATH if is_savefile else LEVEL_PATH
+    file_names: List[str] = [name for name in os.listdir(directory) if name.endswith(".json")]
+    label_and_filepath: List[Tuple[str, str]] = []
+    for index, file_name in enumerate(file_names):
+        filepath: str = os.path.join(directory, file_name)
+        with open(filepath, encoding="utf-8") as f:
+            tree = json.load(f)
+        label_and_filepath.append((
+            f"{tree['level_name']} ({tree['current_turn']}턴) - {tree['datetime']}" if is_savefile else tree["level_name"],
+            filepath
+        ))
+        progress((index + 1) / len(file_names))
+    return label_and_filepath
+
+
 class IntroScene(Scene):
     """게임 실행 시 보이는 타이틀 화면."""
 
@@ -89,7 +110,7 @@ class IntroScene(Scene):
         self.batch.draw()
 
     def _on_scene_window_resized(self, w, h):
-        self.title_text.font_size = TITLE_FONT_SIZE * self.scale_factor
+        set_label_layout(self.title_text, TITLE_FONT_SIZE * self.scale_factor)
         self.title_text.x=self.window.width//2
         self.title_text.y=self.window.height//2+TITLE_OFFSET_Y*self.scale_factor
         for btn in self.selection_btns:
@@ -103,26 +124,13 @@ class IntroScene(Scene):
         self.continue_btn.visible = self.continue_btn.enabled = False
         self.newgame_btn.visible = self.newgame_btn.enabled = False
 
-        label_and_filepath: List[Tuple[str, str]] = []
-        if is_savefile:
-            for filepath in os.listdir(SAVES_PATH):
-                if not filepath.endswith(".json"): continue
-                with open(os.path.join(SAVES_PATH, filepath), encoding="utf-8") as f:
-                    tree = json.load(f)
-                    label_and_filepath.append((
-                        f"{tree['level_name']} ({tree['current_turn']}턴) - {tree['datetime']}",
-                        os.path.join(SAVES_PATH, filepath)
-                    ))
-        else:
-            for filepath in os.listdir(LEVEL_PATH):
-                if not filepath.endswith(".json"): continue
-                with open(os.path.join(LEVEL_PATH, filepath), encoding="utf-8") as f:
-                    tree = json.load(f)
-                    label_and_filepath.append((
-                        tree["level_name"],
-                        os.path.join(LEVEL_PATH, filepath)
-                    ))
+        # 파일 목록은 작업 스레드에서 읽고, 다 읽으면 버튼을 만듦.
+        self.run_in_background(
+            lambda progress: scan_game_files(is_savefile, progress),
+            on_done=self._create_selection_btns
+        )
 
+    def _create_selection_btns(self, label_and_filepath: List[Tuple[str, str]]) -> None:
         for ind, (text, filepath) in enumerate(label_and_filepath+[("돌아가기", "")]):
             if ind >= len(self.selection_btns):
                 self.selection_btns.append(SolidButton(
@@ -142,14 +150,14 @@ class IntroScene(Scene):
             )
             btn.update_layout()
 
-        pyglet.clock.schedule_once(self._show_selection_btn, delay=0.02)
+        self.timeline.schedule_once(self._show_selection_btn, delay=0.02)
 
     def return_to_title(self):
         for btn in self.selection_btns:
             btn.visible = btn.enabled = False
         self.title_text.text = "Star Rewrite"
         # 이벤트를 활성과 동시에 받는 것 방지.
-        pyglet.clock.schedule_once(self._show_title_btn, delay=0.02)
+        self.timeline.schedule_once(self._show_title_btn, delay=0.02)
 
     def _show_title_btn(self, dt):
         self.continue_btn.visible = self.continue_btn.enabled = True
@@ -159,6 +167,14 @@ class IntroScene(Scene):
         for i in self.selection_btns:
             i.visible = i.enabled = True
     
+    def show_loading(self, progress: float) -> None:
+        """게임 화면을 준비하는 동안 버튼을 숨기고 진행률을 표시."""
+        for btn in self.selection_btns:
+            btn.visible = btn.enabled = False
+        text: str = f"Loading {progress * 100:.0f}%"
+        if self.title_text.text != text:
+            self.title_text.text = text
+
     def load_game(self, filepath):
         self.context.file_path = filepath
         self.context.load_scene("main")
@@ -1,12 +1,18 @@
-from typing import Any, Dict, Final, List, Optional, Tuple
+import time
+from typing import Any, Callable, Dict, Final, List, Optional, Set, Tuple
 
 import pyglet
 from pyglet.math import Vec2
 
 from core import GameManager
-from core.obj_data_formats import DrawEvent, ItemDrawData
-from core.enums import CardType, DrawEventType, PlayerStat
-from gui.card import Card
+from core.engine_process import EngineClient
+from core.obj_data_formats import Action, DrawEvent, DrawEventBatch, ItemDrawData
+from core.enums import ActionType, DrawEventCoalescing, DrawEventType, GameResult, PlayerStat
+from gui.assets import assets
+from gui.background_task import ProgressCallback
+from gui.card import Card, CardFaceCache, CardVisualPool
+from gui.text_cache import TextTextureCache
+from gui.hint_engine import HintEngine
 from gui.color import Color
 from gui.scenes import Scene
 from gui.inventory_ui import InventoryUI
@@ -17,28 +23,76 @@ from gui.buttons import SolidButton, SolidButtonState
 from gui.elements_layout import CardsLayout, ItemsLayout
 
 CONTENTS_FONT: Final[str] = "Neo둥근모 Pro"
+TURBO_TRANSITION: Final[float] = 0.2
+"""빨리 감기 모드에서 최종 상태로 이동하는 전이 시간(초)."""
+HINT_POLL_INTERVAL: Final[float] = 0.1
+"""추천 행동 탐색 중 결과를 확인하는 간격(초)."""
+FRAME_STATS_REFRESH: Final[float] = 1.0
+"""프레임 통계를 표시하는 동안 다시 그리는 간격(초)."""
+DRAW_EVENT_BUDGET: Final[float] = 0.004
+"""한 번의 갱신에서 DrawEvent 처리에 쓰는 최대 시간(초). 남은 이벤트는 다음 갱신에서 이어서 처리함."""
 
 class MainScene(Scene):
-    def load(self):
-        super().load()
-
+    def prepare(self, progress: ProgressCallback) -> Any:
+        """게임 생성(카드 데이터 초기화와 효과 컴파일 포함)과 이미지 파일 읽기를 작업 스레드에서 수행."""
         filepath = self.context.file_path
         assert filepath != "", "파일 경로가 설정되지 않았습니다."
+        # 별도 프로세스를 사용하면 행동의 결과는 _poll_engine에서 받아 처리함.
+        game: GameManager | EngineClient = EngineClient(filepath) if self.context.engine_process \
+            else GameManager.create_from_file(filepath)
+        progress(0.5)
+        assets.decode(lambda ratio: progress(0.5 + ratio * 0.5))
+        return game
+
+    def load(self):
+        super().load()
 
-        self.game: GameManager = GameManager.create_from_file(filepath)
+        # 준비 없이 불러온 경우 여기서 모두 수행.
+        self.game: GameManager | EngineClient = self.prepared if self.prepared is not None \
+            else self.prepare(lambda progress: None)
+        self.prepared = None
+        # 읽어 둔 이미지를 텍스처 아틀라스로 전송.
+        assets.load()
         self.game_state = self.game.get_game_draw_state()
+        # 이벤트는 예산에 맞춰 여러 갱신에 나누어 처리하므로, 한 번에 많은 이벤트가 쌓여도 버리지 않도록 크기를 제한하지 않음.
+        self.draw_events = self.game.subscribe_draw_events(
+            maxlen=None, take_pending=True, coalescing=DrawEventCoalescing.Batch
+        )
 
-        self.bg_sprite = pyglet.sprite.Sprite(pyglet.resource.image("background.png"))
+        self.bg_sprite = pyglet.sprite.Sprite(assets.image("background.png"))
 
         self.ui_batch = pyglet.graphics.Batch()
         self.ui_group = pyglet.graphics.Group(order=5)
 
         self.card_batch = pyglet.graphics.Batch()
         self.card_group = pyglet.graphics.Group(order=3)
-        self.card_thumnail_group = pyglet.graphics.Group(order=2)
-        self.card_text_group = pyglet.graphics.Group(order=4)
+        # 화면에 보이는 카드만 스프라이트를 가지며, 스크롤에 따라 재사용됨.
+        # 앞면은 한 장의 텍스처로 합성해 카드마다 스프라이트 하나로 그림.
+        self.text_cache = TextTextureCache(self.window)
+        self.card_face_cache = CardFaceCache(self.window, self.text_cache)
+        self.card_pool = CardVisualPool(self.card_batch, self.card_group, self.card_face_cache)
         self.frame_display = pyglet.window.FPSDisplay(window=self.window)
 
+        # 추천 행동 표시(H 키로 켜고 끔).
+        self.hint_engine = HintEngine()
+        self.hint_enabled: bool = False
+        self._hint_card: Optional[Card] = None
+        self._hint_ids: Tuple[List[int], List[int]] = ([], [])
+        self.push_handlers(on_scene_updated=self._poll_hint)
+        self.push_handlers(on_scene_updated=self._poll_engine)
+
+        # 프레임 통계 표시(F 키로 켜고 끔).
+        self.show_frame_stats: bool = False
+        self.frame_stats_label = pyglet.text.Label(
+            "", font_name=CONTENTS_FONT, font_size=12,
+            color=Color.white().tuple_256(), anchor_x="left", anchor_y="top"
+        )
+        self.push_handlers(on_scene_updated=self._update_frame_stats)
+
+        # 빨리 감기 모드(T 키로 켜고 끄거나, 스페이스 키를 누르고 있는 동안).
+        self.turbo: bool = False
+        self._turbo_held: bool = False
+
         self.setup_scene()
 
         def on_window_resized(w: int, h: int):
@@ -53,6 +107,8 @@ class MainScene(Scene):
             self.card_batch.draw()
             self.ui_batch.draw()
             # self.frame_display.draw()
+            if self.show_frame_stats:
+                self.frame_stats_label.draw()
 
     def setup_scene(self):
         """GameDrawState를 이용해 게임 상태 초기화."""
@@ -73,8 +129,15 @@ class MainScene(Scene):
             scroll_sensitivity=500.0
         )
 
-        self.cards = [Card(data, self.card_layout, self.card_batch, self.card_group, self.card_thumnail_group, self.card_text_group, index=index)
+        self.cards = [Card(data, self.card_layout, self.card_pool, index=index)
                     for index, data in enumerate(self.game_state.deck)]
+        self.card_by_id: Dict[int, Card] = {card.data.id: card for card in self.cards}
+        """카드 id -> self.cards의 Card. self.cards와 함께 갱신됨."""
+        # 여러 갱신에 걸쳐 처리 중인 DrawEvent의 상태.
+        self._draw_events_active: bool = False
+        self._draw_resume_at: float = 0.0
+        """다음에 처리할 이벤트의 애니메이션을 시작할 시각(context.clock 기준)."""
+        self.push_handlers(on_scene_updated=self._on_draw_events_updated)
         
         self.buy_button = SolidButton(
             self, x=0, y=130, width=200, height=50, border=3, 
@@ -104,7 +167,18 @@ class MainScene(Scene):
         def on_key_press(symbol, modifier):
             if self.user_controllable and (symbol == pyglet.window.key.ENTER):
                 self._buy_card(self.card_layout.selected)
-        self.window.push_handlers(on_key_press)
+            elif symbol == pyglet.window.key.H:
+                self.set_hint_enabled(not self.hint_enabled)
+            elif symbol == pyglet.window.key.T:
+                self.turbo = not self.turbo
+            elif symbol == pyglet.window.key.F:
+                self.show_frame_stats = not self.show_frame_stats
+            elif symbol == pyglet.window.key.SPACE:
+                self._turbo_held = True
+        def on_key_release(symbol, modifier):
+            if symbol == pyglet.window.key.SPACE:
+                self._turbo_held = False
+        self.window.push_handlers(on_key_press, on_key_release)
 
         self.item_layout = ItemsLayout(self, 10, space=60, y=60, height=50)
         self.inventory = InventoryUI(
@@ -136,16 +210,16 @@ class MainScene(Scene):
         """카드가 구매 가능한지 확인."""
         if not (0 <= index < min(len(self.cards), 3) or self.user_controllable):
             return False
-        card = self.cards[index].data
-        if not card.is_front_face or self.game_state.player_remaining_action <= 0:
+        if not 0 <= index < len(self.cards) or self.game_state.player_remaining_action <= 0:
             return False
-        return (self.game_state.player_health + self.game_state.player_attack >= card.current_cost
-                if card.type == CardType.Enemy
-                else self.game_state.player_money >= card.current_cost)
+        # 구매 조건은 GameManager가 관리하는 색인을 그대로 사용.
+        # 애니메이션이 끝나기 전에는 화면의 카드 순서가 덱과 다를 수 있으므로 위치가 아닌 id로 확인.
+        return self.cards[index].data.id in self.game.purchasable_ids()
     
     def _remove_card(self, card: Card):
         card.delete()
         self.cards.remove(card)
+        self.card_by_id.pop(card.data.id, None)
 
     def _rearrange_card(self, changes: List[Tuple[Card, int]]):
         """주어진 카드 이동 정보를 이용해 self.cards를 재배치.
@@ -159,34 +233,173 @@ class MainScene(Scene):
     def _buy_card(self, index: int):
         """버튼을 눌렀을 때 해당 카드를 구매함."""
         if self._check_purchasable(index):
-            self.game.buy_card(self.cards[index].data.id)
-            self.process_draw_events()
+            self._apply_action(lambda: self.game.buy_card(self.cards[index].data.id))
 
     def _use_item(self, item_id: int):
         """아이콘을 클릭했을 때 해당 아이템을 사용함."""
         if self.user_controllable and self.game_state.player_remaining_action > 0:
-            self.game.use_item(item_id)
+            self._apply_action(lambda: self.game.use_item(item_id))
+
+    def _apply_action(self, action: Callable[[], bool]) -> None:
+        """행동을 실행하고 결과를 화면에 반영. 엔진이 별도 프로세스라면 결과가 도착한 뒤 반영함."""
+        if isinstance(self.game, EngineClient):
+            self.set_user_controllable(False)
+            action()
+            self.request_redraw()
+            return
+        action()
+        self.process_draw_events()
+
+    def _poll_engine(self, dt: float) -> None:
+        """별도 프로세스에서 실행한 행동의 결과가 도착했다면 반영."""
+        if isinstance(self.game, EngineClient) and self.game.poll():
             self.process_draw_events()
 
-    def _pop_same_drawevents(self, drawevents: List[DrawEvent | Any], target: DrawEventType) -> List[DrawEvent]:
-        """같은 종류의 연속된 DrawEvent를 전부 뽑아 옴."""
-        result: List[DrawEvent] = []
-        while len(drawevents) > 0 and isinstance(drawevents[0], DrawEvent) and drawevents[0].event_type == target:
-            result.append(drawevents.pop(0))
-        return result
+    def _resync(self) -> None:
+        """구독 버퍼가 넘쳐 이벤트를 놓친 경우, 애니메이션 없이 현재 게임 상태로 화면을 다시 구성."""
+        self.draw_events.clear()
+        self.game_state = self.game.get_game_draw_state()
+        for card in self.cards:
+            card.delete()
+        self.cards = [Card(data, self.card_layout, self.card_pool, index=index)
+                    for index, data in enumerate(self.game_state.deck)]
+        self.card_by_id = {card.data.id: card for card in self.cards}
+        for item_data in list(self.inventory.items_table.values()):
+            self.inventory.remove_item(item_data.id)
+        for item_data in self.game_state.inventory:
+            self.inventory.push_item(item_data)
+        self.hud.set_states({
+            HUDValueType.Turn: (self.game_state.current_turn, False),
+            HUDValueType.Money: (self.game_state.player_money, False),
+            HUDValueType.Health: (self.game_state.player_health, False),
+            HUDValueType.Attack: (self.game_state.player_attack, False),
+            HUDValueType.Action: (self.game_state.player_remaining_action, False),
+        })
     
+    @property
+    def turbo_active(self) -> bool:
+        """빨리 감기 모드 여부."""
+        return self.turbo or self._turbo_held
+
+    def _show_result_popup(self, result: GameResult) -> None:
+        """게임 결과 팝업을 표시."""
+        if result == GameResult.Won:
+            self.popup.show_popup(
+                title="승리!", content=f"우두머리를 처치했습니다!\n소요 턴: {self.game_state.current_turn}",
+                submit_msg="마치기", on_submit=self.end_game
+            )
+        elif result != GameResult.InProgress:
+            self.popup.show_popup(
+                title="패배!", 
+                content=("지금의 당신이 맞서기엔 적이 너무 강했습니다." 
+                    if result == GameResult.LostByHealth else "모든 미래를 찾아보아도 대책을 찾지 못했습니다.") \
+                    + f"\n소요 턴: {self.game_state.current_turn}",
+                submit_msg="마치기", on_submit=self.end_game
+            )
+
+    def _fast_forward(self) -> None:
+        """남은 DrawEvent를 버리고 get_delta_since로 받은 최종 상태를 한 프레임에 반영.
+        이벤트 수와 관계없이 예약하는 콜백은 조작 가능 복귀 하나뿐이며, 카드 이동은 짧은 전이 한 번으로 끝남."""
+        self.draw_events.clear()
+        delta = self.game.get_delta_since(self.game_state.version)
+        cards: Dict[int, Card] = {card.data.id: card for card in self.cards}
+        removed_cards: List[int] = delta.removed_cards
+        removed_items: List[int] = delta.removed_items
+        new_items: List[ItemDrawData] = delta.items
+        if delta.full and delta.deck_order is not None:
+            # 삭제 기록 없이 전체 상태가 왔으므로 목록에 없는 카드와 아이템을 직접 찾음.
+            deck_ids: Set[int] = set(delta.deck_order)
+            item_ids: Set[int] = {item.id for item in delta.items}
+            held_ids: Set[int] = {item.id for item in self.game_state.inventory}
+            removed_cards = [id for id in cards if id not in deck_ids]
+            removed_items = [id for id in held_ids if id not in item_ids]
+            new_items = [item for item in delta.items if item.id not in held_ids]
+        for id in removed_cards:
+            if (card := cards.pop(id, None)) is not None:
+                card.delete()
+        for data in delta.cards:
+            if (card := cards.get(data.id)) is not None:
+                card.data = data
+                card.set_cost(data.current_cost)
+                card.set_front_face(data.is_front_face)
+            elif delta.deck_order is not None:
+                # 새로 생긴 카드는 일단 맨 끝에 만든 뒤 아래에서 제자리로 이동.
+                cards[data.id] = Card(
+                    data, self.card_layout, self.card_pool,
+                    index=len(cards))
+        if delta.deck_order is not None:
+            self.cards = [cards[id] for id in delta.deck_order if id in cards]
+            for index, card in enumerate(self.cards):
+                if card.index != index:
+                    card.move_to(index, TURBO_TRANSITION)
+        else:
+            self.cards = [card for card in self.cards if card.data.id in cards]
+        self.card_by_id = {card.data.id: card for card in self.cards}
+        self.card_layout.length = len(self.cards)
+        for id in removed_items:
+            self.inventory.remove_item(id)
+        for item_data in new_items:
+            self.inventory.push_item(item_data)
+        self.game_state.apply_delta(delta)
+        if delta.stats is not None:
+            self.hud.set_states({
+                HUDValueType.Turn: (self.game_state.current_turn, True),
+                HUDValueType.Money: (self.game_state.player_money, True),
+                HUDValueType.Health: (self.game_state.player_health, True),
+                HUDValueType.Attack: (self.game_state.player_attack, True),
+                HUDValueType.Action: (self.game_state.player_remaining_action, True),
+            }, duration=TURBO_TRANSITION * 5)
+        if self.game.game_end:
+            self._show_result_popup(self.game.result)
+        else:
+            self.timeline.schedule_once(
+                func=lambda dt, controllable: self.set_user_controllable(controllable), 
+                delay=TURBO_TRANSITION, controllable=True
+            )
+        self._request_hint()
+
     def process_draw_events(self) -> None:
-        """현재까지 발생한 DrawEvent를 순서대로 처리."""
-        draw_events = self.game.get_draw_events()
+        """현재까지 발생한 DrawEvent를 순서대로 처리. 빨리 감기 모드라면 최종 상태만 반영.
+        한 번의 갱신에서는 DRAW_EVENT_BUDGET초까지만 처리하고, 남은 이벤트는 다음 갱신부터 이어서 처리함.
+        이미 처리 중이라면 새 이벤트도 진행 중인 처리에서 함께 처리됨."""
+        if self._draw_events_active:
+            return
         self.set_user_controllable(False)
-        invoke_after: float = 0.0
-        while len(draw_events) > 0:
-            event = draw_events.pop(0)
-            if isinstance(event, DrawEvent):
+        if self.draw_events.overflowed:
+            self._resync()
+        if self.turbo_active:
+            self._fast_forward()
+            return
+        self._draw_events_active = True
+        self._draw_resume_at = self.context.clock.now()
+        self._continue_draw_events()
+
+    def _on_draw_events_updated(self, dt: float) -> None:
+        if self._draw_events_active:
+            self._continue_draw_events()
+
+    def _continue_draw_events(self) -> None:
+        """시간 예산 안에서 DrawEvent를 처리. 모두 처리했다면 조작 가능 복귀와 상태 동기화를 수행."""
+        deadline: float = time.perf_counter() + DRAW_EVENT_BUDGET
+        # 이전 갱신에서 예약한 애니메이션에 이어지도록, 남은 지연 시간부터 시작.
+        invoke_after: float = max(0.0, self._draw_resume_at - self.context.clock.now())
+        while len(self.draw_events) > 0:
+            if self.draw_events.overflowed:
+                # 갱신 사이에 버퍼가 넘쳤다면 남은 이벤트는 의미가 없으므로 현재 상태로 다시 구성.
+                self._resync()
+                break
+            if time.perf_counter() >= deadline:
+                self._draw_resume_at = self.context.clock.now() + invoke_after
+                return
+            event = self.draw_events.pop()
+            if isinstance(event, (DrawEvent, DrawEventBatch)):
+                # 연속된 카드 공개/이동/파괴/비용 변화와 능력치 변화는 구독 단계에서 묶음으로 합쳐져 들어옴.
+                group = event if isinstance(event, DrawEventBatch) else (event,)
+                # 턴 시작, 아이템 파괴, 패배는 합쳐지지 않으므로 항상 DrawEvent로 들어옴.
                 match (event.event_type):
-                    case DrawEventType.TurnBegin:
+                    case DrawEventType.TurnBegin if isinstance(event, DrawEvent):
                         self.game_state.current_turn = event.current
-                        pyglet.clock.schedule_once(
+                        self.timeline.schedule_once(
                             func=lambda dt, states, duration: self.hud.set_states(states, duration), 
                             delay=invoke_after, states={HUDValueType.Turn: (event.current, True)}, duration=2.0
                         )
@@ -195,18 +408,18 @@ class MainScene(Scene):
                         pass
                     case DrawEventType.CardShown:
                         # 연속된 CardShown 이벤트를 일괄 처리.
-                        for i in event, *self._pop_same_drawevents(draw_events, DrawEventType.CardShown):
+                        for i in group:
                             if (card := self.find_card_by_id(i.target_id)) is not None:
-                                pyglet.clock.schedule_once(
+                                self.timeline.schedule_once(
                                     func=lambda dt, is_front_face, card=card: card.set_front_face(is_front_face), 
                                     delay=invoke_after, is_front_face=bool(i.current)
                                 )
                         invoke_after += 0.3 # 0.3초 지연.
                     case DrawEventType.CardMoved:
                         moved_table: List[Tuple[Card, int]] = []
-                        for i in event, *self._pop_same_drawevents(draw_events, DrawEventType.CardMoved):
+                        for i in group:
                             if (card := self.find_card_by_id(i.target_id)) is not None:
-                                pyglet.clock.schedule_once(
+                                self.timeline.schedule_once(
                                     func=lambda dt, new_index, duration, card=card: card.move_to(new_index, duration), 
                                     delay=invoke_after, new_index=i.current, duration=0.5
                                 )
@@ -216,47 +429,38 @@ class MainScene(Scene):
                     case DrawEventType.CardPurchased:
                         pass
                     case DrawEventType.CardDestroyed:
-                        for i in event, *self._pop_same_drawevents(draw_events, DrawEventType.CardDestroyed):
+                        for i in group:
                             if (card := self.find_card_by_id(i.target_id)) is not None:
-                                pyglet.clock.schedule_once(
+                                self.timeline.schedule_once(
                                     # func=lambda dt, card: self._remove_card(card), 
                                     func=lambda dt, card=card: card.delete(),
                                     delay=invoke_after #, card=card
                                 )
                                 self.cards.remove(card)
+                                del self.card_by_id[card.data.id]
                         invoke_after += 0.1
                     case DrawEventType.CardCostChanged:
-                        for i in event, *self._pop_same_drawevents(draw_events, DrawEventType.CardCostChanged):
+                        for i in group:
                             if (card := self.find_card_by_id(i.target_id)) is not None:
                                 card.data.current_cost = i.current
-                                pyglet.clock.schedule_once(
+                                self.timeline.schedule_once(
                                     func=lambda dt, new_cost, card=card: card.set_cost(new_cost), 
                                     delay=invoke_after, new_cost=i.current
                                 )
                         invoke_after += 0.5
                     case DrawEventType.ItemUsed:
                         pass
-                    case DrawEventType.ItemDestroyed:
-                        pyglet.clock.schedule_once(
+                    case DrawEventType.ItemDestroyed if isinstance(event, DrawEvent):
+                        self.timeline.schedule_once(
                             func=lambda dt, item_id: self.inventory.remove_item(item_id), 
                             delay=invoke_after, 
                             item_id=event.target_id
                         )
                         invoke_after += 0.1
                     case DrawEventType.PlayerWon:
-                        self.popup.show_popup(
-                            title="승리!", content=f"우두머리를 처치했습니다!\n소요 턴: {self.game_state.current_turn}",
-                            submit_msg="마치기", on_submit=self.end_game
-                        )
-                    case DrawEventType.PlayerLost:
-                        print(event.target_id)
-                        self.popup.show_popup(
-                            title="패배!", 
-                            content=("지금의 당신이 맞서기엔 적이 너무 강했습니다." 
-                                if event.target_id == 0 else "모든 미래를 찾아보아도 대책을 찾지 못했습니다.") \
-                                + f"\n소요 턴: {self.game_state.current_turn}",
-                            submit_msg="마치기", on_submit=self.end_game
-                        )
+                        self._show_result_popup(GameResult.Won)
+                    case DrawEventType.PlayerLost if isinstance(event, DrawEvent):
+                        self._show_result_popup(GameResult.LostByHealth if event.target_id == 0 else GameResult.LostByNoAction)
                     case DrawEventType.PlayerStatChanged:
                         changed_table: Dict[HUDValueType, Tuple[int, bool]] = {}
                         key_table: Dict[PlayerStat, HUDValueType] = {
@@ -265,7 +469,7 @@ class MainScene(Scene):
                                 PlayerStat.Health: HUDValueType.Health,
                                 PlayerStat.Money: HUDValueType.Money
                             }
-                        for i in event, *self._pop_same_drawevents(draw_events, DrawEventType.PlayerStatChanged):
+                        for i in group:
                             changed_table[key_table[PlayerStat(i.target_id)]] = (i.current, True)
                         for i in changed_table:
                             match i:
@@ -277,7 +481,7 @@ class MainScene(Scene):
                                     self.game_state.player_health = changed_table[i][0]
                                 case HUDValueType.Money:
                                     self.game_state.player_money = changed_table[i][0]
-                        pyglet.clock.schedule_once(
+                        self.timeline.schedule_once(
                             func=lambda dt, states, duration: self.hud.set_states(states, duration), 
                             delay=invoke_after, states=changed_table, duration=2.0
                         )
@@ -285,7 +489,7 @@ class MainScene(Scene):
 
             elif isinstance(event, ItemDrawData):
                 # 아이템 생성 이벤트.
-                pyglet.clock.schedule_once(
+                self.timeline.schedule_once(
                     func=lambda dt, item_data: self.inventory.push_item(item_data), 
                     delay=invoke_after, item_data=event
                 )
@@ -296,26 +500,87 @@ class MainScene(Scene):
                     card = Card(
                         event[0], 
                         self.card_layout, 
-                        self.card_batch, self.card_group, 
-                        self.card_thumnail_group, self.card_text_group,
+                        self.card_pool,
                         index=event[1])
                     self.cards.insert(event[1], card)
-                    if len(draw_events) <= 0 or not isinstance(draw_events[0], tuple):
+                    self.card_by_id[card.data.id] = card
+                    if not isinstance(self.draw_events.peek(), tuple) or time.perf_counter() >= deadline:
                         break
-                    event = draw_events[0]
-                    draw_events.pop(0)
+                    event = self.draw_events.pop()
+        self._draw_events_active = False
         if not self.game.game_end:
-            pyglet.clock.schedule_once(
+            self.timeline.schedule_once(
                 func=lambda dt, controllable: self.set_user_controllable(controllable), 
                 delay=invoke_after, controllable=True
             )
+        # 위에서 일부만 갱신한 game_state를 실제 상태와 맞춰, 빨리 감기 모드가 이 시점부터 이어서 반영하도록 함.
+        self.game_state.apply_delta(self.game.get_delta_since(self.game_state.version))
+        # 상태가 바뀌었으므로 추천 행동을 새로 탐색.
+        self._request_hint()
+
+    def set_hint_enabled(self, enabled: bool) -> None:
+        """추천 행동 표시를 켜거나 끔."""
+        self.hint_enabled = enabled
+        self._request_hint()
+
+    def _clear_hint(self) -> None:
+        if self._hint_card is not None:
+            self._hint_card.set_highlight(False)
+            self._hint_card = None
+        self.inventory.set_highlight(None)
+
+    def _request_hint(self) -> None:
+        """현재 상태에서 추천 행동 탐색을 시작. 진행 중이던 탐색은 취소됨."""
+        self._clear_hint()
+        # 엔진이 행동을 처리하는 중이라면 결과를 반영한 뒤 다시 요청됨.
+        if not self.hint_enabled or (isinstance(self.game, EngineClient) and self.game.waiting) or self.game.game_end:
+            self.hint_engine.cancel()
+            return
+        # 탐색 결과는 인덱스로 주어지므로, 요청 시점의 카드/아이템 id를 기억해 둠.
+        # game_state는 이 시점에 실제 상태와 맞춰져 있으므로, 엔진이 별도 프로세스여도 왕복 없이 읽음.
+        self._hint_ids = (
+            [card.id for card in self.game_state.deck],
+            [item.id for item in self.game_state.inventory]
+        )
+        self.hint_engine.request(self.game.to_save_tree())
+
+    def _poll_hint(self, dt: float) -> None:
+        """탐색이 끝났다면 추천 행동을 강조 표시."""
+        action: Optional[Action] = self.hint_engine.poll()
+        if action is None:
+            return
+        card_ids, item_ids = self._hint_ids
+        match (action.action_type):
+            case ActionType.BuyCard:
+                if (card := self.find_card_by_id(card_ids[action.index])) is not None:
+                    card.set_highlight(True)
+                    self._hint_card = card
+            case ActionType.UseItem:
+                self.inventory.set_highlight(item_ids[action.index])
+
+    def _update_frame_stats(self, dt: float) -> None:
+        if not self.show_frame_stats or self.context.frames is None:
+            return
+        summary: str = self.context.frames.stats.summary()
+        if isinstance(self.game, EngineClient):
+            summary += " | " + self.game.latency_summary()
+        self.frame_stats_label.text = summary
+        self.frame_stats_label.position = (10, self.window.height - 10, 0)
+
+    def update_delay(self) -> Optional[float]:
+        """탐색 중인 추천 행동, 엔진 프로세스의 응답, 남은 DrawEvent, 프레임 통계 표시도 주기적인 갱신이 필요함."""
+        delays: List[float] = [delay for delay in (
+            super().update_delay(),
+            HINT_POLL_INTERVAL if self.hint_engine.pending else None,
+            0.0 if isinstance(self.game, EngineClient) and self.game.waiting else None,
+            0.0 if self._draw_events_active else None,
+            FRAME_STATS_REFRESH if self.show_frame_stats else None
+        ) if delay is not None]
+        return min(delays) if len(delays) > 0 else None
 
     def find_card_by_id(self, id: int) -> Optional[Card]:
         """주어진 id를 가진 Card를 탐색."""
-        for card in self.cards:
-            if card.data.id == id:
-                return card
-        return None
+        return self.card_by_id.get(id)
             
     def set_user_controllable(self, controllable: bool) -> None:
         """(애니메이션 재생 등의 목적으로) 사용자의 입력을 받을지 설정함."""
@@ -326,6 +591,17 @@ class MainScene(Scene):
         else:
             self.buy_button.set_enabled(False)
 
+    def unload(self):
+        self.hint_engine.cancel()
+        self.frame_stats_label.delete()
+        self.draw_events.close()
+        self.card_pool.delete()
+        self.card_face_cache.clear()
+        self.text_cache.clear()
+        if isinstance(self.game, EngineClient):
+            self.game.close()
+        super().unload()
+
     def end_game(self):
         """게임 종료 후 플레이어가 마침 버튼을 누른 경우 호출."""
         self.window.close()
@@ -1,11 +1,20 @@
 import math
+from typing import Any, Callable, Final, List, Optional, Tuple
 
 import pyglet
 
-from gui.utils import lerp
+from gui.utils import lerp, quantize_scale
+from gui.timeline import Timeline
+from gui.input_router import InputRouter
+from gui.background_task import BackgroundTask, ProgressCallback
 from gui.game_context import GameContext
 
 
+BACKGROUND_POLL_INTERVAL: Final[float] = 1 / 30
+"""백그라운드 작업이 진행 중일 때 결과를 확인하는 간격(초)."""
+_TaskEntry = Tuple[BackgroundTask, Callable[[Any], None], Optional[ProgressCallback]]
+
+
 class Scene(pyglet.event.EventDispatcher):
     """게임에서 사용할 장면의 부모 클래스. 인트로(게임 선택), 메인 화면 등이 예."""
 
@@ -22,40 +31,133 @@ class Scene(pyglet.event.EventDispatcher):
         self.context = context
         self.active: bool = False
         self.user_controllable = True
+        self.timeline: Timeline = Timeline(lambda: self.context.clock.now())
+        """이 장면의 모든 전이와 예약된 단계를 갱신하는 타임라인."""
+        self.input_router: InputRouter = InputRouter(self)
+        """이 장면의 위젯에 마우스 이벤트를 전달하는 객체."""
+        self.__pending_size: Optional[Tuple[int, int]] = None
+        """아직 반영하지 않은 창 크기. 다음 갱신에서 한 번에 반영함."""
+        self.__applied_size: Optional[Tuple[int, int]] = None
+        self.__tasks: List[_TaskEntry] = []
+        self.prepared: Any = None
+        """prepare()가 반환한 값. load()에서 사용하며, 준비 없이 불러왔다면 None."""
 
     def load(self):
         """저장된 Window 객체에서 Scene을 구성함."""
         self.active = True
         self.window.push_handlers(on_resize=self.on_resize_window)
-        pyglet.clock.schedule_interval(self.on_update_scene, 1/30)
-        # 로딩 직후 레이아웃 재계산.
-        pyglet.clock.schedule_once(
-            lambda dt, w, h: self.on_resize_window(w, h), 
-            delay=0.002, w=self.window.width, h=self.window.height
-        )
+        self.input_router.attach()
+        if self.context.frames is not None:
+            self.context.frames.attach(self)
+        else:
+            pyglet.clock.schedule_interval(self.on_update_scene, 1/30)
+        # 로딩 직후(첫 갱신에서) 레이아웃 재계산.
+        self.__applied_size = None
+        self.on_resize_window(self.window.width, self.window.height)
 
     def unload(self):
         """저장된 Window 객체에서 이 Scene을 삭제. 다른 Scene으로 전환하기 전 호출할 것."""
         self.active = False
-        pyglet.clock.unschedule(self.on_update_scene)
+        self.input_router.detach()
+        if self.context.frames is not None:
+            self.context.frames.detach(self)
+        else:
+            pyglet.clock.unschedule(self.on_update_scene)
+        self.timeline.clear()
+        # 진행 중인 작업의 결과는 버림.
+        self.__tasks.clear()
 
     def on_resize_window(self, w: int, h: int) -> None:
         """
         창 크기가 변할 때 호출됨.
+        창 크기를 조절하는 동안 여러 번 호출되므로 크기만 기록하고, 레이아웃 재계산은 다음 갱신에서 한 번만 수행함."""
+        self.__pending_size = (w, h)
+        self.request_redraw()
+
+    def apply_resize(self) -> None:
+        """
+        기록된 창 크기를 반영. 크기가 그대로라면 아무것도 하지 않음.
         기본 동작: 기준 화면 해상도 대비 현재 해상도를 기반으로 크기 상수를 계산.
         Unity의 CanvasScaler를 참고.
+        scale_factor는 SCALE_STEP 단위로 반올림됨.
         params:
-            w: 현재 해상도의 가로.
-            h: 현재 해상도의 세로.
             match_w_h: 가로 혹은 세로 변화율의 반영 비율. 0에 가까울수록 가로가, 1에 가까울수록 세로가 더 많이 반영됨."""
+        size: Optional[Tuple[int, int]] = self.__pending_size
+        self.__pending_size = None
+        if size is None or size == self.__applied_size:
+            return
+        self.__applied_size = size
+        w, h = size
         self.scale_factor_x = w / self.ref_w
         self.scale_factor_y = h / self.ref_h
-        self.scale_factor = math.exp(lerp(math.log(self.scale_factor_x), math.log(self.scale_factor_y), self.match_w_h))
+        self.scale_factor = quantize_scale(math.exp(lerp(math.log(self.scale_factor_x), math.log(self.scale_factor_y), self.match_w_h)))
         self.dispatch_event("on_scene_window_resized", w, h)
 
     def on_update_scene(self, dt):
+        self.apply_resize()
+        dt = self.context.clock.tick(dt)
+        self.timeline.tick()
+        self._poll_tasks()
         self.dispatch_event("on_scene_updated", dt)
 
+    def prepare(self, progress: ProgressCallback) -> Any:
+        """
+        load() 전에 작업 스레드에서 호출되어 파일 읽기 등 오래 걸리는 준비를 수행. 반환값은 load()에서 self.prepared로 받음.
+        GL이나 pyglet 객체를 다루면 안 됨. 기본 동작: 아무것도 하지 않음."""
+        return None
+
+    def show_loading(self, progress: float) -> None:
+        """다른 Scene을 준비하는 동안 진행률(0~1)을 표시. 기본 동작: 아무것도 하지 않음."""
+        pass
+
+    def run_in_background(
+            self,
+            func: Callable[[ProgressCallback], Any],
+            on_done: Callable[[Any], None],
+            on_progress: Optional[ProgressCallback] = None
+        ) -> BackgroundTask:
+        """func를 작업 스레드에서 실행하고, 끝나면 갱신 루프에서 on_done(결과)을 호출.
+        진행 중에는 갱신마다 on_progress(진행률)를 호출하며, 장면을 unload하면 결과를 버림."""
+        task: BackgroundTask = BackgroundTask(func)
+        self.__tasks.append((task, on_done, on_progress))
+        self.request_redraw()
+        return task
+
+    def _poll_tasks(self) -> None:
+        # on_done에서 장면이 바뀔 수 있으므로 끝난 작업을 먼저 목록에서 뺀 뒤 호출함.
+        for entry in list(self.__tasks):
+            if entry not in self.__tasks:
+                continue
+            task, on_done, on_progress = entry
+            try:
+                finished: bool = task.poll()
+            except BaseException:
+                self.__tasks.remove(entry)
+                raise
+            if finished:
+                self.__tasks.remove(entry)
+                on_done(task.result())
+            elif on_progress is not None:
+                on_progress(task.progress)
+
+    def update_delay(self) -> Optional[float]:
+        """다음 갱신이 필요할 때까지 남은 실제 시간. 0이면 다음 프레임, None이면 입력 등으로 요청될 때까지 갱신하지 않음.
+        FrameScheduler가 프레임마다 호출함."""
+        if self.__pending_size is not None:
+            return 0.0
+        delay: Optional[float] = self.timeline.next_delay()
+        if delay:
+            delay = self.context.clock.to_real(delay)
+            delay = delay if math.isfinite(delay) else None
+        if len(self.__tasks) > 0:
+            delay = BACKGROUND_POLL_INTERVAL if delay is None else min(delay, BACKGROUND_POLL_INTERVAL)
+        return delay
+
+    def request_redraw(self) -> None:
+        """타임라인 밖에서 화면이 바뀐 경우 호출해 프레임을 요청."""
+        if self.context.frames is not None:
+            self.context.frames.request()
+
     def set_user_controllable(self, controllable: bool):
         self.user_controllable = controllable
 
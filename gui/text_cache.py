@@ -0,0 +1,93 @@
+"""
+크기가 계속 바뀌는 카드 문구를 위한 텍스트 텍스처 캐시.
+pyglet의 Label은 글자 크기나 너비, 회전, 위치가 바뀔 때마다 문서 전체를 다시 배치(여러 줄이면 줄바꿈까지)하므로
+크기 계수를 몇 개의 구간(bucket)으로 나누어 구간마다 한 번만 텍스처로 그려 두고,
+구간 사이의 크기는 스프라이트 크기 조정으로 표현함.
+"""
+import math
+from collections import OrderedDict
+from typing import Final, Optional, Tuple
+
+import pyglet
+from pyglet.image import Texture
+
+from gui.offscreen import render_to_texture
+
+
+TEXT_SCALE_BUCKETS: Final[Tuple[float, ...]] = (0.5, 0.75, 1.0, 1.5, 2.0, 3.0)
+"""텍스처를 그리는 크기 계수. 실제 크기 이상인 가장 작은 구간으로 그린 뒤 줄여서 표시함."""
+TEXT_CACHE_SIZE: Final[int] = 512
+"""보관할 텍스처의 최대 수."""
+
+_TextKey = Tuple[str, str, float, Optional[float], str, bool]
+
+
+def scale_bucket(scale: float) -> float:
+    """scale을 그릴 때 사용할 구간 값을 반환."""
+    for bucket in TEXT_SCALE_BUCKETS:
+        if scale <= bucket:
+            return bucket
+    return TEXT_SCALE_BUCKETS[-1]
+
+
+class TextTextureCache:
+    """(문구, 글꼴, 크기 구간, 너비)마다 흰색으로 그린 텍스처를 보관. 색은 스프라이트 색으로 입힘.
+    오래 쓰이지 않은 텍스처부터 버리며, 스프라이트가 아직 사용 중인 텍스처는 참조가 사라질 때 해제됨."""
+    def __init__(self, window: pyglet.window.Window, max_entries: int = TEXT_CACHE_SIZE) -> None:
+        self.window: pyglet.window.Window = window
+        self.max_entries: int = max_entries
+        self.__textures: OrderedDict[_TextKey, Texture] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__textures)
+
+    def get(
+            self,
+            text: str,
+            font_name: str,
+            font_size: float,
+            width: Optional[float] = None,
+            align: str = "center",
+            multiline: bool = False
+        ) -> Texture:
+        """주어진 문구를 그린 텍스처를 반환. 없다면 새로 그림. 기준점은 텍스처 중앙."""
+        key: _TextKey = (text, font_name, font_size, width, align, multiline)
+        texture: Optional[Texture] = self.__textures.get(key)
+        if texture is not None:
+            self.hits += 1
+            self.__textures.move_to_end(key)
+            return texture
+        self.misses += 1
+        texture = self._render(text, font_name, font_size, width, align, multiline)
+        self.__textures[key] = texture
+        if len(self.__textures) > self.max_entries:
+            self.__textures.popitem(last=False)
+        return texture
+
+    def clear(self) -> None:
+        self.__textures.clear()
+
+    def _render(
+            self,
+            text: str,
+            font_name: str,
+            font_size: float,
+            width: Optional[float],
+            align: str,
+            multiline: bool
+        ) -> Texture:
+        label = pyglet.text.Label(
+            text, font_name=font_name, font_size=font_size,
+            anchor_x="left", anchor_y="bottom", align=align,
+            width=None if width is None else int(width), multiline=multiline
+        )
+        w: int = max(1, math.ceil(label.width if multiline and width is not None else label.content_width))
+        h: int = max(1, math.ceil(label.content_height))
+        try:
+            # 글자 가장자리가 어두워지지 않도록 흰색 투명으로 지운 뒤 그림.
+            return render_to_texture(self.window, w, h, label.draw, (1.0, 1.0, 1.0, 0.0))
+        finally:
+            label.delete()
+
@@ -0,0 +1,92 @@
+"""
+장면의 모든 전이(tween)와 예약된 단계를 한 곳에서 갱신하는 타임라인.
+틱마다 시간을 한 번만 읽고, 진행 중인 전이만 갱신하며, 전이 함수는 종류별로 모아 한 번에 계산함.
+진행 중인 전이와 예약된 단계가 없다면 틱은 즉시 반환됨.
+"""
+import heapq
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from gui.clock import RealClock
+from gui.transitions import Transition, ease_out_expo, ease_out_expo_many
+
+
+class Timeline:
+    """전이와 예약 단계를 관리하는 스케줄러. Scene마다 하나씩 존재하며 Scene.on_update_scene에서 tick됨."""
+    def __init__(self, clock: Optional[Callable[[], float]] = None) -> None:
+        self.clock: Callable[[], float] = clock if clock is not None else RealClock()
+        """현재 시각을 반환하는 함수. gui.clock의 Clock 객체를 사용할 수 있음."""
+        self.__tweens: Dict[int, Tuple[Transition, Callable[[Any], None], Callable[[], None] | None]] = {}
+        """id(전이) -> (전이, 값 갱신 콜백, 완료 콜백). 같은 전이를 다시 시작하면 덮어씀."""
+        self.__steps: List[Tuple[float, int, Callable[..., None], Dict[str, Any]]] = []
+        """(실행 시각, 등록 순서, 함수, 키워드 인수)의 힙."""
+        self.__step_count: int = 0
+
+    @property
+    def idle(self) -> bool:
+        """진행 중인 전이와 예약된 단계가 모두 없는지 여부."""
+        return len(self.__tweens) == 0 and len(self.__steps) == 0
+
+    def next_delay(self) -> Optional[float]:
+        """다음 틱이 필요할 때까지 남은 시간. 진행 중인 전이가 있다면 0, 예약된 단계만 있다면 가장 이른 단계까지의 시간,
+        모두 없다면 None."""
+        if len(self.__tweens) > 0:
+            return 0.0
+        if len(self.__steps) > 0:
+            return max(0.0, self.__steps[0][0] - self.clock())
+        return None
+
+    def play(
+            self,
+            transition: Transition,
+            on_update: Callable[[Any], None],
+            duration: float = -1,
+            on_complete: Callable[[], None] | None = None
+        ) -> None:
+        """전이를 현재 시각에 시작하고, 틱마다 갱신된 값으로 on_update를 호출함."""
+        transition.start(self.clock(), duration)
+        self.__tweens[id(transition)] = (transition, on_update, on_complete)
+
+    def stop(self, transition: Transition, correct_value: bool = False) -> None:
+        """진행 중인 전이를 중단. correct_value가 참이면 목표 값으로 지정."""
+        if self.__tweens.pop(id(transition), None) is not None:
+            transition.end(correct_value)
+
+    def schedule_once(self, func: Callable[..., None], delay: float = 0.0, **kwargs) -> None:
+        """delay초 후의 틱에서 func(dt, **kwargs)를 호출. pyglet.clock.schedule_once와 같은 형식."""
+        self.__step_count += 1
+        heapq.heappush(self.__steps, (self.clock() + delay, self.__step_count, func, kwargs))
+
+    def clear(self) -> None:
+        """모든 전이와 예약 단계를 제거."""
+        self.__tweens.clear()
+        self.__steps.clear()
+
+    def tick(self) -> None:
+        """예약 시각이 지난 단계를 순서대로 실행하고, 진행 중인 전이를 갱신."""
+        if len(self.__tweens) == 0 and len(self.__steps) == 0:
+            return
+        now: float = self.clock()
+        steps = self.__steps
+        while len(steps) > 0 and steps[0][0] <= now:
+            scheduled, _, func, kwargs = heapq.heappop(steps)
+            func(now - scheduled, **kwargs)
+        if len(self.__tweens) == 0:
+            return
+        entries = list(self.__tweens.values())
+        progresses: List[float] = [transition.progress(now) for transition, _, _ in entries]
+        # 대부분의 전이가 ease_out_expo를 사용하므로 한 번에 계산.
+        expo: List[int] = [i for i, (transition, _, _) in enumerate(entries) if transition.method is ease_out_expo]
+        eased: List[float] = progresses.copy()
+        for i, value in zip(expo, ease_out_expo_many([progresses[i] for i in expo])):
+            eased[i] = value
+        for i, (transition, on_update, on_complete) in enumerate(entries):
+            if progresses[i] >= 1.0:
+                self.__tweens.pop(id(transition), None)
+                transition.end()
+                on_update(transition.current_value)
+                if on_complete is not None:
+                    on_complete()
+                continue
+            if transition.method is not ease_out_expo:
+                eased[i] = transition.method(progresses[i])
+            on_update(transition.apply(eased[i]))
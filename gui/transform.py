@@ -1,6 +1,8 @@
+from typing import List, Sequence, Tuple
+
 from pyglet.math import Vec2, Mat3
 
-from gui.utils import lerp, trs_matrix
+from gui.utils import lerp, trs_matrix, trs_points
 
 class Transform2D:
     """변위, 회전, 크기를 이용해 좌표계 변환을 수행할 수 있는 객체."""
@@ -47,6 +49,10 @@ class Transform2D:
             self._calc_matrix()
             self.__dirty = False
         return self.__mat
+
+    def transform_points(self, points: Sequence[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """이 좌표계 기준의 점들을 부모 좌표계로 변환. self.matrix @ Vec3(x, y, 1)과 같음."""
+        return trs_points(self.__pos, self.__rot, self.__scale, points)
     
     @staticmethod
     def lerp(a: "Transform2D", b: "Transform2D", t: float) -> "Transform2D":
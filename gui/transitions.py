@@ -1,4 +1,4 @@
-from typing import Callable, TypeVar, Generic, Protocol, runtime_checkable
+from typing import Callable, Final, List, TypeVar, Generic, Protocol, runtime_checkable
 
 from gui.utils import clamp
 
@@ -16,14 +16,36 @@ class _SupportsLerp(Protocol):
     def lerp(a:_T_Transitionable, b:_T_Transitionable, t: float) ->_T_Transitionable:
         pass
 
-def ease_out_expo(t: float) -> float:
-    """지수함수를 이용한 ease out 전이 함수.
-    인수 및 반환값 모두 닫힌구간 [0, 1] 안에 존재."""
-    t = clamp(t)
+def _ease_out_expo_exact(t: float) -> float:
     if 1.0 - t <= 0.001:
         return 1.0
     return 1.0 - 2 ** (-10 * t)
 
+EASE_LUT_SIZE: Final[int] = 1024
+# ease_out_expo를 [0, 1]에서 균등하게 표본화한 표. 마지막 원소는 보간 시 범위를 넘지 않도록 한 번 더 넣음.
+_EASE_OUT_EXPO_LUT: Final[List[float]] = [_ease_out_expo_exact(i / EASE_LUT_SIZE) for i in range(EASE_LUT_SIZE + 1)] + [1.0]
+
+def ease_out_expo(t: float) -> float:
+    """지수함수를 이용한 ease out 전이 함수. 미리 계산한 표를 선형 보간해 계산함.
+    인수 및 반환값 모두 닫힌구간 [0, 1] 안에 존재."""
+    x: float = clamp(t) * EASE_LUT_SIZE
+    i: int = int(x)
+    a: float = _EASE_OUT_EXPO_LUT[i]
+    return a + (_EASE_OUT_EXPO_LUT[i + 1] - a) * (x - i)
+
+def ease_out_expo_many(ts: List[float]) -> List[float]:
+    """여러 진행도에 대한 ease_out_expo를 한 번에 계산. 타임라인의 일괄 계산용."""
+    lut = _EASE_OUT_EXPO_LUT
+    n: int = EASE_LUT_SIZE
+    result: List[float] = []
+    append = result.append
+    for t in ts:
+        x: float = (0.0 if t < 0.0 else 1.0 if t > 1.0 else t) * n
+        i: int = int(x)
+        a: float = lut[i]
+        append(a + (lut[i + 1] - a) * (x - i))
+    return result
+
 class Transition(Generic[_T_Transitionable]):
     """한 상태에서 다른 상태로의 전이를 수행."""
     def __init__(
@@ -63,6 +85,17 @@ class Transition(Generic[_T_Transitionable]):
         self._started_time = current_time
         self.active = True
 
+    def progress(self, current_time: float) -> float:
+        """주어진 시간에서 전이 함수를 적용하기 전의 진행도. 1 이상이면 전이가 끝난 것."""
+        if self._duration <= 0:
+            return 1.0
+        return (current_time - self._started_time) / self._duration
+
+    def apply(self, eased: float) -> _T_Transitionable:
+        """전이 함수를 적용한 진행도로 현재 값을 갱신하고 반환. Timeline이 여러 전이의 진행도를 한 번에 계산한 후 사용."""
+        self.current_value = self._lerp(self.start_value, self.destination_value, eased)
+        return self.current_value
+
     def update(self, current_time: float) -> _T_Transitionable:
         """주어진 시간을 기반으로 현재 상태를 갱신하고 값을 반환."""
         if current_time >= self._started_time + self._duration:
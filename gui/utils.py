@@ -1,5 +1,15 @@
 """GUI 모듈에서 사용하는 유용한 기능을 모아 둔 스크립트."""
+import math
+from typing import Final, List, Optional, Sequence, Tuple
+
 from pyglet.math import Vec2, Mat3
+from pyglet.text import Label
+
+
+SCALE_STEP: Final[float] = 1 / 64
+"""유효 scale_factor의 단위. 창 크기를 조금씩 바꿀 때마다 글자 크기가 바뀌지 않도록 함."""
+FONT_SIZE_STEP: Final[float] = 0.5
+"""set_label_layout이 적용하는 글자 크기의 단위(pt)."""
 
 def clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     """value를 minimum과 maximum 사이의 값으로 제한하는 함수(float)."""
@@ -22,4 +32,32 @@ def trs_matrix(t: Vec2, r: float, s: Vec2) -> Mat3:
         0.0, s.y, 0.0,
         0.0, 0.0, 1.0
     ))
-    return tr_mat @ s_mat
\ No newline at end of file
+    return tr_mat @ s_mat
+
+def trs_points(t: Vec2, r: float, s: Vec2, points: Sequence[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """trs_matrix(t, r, s) @ Vec3(x, y, 1)을 여러 점에 한 번에 적용함.
+    행렬과 Vec3를 만들지 않고 회전의 sin, cos를 한 번만 계산함."""
+    sin: float = math.sin(math.radians(r))
+    cos: float = math.cos(math.radians(r))
+    a, b = cos * s.x, sin * s.x
+    c, d = -sin * s.y, cos * s.y
+    tx, ty = t.x, t.y
+    return [(a*x + c*y + tx, b*x + d*y + ty) for x, y in points]
+
+def quantize_scale(scale: float, step: float = SCALE_STEP) -> float:
+    """scale을 step 단위로 반올림. 0 이하가 되지 않도록 최소 step을 반환."""
+    return max(round(scale / step) * step, step)
+
+def set_label_layout(label: Label, font_size: float, width: Optional[float] = None) -> bool:
+    """label의 글자 크기(FONT_SIZE_STEP 단위로 반올림)와 너비를 설정.
+    값을 바꿀 때마다 글자 배치를 다시 계산하므로 실제로 달라진 경우에만 대입하며, 다시 배치했다면 True 반환.
+    크기가 단위별로 정해지므로 창 크기를 되돌릴 때 pyglet이 캐시한 글꼴을 다시 사용함."""
+    font_size = max(round(font_size / FONT_SIZE_STEP) * FONT_SIZE_STEP, FONT_SIZE_STEP)
+    changed: bool = False
+    if label.font_size != font_size:
+        label.font_size = font_size
+        changed = True
+    if width is not None and label.width != width:
+        label.width = width
+        changed = True
+    return changed
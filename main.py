@@ -1,7 +1,10 @@
-from typing import Dict, List, Optional
+import os
+import argparse
+from typing import Any, Dict, List, Optional
 
 import pyglet
 
+from gui.frame_scheduler import FrameScheduler
 from gui.game_context import GameContext
 from gui.scenes import IntroScene, MainScene, Scene
 
@@ -9,6 +12,12 @@ FONTS_PATH: str = "data/fonts"
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Star Rewrite")
+    parser.add_argument("--engine-process", action="store_true", help="게임 로직을 별도 프로세스에서 실행")
+    args = parser.parse_args()
+    if args.engine_process:
+        # 엔진 프로세스는 시작할 때 이 스크립트를 다시 불러오므로, 그때 pyglet이 숨은 창을 만들지 않도록 함.
+        os.environ["PYGLET_SHADOW_WINDOW"] = "0"
 
     pyglet.font.add_directory(FONTS_PATH)
     pyglet.resource.path = ["data/fonts", "data/images/game_sprites", "data/images/cards", "data/images/items"]
@@ -19,14 +28,31 @@ def main() -> None:
     scenes: Dict[str, Scene] = {}
     current_scene: Optional[Scene] = None
 
-    def load_scene(name: str):
-        nonlocal scenes, current_scene
-        assert name in scenes, f"'{name}'의 이름을 가진 Scene은 등록되지 않았습니다."
+    def switch_scene(scene: Scene, prepared: Any):
+        nonlocal current_scene
         if current_scene is not None: current_scene.unload()
-        current_scene = scenes[name]
+        current_scene = scene
+        current_scene.prepared = prepared
         current_scene.load()
 
-    game_context = GameContext(on_change_scene=load_scene)
+    def load_scene(name: str):
+        assert name in scenes, f"'{name}'의 이름을 가진 Scene은 등록되지 않았습니다."
+        scene: Scene = scenes[name]
+        if current_scene is None:
+            switch_scene(scene, scene.prepare(lambda progress: None))
+            return
+        # 다음 Scene은 작업 스레드에서 준비하고, 그동안 현재 Scene이 진행률을 표시함.
+        current_scene.show_loading(0.0)
+        current_scene.run_in_background(
+            scene.prepare,
+            on_done=lambda prepared: switch_scene(scene, prepared),
+            on_progress=current_scene.show_loading
+        )
+
+    # 전이나 입력이 있을 때만 갱신하고 다시 그림.
+    game_context = GameContext(
+        on_change_scene=load_scene, frames=FrameScheduler(app_window), engine_process=args.engine_process
+    )
 
     scenes["intro"] = IntroScene(app_window, game_context)
     scenes["main"] = MainScene(app_window, game_context)
@@ -34,7 +60,8 @@ def main() -> None:
     scenes["intro"].load()
     current_scene = scenes["intro"]
     
-    pyglet.app.run()
+    # 다시 그리기는 FrameScheduler가 담당.
+    pyglet.app.run(None)
 
 
 if __name__ == '__main__':
@@ -8,8 +8,9 @@ from datetime import datetime
 from typing import IO, Dict, Final, List, Literal
 
 from core import GameManager
-from core.enums import CardType, DrawEventType, PlayerStat
-from core.obj_data_formats import CardDrawData, DrawEvent, ItemDrawData
+from core.enums import ActionType, CardType, DrawEventCoalescing, DrawEventType, PlayerStat
+from core.obj_data_formats import Action, CardDrawData, DrawEvent, DrawEventBatch, ItemDrawData
+from core.replay import REPLAY_PATH, record
 
 LEVEL_PATH: Final[str] = "data/levels"
 SAVES_PATH: Final[str] = "data/saves"
@@ -133,13 +134,15 @@ class Shell(cmd.Cmd):
             print("프로그램을 종료합니다.")
             sys.exit()
 
-        self.game = GameManager.create_from_file(
-            os.path.join(
-                LEVEL_PATH if selected < len(levels) else SAVES_PATH, option_list[selected]
-            )
+        self.game_path: str = os.path.join(
+            LEVEL_PATH if selected < len(levels) else SAVES_PATH, option_list[selected]
         )
+        self.is_new_game: bool = selected < len(levels)
+        self.game = GameManager.create_from_file(self.game_path)
         self.game_state = self.game.get_game_draw_state()
+        self.draw_events = self.game.subscribe_draw_events(take_pending=True, coalescing=DrawEventCoalescing.Batch)
         self.level_name = level_names[selected]
+        self.actions: List[Action] = []
 
         print("게임을 시작합니다.")
         self.process_draw_events()
@@ -148,7 +151,7 @@ class Shell(cmd.Cmd):
 
     def do_state(self, args):
         """현재 게임 상태를 출력합니다(디버그용)."""
-        self.game_state = self.game.get_game_draw_state()
+        self._sync_game_state()
         print(
             f"======== 게임 정보 ========\n"
             f"이야기 : {self.level_name}\t\t{self.game_state.current_turn} 턴\n"
@@ -222,7 +225,8 @@ class Shell(cmd.Cmd):
         if not (args.isdigit() and 0 <= int(args) < len(self.game_state.deck)):
             print("덱 카드의 번호 중 하나를 입력하세요.")
             return
-        self.game.buy_card(self.game_state.deck[int(args)].id)
+        if self.game.apply_action(action := Action(ActionType.BuyCard, int(args))):
+            self.actions.append(action)
         self.process_draw_events()
 
     def do_use(self, args: str):
@@ -230,122 +234,104 @@ class Shell(cmd.Cmd):
         if not (args.isdigit() and 0 <= int(args) < len(self.game_state.inventory)):
             print("아이템 번호 중 하나를 입력하세요.")
             return
-        self.game.use_item(self.game_state.inventory[int(args)].id)
+        if self.game.apply_action(action := Action(ActionType.UseItem, int(args))):
+            self.actions.append(action)
         self.process_draw_events()
 
     def do_drawevents(self, args):
         """현재 처리하지 않은 DrawEvent들을 출력합니다(디버그용)."""
         pprint(self.game.get_draw_events())
 
+    def do_record(self, args: str):
+        """지금까지의 행동을 재현 파일로 저장합니다(python -m core.replay로 검증할 수 있습니다).
+        새 게임으로 시작한 경우에만 사용할 수 있습니다."""
+        if not self.is_new_game:
+            print("저장 파일에서 이어 한 게임은 재현 파일로 저장할 수 없습니다.")
+            return
+        os.makedirs(REPLAY_PATH, exist_ok=True)
+        filename: str = args.strip() or f"replay_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
+        record(self.game_path, self.game.seed, self.actions).save(os.path.join(REPLAY_PATH, filename))
+        print(f"재현 파일을 저장했습니다: {os.path.join(REPLAY_PATH, filename)}")
+
     def do_exit(self, args):
         """프로그램을 종료합니다."""
         return True
 
     do_quit = do_exit
 
-    def _search_card_by_id(self, id: int):
-        """현재 게임 상태에서 id로 카드 데이터를 검사."""
-        for card in self.game_state.deck:
-            if card.id == id:
-                return card
-        return None
-
-    def _search_item_by_id(self, id: int):
-        """현재 게임 상태에서 id로 아이템 데이터를 검사."""
-        for item in self.game_state.inventory:
-            if item.id == id:
-                return item
-        return None
+    def _sync_game_state(self) -> None:
+        """이전 동기화 이후로 바뀐 부분만 받아 self.game_state에 반영."""
+        self.game_state.apply_delta(self.game.get_delta_since(self.game_state.version))
 
     def process_draw_events(self) -> bool:
-        """처리하지 않은 DrawEvent를 처리."""
-        events = self.game.get_draw_events()
-        while len(events) > 0:
-            event = events.pop(0)
-            if isinstance(event, DrawEvent):
-                match (event.event_type):
-                    case DrawEventType.TurnBegin:
-                        print(f"{event.current}번째 턴입니다.")
-                        self.game_state.current_turn = event.current
-                    case DrawEventType.TurnEnd:
-                        pass
-                    case DrawEventType.CardCreated:
-                        pass # DrawEvent가 아닌 (CardDrawData, int)가 들어오는 경우 처리.
-                    case DrawEventType.CardShown:
-                        card = self._search_card_by_id(event.target_id)
-                        if card is not None:
-                            card.is_front_face = bool(event.current)
-                            if event.current:
+        """처리하지 않은 DrawEvent를 처리.
+        상태는 get_delta_since로 한 번에 동기화하고, 이벤트는 메시지 출력에만 사용."""
+        if self.draw_events.overflowed:
+            # 놓친 이벤트가 있으므로 메시지는 생략하고 상태만 다시 받음.
+            self.draw_events.clear()
+            self.game_state = self.game.get_game_draw_state()
+            print("변화가 너무 많아 일부 메시지를 생략했습니다.")
+            return self.game.game_end
+        # 파괴된 카드/아이템의 이름도 출력할 수 있도록 동기화 전의 목록을 함께 보관.
+        cards: Dict[int, CardDrawData] = {card.id: card for card in self.game_state.deck}
+        items: Dict[int, ItemDrawData] = {item.id: item for item in self.game_state.inventory}
+        self._sync_game_state()
+        cards.update((card.id, card) for card in self.game_state.deck)
+        items.update((item.id, item) for item in self.game_state.inventory)
+        for entry in self.draw_events:
+            # 합쳐진 이벤트는 대상마다 하나씩 처리. 능력치 변화는 순 변화량만 출력됨.
+            for event in (entry if isinstance(entry, DrawEventBatch) else (entry,)):
+                if isinstance(event, DrawEvent):
+                    match (event.event_type):
+                        case DrawEventType.TurnBegin:
+                            print(f"{event.current}번째 턴입니다.")
+                        case DrawEventType.CardShown:
+                            card = cards.get(event.target_id)
+                            if card is not None and event.current:
                                 print(f"카드 공개됨: {card.name}")
-                    case DrawEventType.CardMoved:
-                        moved_events = [event]
-                        while len(events) > 0 and isinstance(events[0], DrawEvent) and events[0].event_type == DrawEventType.CardMoved:
-                            moved_events.append(events[0])
-                            events.pop(0)
-
-                        new_card_list: List[CardDrawData | None] = [None for _ in range(len(self.game_state.deck))]
-                        for index, card in enumerate(self.game_state.deck):
-                            for moved_event in moved_events:
-                                if card.id == moved_event.target_id:
-                                    new_card_list[moved_event.current] = card
-                                    break
-                            else:
-                                new_card_list[index] = card
-                        self.game_state.deck = [card for card in new_card_list if card is not None]
-                    case DrawEventType.CardPurchased:
-                        print(f"카드를 구매했습니다: {self._search_card_by_id(event.target_id).name}")
-                    case DrawEventType.CardDestroyed:
-                        card = self._search_card_by_id(event.target_id)
-                        if card is not None:
-                            self.game_state.deck.remove(card)
-                    case DrawEventType.CardCostChanged:
-                        card = self._search_card_by_id(event.target_id)
-                        if card is not None:
-                            delta: int = event.current - event.previous
-                            print(
-                                f"카드 비용 변화: {card.name},"
-                                f" {event.previous} -> {event.current}"
-                                f" ({'+' if delta > 0 else '-'}{abs(delta)})"
-                            )
-                            card.current_cost = event.current
-                    case DrawEventType.ItemCreated:
-                        pass # DrawEvent가 아닌 ItemDrawData가 들어오는 경우 처리.
-                    case DrawEventType.ItemUsed:
-                        print(f"아이템을 사용했습니다: {self._search_item_by_id(event.target_id).name}")
-                    case DrawEventType.ItemDestroyed:
-                        item = self._search_item_by_id(event.target_id)
-                        if item is not None:
-                            self.game_state.inventory.remove(item)
-                    case DrawEventType.PlayerWon:
-                        print("승리! 우두머리를 처치했습니다!")
-                        return True
-                    case DrawEventType.PlayerLost:
-                        print(
-                            "패배! "
-                            + ("지금의 당신이 맞서기엔 적이 너무 강했습니다." 
-                            if event.target_id == 0 else "모든 미래를 찾아보아도 대책을 찾지 못했습니다.") 
-                            + f"\n소요 턴: {self.game_state.current_turn}"
-                        )
-                        return True
-                    case DrawEventType.PlayerStatChanged:
-                        # match (PlayerStat(event.target_id)):
-                        #     case PlayerStat.Money:
-                        if (delta := event.current - event.previous) != 0:
+                        case DrawEventType.CardPurchased:
+                            print(f"카드를 구매했습니다: {cards[event.target_id].name}")
+                        case DrawEventType.CardCostChanged:
+                            card = cards.get(event.target_id)
+                            if card is not None:
+                                delta: int = event.current - event.previous
+                                print(
+                                    f"카드 비용 변화: {card.name},"
+                                    f" {event.previous} -> {event.current}"
+                                    f" ({'+' if delta > 0 else '-'}{abs(delta)})"
+                                )
+                        case DrawEventType.ItemUsed:
+                            print(f"아이템을 사용했습니다: {items[event.target_id].name}")
+                        case DrawEventType.PlayerWon:
+                            print("승리! 우두머리를 처치했습니다!")
+                            return True
+                        case DrawEventType.PlayerLost:
                             print(
-                                f"수치 변화: {PlayerStat(event.target_id).name},"
-                                f" {event.previous} -> {event.current}"
-                                f" ({'+' if delta > 0 else '-'}{abs(delta)})"
+                                "패배! "
+                                + ("지금의 당신이 맞서기엔 적이 너무 강했습니다." 
+                                if event.target_id == 0 else "모든 미래를 찾아보아도 대책을 찾지 못했습니다.") 
+                                + f"\n소요 턴: {self.game_state.current_turn}"
                             )
-            elif isinstance(event, ItemDrawData):
-                # 아이템 생성 이벤트.
-                print(f"아이템 생성됨: {event.name}")
-                self.game_state.inventory.append(event)
-            else:
-                # Tuple[CardDrawData, int]. 카드 생성 이벤트.
-                print(f"카드 생성됨: {event[0].name}")
-                self.game_state.deck.insert(event[1], event[0])
+                            return True
+                        case DrawEventType.PlayerStatChanged:
+                            # match (PlayerStat(event.target_id)):
+                            #     case PlayerStat.Money:
+                            if (delta := event.current - event.previous) != 0:
+                                print(
+                                    f"수치 변화: {PlayerStat(event.target_id).name},"
+                                    f" {event.previous} -> {event.current}"
+                                    f" ({'+' if delta > 0 else '-'}{abs(delta)})"
+                                )
+                        case _:
+                            # 카드 이동/파괴, 아이템 파괴 등은 동기화로 반영되므로 출력할 내용이 없음.
+                            pass
+                elif isinstance(event, ItemDrawData):
+                    # 아이템 생성 이벤트.
+                    print(f"아이템 생성됨: {event.name}")
+                else:
+                    # Tuple[CardDrawData, int]. 카드 생성 이벤트.
+                    print(f"카드 생성됨: {event[0].name}")
         return False
 
-
 if __name__ == "__main__":
     Shell().cmdloop()
\ No newline at end of file
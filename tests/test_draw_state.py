@@ -0,0 +1,65 @@
+import unittest
+from typing import List
+
+from core.draw_state import REMOVED_HISTORY_SIZE
+from core.enums import DrawEventType
+from core.game_manager import GameManager
+from core.obj_data_formats import DrawEvent, GameDrawDelta, GameDrawState
+
+
+LEVEL_PATH = "data/levels/tutorial_0.json"
+
+
+class DrawStateDeltaTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game_manager = GameManager.create_from_file(LEVEL_PATH, seed=0, autosave=False)
+        self.game_manager.start_game()
+        self.game_manager.get_draw_events()
+
+    def play(self, count: int) -> None:
+        for _ in range(count):
+            actions = self.game_manager.get_legal_actions()
+            if len(actions) == 0:
+                break
+            self.game_manager.apply_action(actions[0])
+
+    def assert_same_state(self, state: GameDrawState) -> None:
+        current: GameDrawState = self.game_manager.get_game_draw_state()
+        self.assertEqual([card.id for card in state.deck], [card.id for card in current.deck])
+        self.assertEqual([item.id for item in state.inventory], [item.id for item in current.inventory])
+        self.assertEqual(state.current_turn, current.current_turn)
+        self.assertEqual(state.player_money, current.player_money)
+
+    def test_delta_matches_full_state(self) -> None:
+        state: GameDrawState = self.game_manager.get_game_draw_state()
+        for _ in range(10):
+            self.play(3)
+            delta: GameDrawDelta = self.game_manager.get_delta_since(state.version)
+            self.assertFalse(delta.full)
+            state.apply_delta(delta)
+            self.assert_same_state(state)
+
+    def test_removed_history_is_capped(self) -> None:
+        state: GameDrawState = self.game_manager.get_game_draw_state()
+        tracker = self.game_manager.event_manager.draw_state_tracker
+        push = self.game_manager.event_manager.push_draw_event
+        removed: List[int] = [100_000 + i for i in range(REMOVED_HISTORY_SIZE + 10)]
+        for id in removed:
+            push(DrawEvent(DrawEventType.CardDestroyed, id, 0, 0))
+        self.assertEqual(len(tracker.removed_cards), REMOVED_HISTORY_SIZE)
+
+        # 최근 기록만으로 답할 수 있는 버전은 그대로 변경만 받음.
+        recent: GameDrawDelta = self.game_manager.get_delta_since(tracker.version - 3)
+        self.assertFalse(recent.full)
+        self.assertEqual(recent.removed_cards, removed[-3:])
+
+        # 기록이 버려진 버전은 전체 상태로 대신함.
+        delta: GameDrawDelta = self.game_manager.get_delta_since(state.version)
+        self.assertTrue(delta.full)
+        self.assertEqual(delta.removed_cards, [])
+        state.apply_delta(delta)
+        self.assert_same_state(state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+from typing import Dict, List, Tuple
+
+from core.enums import DrawEventCoalescing, DrawEventType
+from core.game_manager import GameManager
+from core.obj_data_formats import CardDrawData, DrawEvent, DrawEventBatch, ItemDrawData
+
+
+LEVEL_PATH = "data/levels/tutorial_0.json"
+
+DrawItem = DrawEvent | DrawEventBatch | Tuple[CardDrawData, int] | ItemDrawData
+
+
+def replay(items: List[DrawItem], deck: Dict[int, int]) -> List[str]:
+    """소비자처럼 이벤트를 적용해 카드 id -> 인덱스를 갱신하고, 없는 카드에 대한 이벤트를 오류로 모아 반환."""
+    errors: List[str] = []
+    for item in items:
+        if isinstance(item, tuple):
+            card, index = item
+            deck[card.id] = index
+            continue
+        if isinstance(item, ItemDrawData):
+            continue
+        for event in (item if isinstance(item, DrawEventBatch) else [item]):
+            if event.event_type == DrawEventType.CardMoved:
+                if event.target_id not in deck:
+                    errors.append(f"move before create: {event.target_id}")
+                deck[event.target_id] = event.current
+            elif event.event_type == DrawEventType.CardDestroyed:
+                if event.target_id not in deck:
+                    errors.append(f"destroy before create: {event.target_id}")
+                deck.pop(event.target_id, None)
+    return errors
+
+
+class DrawSubscriptionOrderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game_manager = GameManager.create_from_file(LEVEL_PATH, seed=0, autosave=False)
+        self.deck: List[CardDrawData] = self.game_manager.get_game_draw_state().deck
+        self.initial: Dict[int, int] = {card.id: index for index, card in enumerate(self.deck)}
+
+    def push_interleaved(self) -> None:
+        """기존 카드 이동 -> 새 카드 생성 -> 새 카드와 기존 카드 이동 -> 새 카드 파괴 -> 다시 생성과 이동."""
+        push = self.game_manager.event_manager.push_draw_event
+        card_data = self.deck[0].card_data
+        existing: int = self.deck[0].id
+        created: List[int] = [10_000, 10_001]
+
+        push(DrawEvent(DrawEventType.CardMoved, existing, 0, 1))
+        push(DrawEvent(DrawEventType.CardDestroyed, self.deck[1].id, 0, 0))
+        push((CardDrawData(created[0], card_data, 1, True), 0))
+        push(DrawEvent(DrawEventType.CardMoved, created[0], 0, 2))
+        push(DrawEvent(DrawEventType.CardMoved, existing, 1, 0))
+        push(DrawEvent(DrawEventType.CardDestroyed, created[0], 0, 0))
+        push((CardDrawData(created[1], card_data, 1, True), 3))
+        push(DrawEvent(DrawEventType.CardMoved, created[1], 3, 4))
+
+    def check_mode(self, coalescing: DrawEventCoalescing) -> None:
+        reference = self.game_manager.subscribe_draw_events(maxlen=None)
+        subscription = self.game_manager.subscribe_draw_events(maxlen=None, coalescing=coalescing)
+        self.push_interleaved()
+
+        expected: Dict[int, int] = dict(self.initial)
+        self.assertEqual(replay(list(reference), expected), [])
+        actual: Dict[int, int] = dict(self.initial)
+        self.assertEqual(replay(list(subscription), actual), [])
+        self.assertEqual(actual, expected)
+
+    def test_off(self) -> None:
+        self.check_mode(DrawEventCoalescing.Off)
+
+    def test_batch(self) -> None:
+        self.check_mode(DrawEventCoalescing.Batch)
+
+    def test_compact(self) -> None:
+        self.check_mode(DrawEventCoalescing.Compact)
+
+    def test_compact_merges_until_uncoalesced_entry(self) -> None:
+        subscription = self.game_manager.subscribe_draw_events(maxlen=None, coalescing=DrawEventCoalescing.Compact)
+        self.push_interleaved()
+        items: List[DrawItem] = list(subscription)
+        created_at: List[int] = [i for i, item in enumerate(items) if isinstance(item, tuple)]
+        self.assertEqual(len(created_at), 2)
+        # 생성 이전의 묶음에는 생성된 카드의 항목이 없어야 함.
+        for item in items[:created_at[0]]:
+            assert isinstance(item, DrawEventBatch)
+            self.assertNotIn(10_000, item.events)
+        # 같은 구간 안에서는 이동이 하나의 묶음으로 합쳐지고, 파괴된 카드의 이동은 버려짐.
+        moved: List[DrawEventBatch] = [
+            item for item in items[created_at[0]:created_at[1]]
+            if isinstance(item, DrawEventBatch) and item.event_type == DrawEventType.CardMoved
+        ]
+        self.assertEqual(len(moved), 1)
+        self.assertEqual(list(moved[0].events), [self.deck[0].id])
+
+    def test_compact_drops_unchanged(self) -> None:
+        subscription = self.game_manager.subscribe_draw_events(maxlen=None, coalescing=DrawEventCoalescing.Compact)
+        push = self.game_manager.event_manager.push_draw_event
+        card_id: int = self.deck[0].id
+        push(DrawEvent(DrawEventType.CardMoved, card_id, 0, 1))
+        push(DrawEvent(DrawEventType.TurnEnd, 0, 0, 1))
+        push(DrawEvent(DrawEventType.CardMoved, card_id, 1, 2))
+        push(DrawEvent(DrawEventType.CardMoved, card_id, 2, 1))
+        items: List[DrawItem] = list(subscription)
+        self.assertEqual(len(items), 3)
+        self.assertIsInstance(items[1], DrawEvent)
+        assert isinstance(items[2], DrawEventBatch)
+        self.assertEqual(len(items[2]), 0)
+
+
+class DrawSubscriptionOverflowTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game_manager = GameManager.create_from_file(LEVEL_PATH, seed=0, autosave=False)
+        self.card_ids: List[int] = [card.id for card in self.game_manager.get_game_draw_state().deck]
+
+    def test_overflow_keeps_newest(self) -> None:
+        for coalescing in DrawEventCoalescing:
+            with self.subTest(coalescing=coalescing):
+                subscription = self.game_manager.subscribe_draw_events(maxlen=4, coalescing=coalescing)
+                for turn in range(6):
+                    self.game_manager.event_manager.push_draw_event(DrawEvent(DrawEventType.TurnBegin, 0, turn, turn + 1))
+                self.assertTrue(subscription.overflowed)
+                self.assertEqual(len(subscription), 4)
+                items: List[DrawItem] = list(subscription)
+                self.assertEqual([item.current for item in items if isinstance(item, DrawEvent)], [3, 4, 5, 6])
+                subscription.clear()
+                self.assertFalse(subscription.overflowed)
+                subscription.close()
+
+    def test_overflow_does_not_merge_into_dropped_batch(self) -> None:
+        for coalescing in (DrawEventCoalescing.Batch, DrawEventCoalescing.Compact):
+            with self.subTest(coalescing=coalescing):
+                subscription = self.game_manager.subscribe_draw_events(maxlen=2, coalescing=coalescing)
+                push = self.game_manager.event_manager.push_draw_event
+                push(DrawEvent(DrawEventType.CardMoved, self.card_ids[0], 0, 1))
+                push(DrawEvent(DrawEventType.TurnEnd, 0, 0, 1))
+                push(DrawEvent(DrawEventType.TurnBegin, 0, 1, 2))
+                push(DrawEvent(DrawEventType.CardMoved, self.card_ids[1], 1, 0))
+                self.assertTrue(subscription.overflowed)
+                items: List[DrawItem] = list(subscription)
+                self.assertEqual(len(items), 2)
+                assert isinstance(items[1], DrawEventBatch)
+                self.assertEqual(list(items[1].events), [self.card_ids[1]])
+                subscription.close()
+
+    def test_unbounded_never_overflows(self) -> None:
+        subscription = self.game_manager.subscribe_draw_events(maxlen=None)
+        for turn in range(5000):
+            self.game_manager.event_manager.push_draw_event(DrawEvent(DrawEventType.TurnBegin, 0, turn, turn + 1))
+        self.assertFalse(subscription.overflowed)
+        self.assertEqual(len(subscription), 5000)
+
+    def test_callback_receives_every_event(self) -> None:
+        received: List[DrawItem] = []
+        self.game_manager.subscribe_draw_events(callback=received.append, maxlen=1)
+        for turn in range(3):
+            self.game_manager.event_manager.push_draw_event(DrawEvent(DrawEventType.TurnBegin, 0, turn, turn + 1))
+        self.assertEqual(len(received), 3)
+
+
+class ApplyActionsDrawEventsTest(unittest.TestCase):
+    def test_events_returned_after_take_pending(self) -> None:
+        game_manager = GameManager.create_from_file(LEVEL_PATH, seed=0, autosave=False)
+        main = game_manager.subscribe_draw_events(maxlen=None, take_pending=True)
+        list(main)
+        actions = game_manager.get_legal_actions()[:1]
+        result = game_manager.apply_actions(actions)
+        self.assertEqual(result.executed, 1)
+        self.assertGreater(len(result.draw_events), 0)
+        # 다른 구독자도 같은 이벤트를 받음.
+        self.assertEqual(list(main), result.draw_events)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+from dataclasses import dataclass
+from typing import List, Set
+
+from core.enums import CardType
+from core.game_manager import GameManager
+from core.obj_data_formats import Action
+from core.purchasable_index import PurchasableIndex
+
+
+LEVEL_PATHS = ("data/levels/tutorial_0.json", "data/levels/tutorial_1.json")
+MAX_STEPS = 200
+
+
+@dataclass
+class _CardData:
+    type: CardType
+
+
+@dataclass
+class _Card:
+    """PurchasableIndex가 읽는 속성만 가진 카드."""
+    id: int
+    card_data: _CardData
+    modified_cost: int
+    is_front_face: bool
+
+
+def brute_force(cards: List[_Card], money: int, strength: int) -> Set[int]:
+    return {
+        card.id for card in cards
+        if card.is_front_face and card.modified_cost <= (strength if card.card_data.type == CardType.Enemy else money)
+    }
+
+
+class PurchasableIndexTest(unittest.TestCase):
+    def test_random_operations_match_brute_force(self) -> None:
+        rng = random.Random(0)
+        index = PurchasableIndex()
+        cards: List[_Card] = []
+        next_id: int = 0
+        for _ in range(2000):
+            operation: int = rng.randrange(4)
+            if operation == 0 or len(cards) == 0:
+                card = _Card(next_id, _CardData(rng.choice(list(CardType))), rng.randrange(-2, 10), rng.random() < 0.5)
+                next_id += 1
+                cards.append(card)
+                index.add(card)  # type: ignore[arg-type]
+            elif operation == 1:
+                card = cards.pop(rng.randrange(len(cards)))
+                index.remove(card)  # type: ignore[arg-type]
+            else:
+                card = rng.choice(cards)
+                previous_cost, previous_front_face = card.modified_cost, card.is_front_face
+                if operation == 2:
+                    card.modified_cost = rng.randrange(-2, 10)
+                else:
+                    card.is_front_face = not card.is_front_face
+                index.update(card, previous_cost, previous_front_face)  # type: ignore[arg-type]
+            money, strength = rng.randrange(-1, 12), rng.randrange(-1, 12)
+            expected: Set[int] = brute_force(cards, money, strength)
+            ids: List[int] = index.purchasable_ids(money, strength)
+            self.assertEqual(set(ids), expected)
+            self.assertEqual(len(ids), len(expected))
+            self.assertEqual(index.any_purchasable(money, strength), len(expected) > 0)
+
+    def test_game_mask_matches_brute_force(self) -> None:
+        for path in LEVEL_PATHS:
+            for seed in range(5):
+                with self.subTest(path=path, seed=seed):
+                    game: GameManager = GameManager.create_from_file(path, seed=seed, autosave=False)
+                    game.start_game()
+                    rng = random.Random(seed)
+                    for _ in range(MAX_STEPS):
+                        cards = game.deck.get_cards()
+                        expected: Set[int] = {card.id for card in cards if game.can_buy_card(card)}
+                        self.assertEqual(set(game.purchasable_ids()), expected)
+                        _, mask = game.purchasable_mask()
+                        self.assertEqual(
+                            {card.id for position, card in enumerate(cards) if mask >> position & 1}, expected
+                        )
+                        actions: List[Action] = game.get_legal_actions()
+                        if len(actions) == 0:
+                            break
+                        game.apply_action(rng.choice(actions))
+                        game.get_draw_events()
+
+
+if __name__ == "__main__":
+    unittest.main()
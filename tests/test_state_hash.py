@@ -0,0 +1,67 @@
+import random
+import unittest
+from typing import List
+
+from core.game_manager import GameManager
+from core.obj_data_formats import Action
+
+
+LEVEL_PATHS = ("data/levels/tutorial_0.json", "data/levels/tutorial_1.json")
+MAX_STEPS = 200
+
+
+def play(game: GameManager, rng: random.Random, steps: int = MAX_STEPS) -> List[Action]:
+    """무작위로 고른 행동을 게임이 끝나거나 steps번이 될 때까지 실행하고 실행한 행동을 반환."""
+    played: List[Action] = []
+    for _ in range(steps):
+        actions: List[Action] = game.get_legal_actions()
+        if len(actions) == 0:
+            break
+        action: Action = rng.choice(actions)
+        game.apply_action(action)
+        game.get_draw_events()
+        played.append(action)
+    return played
+
+
+class StateHashTest(unittest.TestCase):
+    def test_incremental_matches_full_recompute(self) -> None:
+        for path in LEVEL_PATHS:
+            for seed in range(5):
+                with self.subTest(path=path, seed=seed):
+                    game: GameManager = GameManager.create_from_file(path, seed=seed, autosave=False)
+                    game.start_game()
+                    rng = random.Random(seed)
+                    self.assertEqual(game.state_hash(), game._compute_state_hash())
+                    for _ in range(MAX_STEPS):
+                        actions: List[Action] = game.get_legal_actions()
+                        if len(actions) == 0:
+                            break
+                        game.apply_action(rng.choice(actions))
+                        self.assertEqual(game.state_hash(), game._compute_state_hash())
+
+    def test_same_seed_and_actions_give_same_hash(self) -> None:
+        for path in LEVEL_PATHS:
+            with self.subTest(path=path):
+                first: GameManager = GameManager.create_from_file(path, seed=7, autosave=False)
+                first.start_game()
+                actions: List[Action] = play(first, random.Random(7))
+                second: GameManager = GameManager.create_from_file(path, seed=7, autosave=False)
+                second.start_game()
+                for action in actions:
+                    self.assertTrue(second.apply_action(action))
+                self.assertEqual(first.state_hash(), second.state_hash())
+
+    def test_save_tree_round_trip_keeps_hash(self) -> None:
+        game: GameManager = GameManager.create_from_file(LEVEL_PATHS[0], seed=3, autosave=False)
+        game.start_game()
+        # 게임이 끝난 뒤에는 저장하지 않으므로 진행 중인 상태로 비교.
+        play(game, random.Random(3), steps=5)
+        self.assertFalse(game.game_end)
+        restored: GameManager = GameManager.create_from_tree(game.to_save_tree(), autosave=False)
+        self.assertEqual(restored.state_hash(), game.state_hash())
+        self.assertEqual(restored.state_hash(), restored._compute_state_hash())
+
+
+if __name__ == "__main__":
+    unittest.main()